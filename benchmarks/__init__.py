@@ -0,0 +1,3 @@
+"""
+Benchmarks for the dancing links solvers.
+"""
@@ -0,0 +1,66 @@
+"""
+Compare the memory and speed of AlgorithmX against ArrayAlgorithmX.
+
+    python3 -m benchmarks.bench_array_x --queens 9 --langford 8
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from dancing_links.algorithm_x import AlgorithmX
+from dancing_links.array_x import ArrayAlgorithmX
+from dancing_links.builder import Problem
+
+from .problems import langford, queens
+
+ENGINES = {
+    "linked": lambda problem: AlgorithmX(problem.build()),
+    "array": lambda problem: ArrayAlgorithmX.from_problem(problem, compact=True),
+    "list": lambda problem: ArrayAlgorithmX.from_problem(problem, compact=False),
+}
+
+
+def measure(label, instance):
+    """
+    Report the total memory held by each engine once built (the linked
+    structure included for AlgorithmX) and the peak during construction, and
+    the time taken to enumerate every solution with each engine.  The array
+    engines are built straight from the Problem, without creating any node.
+    """
+    primary, secondary, options = instance
+    problem = Problem(options, primary, secondary)
+
+    for engine, build in ENGINES.items():
+        tracemalloc.start()
+        solver = build(problem)
+        used, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        start = time.perf_counter()
+        count = sum(1 for _ in solver.solutions())
+        elapsed = time.perf_counter() - start
+        print(
+            f"{label:>14}  {engine:>6}  solutions {count:>7}  "
+            f"memory {used / 2**20:8.3f} MiB  peak {peak / 2**20:8.3f} MiB  "
+            f"time {elapsed:8.3f} s"
+        )
+
+
+def main():
+    """
+    Run the benchmark on the requested instances.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--queens", type=int, nargs="*", default=[8, 9])
+    parser.add_argument("--langford", type=int, nargs="*", default=[7, 8])
+    args = parser.parse_args()
+
+    for n in args.queens:
+        measure(f"queens({n})", queens(n))
+
+    for n in args.langford:
+        measure(f"langford({n})", langford(n))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Compare the time taken by AlgorithmX and BitsetAlgorithmX to find the first
+solutions of exact cover instances of growing size, and report which engine
+solver_for() picks for each.
+
+    python3 -m benchmarks.bench_bitset --solutions 1000
+"""
+
+import argparse
+import time
+from itertools import islice
+
+from dancing_links.algorithm_x import AlgorithmX
+from dancing_links.bitset import BitsetAlgorithmX, solver_for
+from dancing_links.builder import Problem
+
+from . import problems
+from .suite import SUDOKU
+
+INSTANCES = {
+    "queens-8": (problems.queens, (8,)),
+    "queens-10": (problems.queens, (10,)),
+    "langford-11": (problems.langford, (11,)),
+    "sudoku": (problems.sudoku, (SUDOKU,)),
+    "pentomino-3x20": (problems.pentomino, (3, 20)),
+    "dominoes-6x6": (problems.dominoes, (6, 6)),
+    "dominoes-16x16": (problems.dominoes, (16, 16)),
+    "dominoes-22x22": (problems.dominoes, (22, 22)),
+}
+
+
+def measure(solver, solutions):
+    """
+    Return the number of solutions found, up to solutions, and the time taken.
+    """
+    start = time.perf_counter()
+    found = sum(1 for _ in islice(solver.solutions(), solutions))
+    return found, time.perf_counter() - start
+
+
+def main():
+    """
+    Run the benchmark on the requested instances.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("instances", nargs="*", help=", ".join(INSTANCES))
+    parser.add_argument("--solutions", type=int, default=100000)
+    args = parser.parse_args()
+
+    for name in args.instances:
+        if name not in INSTANCES:
+            parser.error(f"unknown instance {name!r}")
+
+    for name in args.instances or INSTANCES:
+        generator, generator_args = INSTANCES[name]
+        primary, secondary, options = generator(*generator_args)
+        problem = Problem(options, primary, secondary)
+        root = problem.build()
+        found, linked = measure(AlgorithmX(root), args.solutions)
+        _, bitset = measure(BitsetAlgorithmX(root), args.solutions)
+        chosen = type(solver_for(problem)).__name__
+        print(
+            f"{name:>16}  items {len(primary) + len(secondary):>5}  "
+            f"options {len(options):>5}  solutions {found:>7}  "
+            f"linked {linked:8.3f} s  bitset {bitset:8.3f} s  chosen {chosen}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Compare the time taken to link a problem by hand, through the insert methods,
+against Problem.build() and Problem.from_matrix().
+
+    python3 -m benchmarks.bench_builder --options 200000 --width 10
+"""
+
+import argparse
+import random
+import time
+
+from dancing_links.builder import Problem
+
+from .problems import link_x
+
+
+class CSR:
+    """
+    The fields of a SciPy CSR matrix, for use without SciPy installed.
+    """
+
+    def __init__(self, indptr, indices, shape):
+        self.indptr = indptr
+        self.indices = indices
+        self.shape = shape
+
+
+def random_options(n_options, n_items, width, seed):
+    """
+    Generate random options of the given width over n_items primary items.
+    """
+    rng = random.Random(seed)
+    items = range(n_items)
+    return [sorted(rng.sample(items, width)) for _ in range(n_options)]
+
+
+def timed(label, cells, build):
+    """
+    Run build and report the time taken per cell.
+    """
+    start = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:>12}  cells {cells:>9}  time {elapsed:8.3f} s  "
+        f"{cells / elapsed / 1e6:6.2f} M cells/s"
+    )
+
+
+def main():
+    """
+    Run the benchmark on a random matrix.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--options", type=int, default=200000)
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--width", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    options = random_options(args.options, args.items, args.width, args.seed)
+    primary = list(range(args.items))
+    cells = args.options * args.width
+    indices = [item for option in options for item in option]
+    csr = CSR(
+        list(range(0, cells + 1, args.width)), indices, (len(options), args.items)
+    )
+    rows = [row for row in range(args.options) for _ in range(args.width)]
+
+    timed("insert", cells, lambda: link_x(primary, [], options))
+    timed("options", cells, lambda: Problem(options, primary).build())
+    timed("csr", cells, lambda: Problem.from_matrix(csr).build())
+    timed("coo", cells, lambda: Problem.from_matrix((rows, indices)).build())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Compare the time taken by AlgorithmC and CellsAlgorithmC to find the first
+solutions of colored exact cover instances.
+
+    python3 -m benchmarks.bench_cells --solutions 10000
+"""
+
+import argparse
+import time
+from itertools import islice
+
+from dancing_links.algorithm_c import AlgorithmC
+from dancing_links.builder import Problem
+from dancing_links.cells import CellsAlgorithmC
+
+from . import problems
+
+INSTANCES = {
+    "word-squares-3": (problems.word_rectangles, (3, 3)),
+    "word-squares-4": (
+        problems.word_rectangles,
+        (4, 4, problems.random_words(60, 4, "abcd", seed=3)),
+    ),
+    "word-rectangles-4x5": (
+        problems.word_rectangles,
+        (
+            4,
+            5,
+            problems.random_words(50, 4, "abc") + problems.random_words(40, 5, "abc"),
+        ),
+    ),
+    "dominoes-20x20": (problems.dominoes, (20, 20)),
+    "dominoes-30x30": (problems.dominoes, (30, 30)),
+}
+
+
+def measure(solver, solutions):
+    """
+    Return the number of solutions found, up to solutions, and the time taken.
+    """
+    start = time.perf_counter()
+    found = sum(1 for _ in islice(solver.solutions(), solutions))
+    return found, time.perf_counter() - start
+
+
+def main():
+    """
+    Run the benchmark on the requested instances.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("instances", nargs="*", help=", ".join(INSTANCES))
+    parser.add_argument("--solutions", type=int, default=100000)
+    args = parser.parse_args()
+
+    for name in args.instances:
+        if name not in INSTANCES:
+            parser.error(f"unknown instance {name!r}")
+
+    for name in args.instances or INSTANCES:
+        generator, generator_args = INSTANCES[name]
+        primary, secondary, options = generator(*generator_args)
+        root = Problem(options, primary, secondary).build(AlgorithmC)
+        found, linked = measure(AlgorithmC(root), args.solutions)
+        _, cells = measure(CellsAlgorithmC(root), args.solutions)
+        print(
+            f"{name:>20}  items {len(primary) + len(secondary):>5}  "
+            f"options {len(options):>5}  solutions {found:>7}  "
+            f"linked {linked:8.3f} s  cells {cells:8.3f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Compare counting the solutions of several independent copies of an instance
+with the plain search against counting them by components.  The plain search
+explores the product of the copies' search trees, the split search the sum.
+
+    python3 -m benchmarks.bench_components --timeout 60
+"""
+
+import argparse
+import time
+
+from dancing_links.algorithm_c import AlgorithmC
+from dancing_links.algorithm_x import AlgorithmX
+from dancing_links.builder import Problem
+from dancing_links.components import count_solutions
+from dancing_links.limits import Limits
+
+from . import problems
+
+INSTANCES = {
+    "queens-6x3": (AlgorithmX, problems.queens, (6,), 3),
+    "queens-8x2": (AlgorithmX, problems.queens, (8,), 2),
+    "langford-7x3": (AlgorithmX, problems.langford, (7,), 3),
+    "word-squares-3x2": (AlgorithmC, problems.word_rectangles, (3, 3), 2),
+}
+
+
+def build(solver_class, generator, args, copies):
+    """
+    Return a solver for the copies of an instance.
+    """
+    primary, secondary, options = problems.disjoint(generator, args, copies)
+    return solver_class(Problem(options, primary, secondary).build(solver_class))
+
+
+def main():
+    """
+    Run the benchmark on the requested instances.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("instances", nargs="*", help=", ".join(INSTANCES))
+    parser.add_argument("--timeout", type=float, default=60)
+    args = parser.parse_args()
+
+    for name in args.instances:
+        if name not in INSTANCES:
+            parser.error(f"unknown instance {name!r}")
+
+    for name in args.instances or INSTANCES:
+        solver = build(*INSTANCES[name])
+        limits = Limits(timeout=args.timeout)
+        start = time.perf_counter()
+        plain = sum(1 for _ in solver.limited_solutions(limits))
+        plain_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        split = count_solutions(solver)
+        split_time = time.perf_counter() - start
+
+        print(
+            f"{name:>18}  plain {plain:>9} solutions {plain_time:8.3f} s"
+            f"{' (stopped)' if limits.reason else '          '}  "
+            f"split {split:>9} solutions {split_time:8.3f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
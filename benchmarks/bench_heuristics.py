@@ -0,0 +1,58 @@
+"""
+Compare the branching heuristics on the instances of the standard suite.  Each
+search enumerates every solution, or stops after the node budget, and the
+nodes visited are reported along with the time taken.  The solvers' own rule
+is listed as "default".
+
+    python3 -m benchmarks.bench_heuristics --max-nodes 200000
+"""
+
+import argparse
+import time
+
+from dancing_links.heuristics import HEURISTICS
+from dancing_links.limits import Limits
+
+from .suite import INSTANCES, build
+
+
+def measure(solver, max_nodes):
+    """
+    Search for every solution within the node budget and return the solutions
+    found, the nodes visited, the time taken and whether the budget ran out.
+    """
+    limits = Limits(max_nodes=max_nodes)
+    start = time.perf_counter()
+    solutions = sum(1 for _ in solver.limited_solutions(limits))
+    return solutions, limits.nodes, time.perf_counter() - start, limits.reason
+
+
+def main():
+    """
+    Run every heuristic on the requested instances.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("instances", nargs="*", help=", ".join(INSTANCES))
+    parser.add_argument("--max-nodes", type=int, default=200000)
+    args = parser.parse_args()
+
+    for name in args.instances:
+        if name not in INSTANCES:
+            parser.error(f"unknown instance {name!r}")
+
+    for name in args.instances or INSTANCES:
+        for heuristic in [None, *HEURISTICS]:
+            solver = build(*INSTANCES[name])
+            solver.heuristic = HEURISTICS.get(heuristic)
+            solutions, nodes, elapsed, reason = measure(solver, args.max_nodes)
+            print(
+                f"{name:>18}  {heuristic or 'default':>8}  "
+                f"solutions {solutions:>7}  nodes {nodes:>8}  "
+                f"time {elapsed:8.3f} s{'  (stopped)' if reason else ''}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Compare the speed of AlgorithmM choosing columns by a linear scan against
+IndexedAlgorithmM choosing them from a heap.  Each search is stopped after the
+same number of solutions and the figures are nodes per second.  The heap wins
+when many primary items stay active for much of the search (the larger domino
+boards), and loses on small instances where the scan is short.
+
+    python3 -m benchmarks.bench_indexed --solutions 10
+"""
+
+import argparse
+
+from dancing_links.algorithm_m import AlgorithmM
+from dancing_links.indexed import IndexedAlgorithmM
+
+from . import problems
+from .bench_bucket import measure
+
+INSTANCES = {
+    "scheduling-5x3x2": (problems.scheduling, (5, 3, 2)),
+    "dominoes-8x32": (problems.dominoes, (8, 32)),
+    "dominoes-32x64": (problems.dominoes, (32, 64)),
+    "dominoes-64x64": (problems.dominoes, (64, 64)),
+}
+
+
+def main():
+    """
+    Run the benchmark on the requested instances.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("instances", nargs="*", help=", ".join(INSTANCES))
+    parser.add_argument("--solutions", type=int, default=10)
+    args = parser.parse_args()
+
+    for name in args.instances:
+        if name not in INSTANCES:
+            parser.error(f"unknown instance {name!r}")
+
+    for name in args.instances or INSTANCES:
+        generator, generator_args = INSTANCES[name]
+        instance = generator(*generator_args)
+        rates = []
+
+        for engine in (AlgorithmM, IndexedAlgorithmM):
+            nodes, elapsed = measure(engine, instance, args.solutions)
+            rates.append(nodes / elapsed)
+            print(
+                f"{name:>18}  {engine.__name__:>17}  items {len(instance[0]):>5}  "
+                f"nodes {nodes:>8}  time {elapsed:8.3f} s  "
+                f"{nodes / elapsed:>9.0f} nodes/s"
+            )
+
+        print(f"{name:>18}  {'speedup':>17}  {rates[1] / rates[0]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
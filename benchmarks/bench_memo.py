@@ -0,0 +1,82 @@
+"""
+Compare counting solutions with the plain search and with the memoized
+counter, reporting the cache hit rate and the cache size at the end.  The
+counts of the larger domino boards are out of reach of the plain search, use
+--no-plain for them.
+
+    python3 -m benchmarks.bench_memo dominoes-6x6 pentomino-3x20 queens-8
+    python3 -m benchmarks.bench_memo --no-plain dominoes-12x12 dominoes-30x4
+"""
+
+import argparse
+import time
+
+from dancing_links.algorithm_c import AlgorithmC
+from dancing_links.algorithm_x import AlgorithmX
+from dancing_links.builder import Problem
+from dancing_links.heuristics import HEURISTICS
+from dancing_links.memo import MemoCounter
+
+from . import problems
+
+INSTANCES = {
+    "dominoes-6x6": (AlgorithmX, problems.dominoes, (6, 6)),
+    "dominoes-8x8": (AlgorithmX, problems.dominoes, (8, 8)),
+    "dominoes-12x12": (AlgorithmX, problems.dominoes, (12, 12)),
+    "dominoes-30x4": (AlgorithmX, problems.dominoes, (30, 4)),
+    "pentomino-3x20": (AlgorithmX, problems.pentomino, (3, 20)),
+    "queens-8": (AlgorithmX, problems.queens, (8,)),
+    "langford-8": (AlgorithmX, problems.langford, (8,)),
+    "word-squares-3": (AlgorithmC, problems.word_rectangles, (3, 3)),
+}
+
+
+def build(solver_class, generator, args, heuristic):
+    """
+    Generate an instance and return a solver for it.
+    """
+    primary, secondary, options = generator(*args)
+    problem = Problem(options, primary, secondary)
+    return solver_class(problem.build(solver_class), heuristic)
+
+
+def main():
+    """
+    Run the benchmark on the requested instances.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("instances", nargs="*", help=", ".join(INSTANCES))
+    parser.add_argument("--capacity", type=int, default=2**20)
+    parser.add_argument("--heuristic", choices=sorted(HEURISTICS))
+    parser.add_argument("--no-plain", action="store_true", help="skip the plain search")
+    args = parser.parse_args()
+
+    for name in args.instances:
+        if name not in INSTANCES:
+            parser.error(f"unknown instance {name!r}")
+
+    for name in args.instances or INSTANCES:
+        solver = build(*INSTANCES[name], args.heuristic)
+        plain = "skipped"
+
+        if not args.no_plain:
+            start = time.perf_counter()
+            solver.count_solutions()
+            plain = f"{time.perf_counter() - start:8.3f} s"
+
+        counter = MemoCounter(solver, args.capacity)
+        start = time.perf_counter()
+        solutions = counter.count()
+        elapsed = time.perf_counter() - start
+        cache = counter.cache
+        print(
+            f"{name:>16}  solutions {solutions:>14}  plain {plain}  "
+            f"memo {elapsed:8.3f} s  hit rate {cache.hit_rate():6.1%}  "
+            f"entries {len(cache):>8}  evictions {cache.evictions:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Measure how solution counting scales with the number of worker processes, for
+static splitting and for work stealing.
+
+    python3 -m benchmarks.bench_parallel --queens 11 --depth 2 --workers 1 2 4 8
+"""
+
+import argparse
+import time
+
+from dancing_links.algorithm_x import AlgorithmX
+from dancing_links.parallel import ParallelSearch, WorkStealingSearch
+
+from .problems import link_x, queens
+
+
+def main():
+    """
+    Count the solutions sequentially, then with each number of workers.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--queens", type=int, default=10)
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--workers", type=int, nargs="*", default=[1, 2, 4])
+    args = parser.parse_args()
+    instance = queens(args.queens)
+
+    start = time.perf_counter()
+    count = AlgorithmX(link_x(*instance)).count_solutions()
+    sequential = time.perf_counter() - start
+    print(f"sequential  solutions {count:>8}  time {sequential:8.3f} s")
+
+    for workers in args.workers:
+        searches = [
+            (
+                "static",
+                ParallelSearch(
+                    AlgorithmX, link_x, instance, depth=args.depth, max_workers=workers
+                ),
+            ),
+            (
+                "stealing",
+                WorkStealingSearch(AlgorithmX, link_x, instance, max_workers=workers),
+            ),
+        ]
+
+        for label, search in searches:
+            start = time.perf_counter()
+            count = search.count_solutions()
+            elapsed = time.perf_counter() - start
+            print(
+                f"{label:>8} workers {workers:>3}  solutions {count:>8}  "
+                f"time {elapsed:8.3f} s  speedup {sequential / elapsed:5.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
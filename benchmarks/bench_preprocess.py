@@ -0,0 +1,65 @@
+"""
+Measure the effect of preprocessing on the instances of the standard suite:
+the options removed or forced, the time taken to preprocess, and the time
+taken to enumerate every solution with and without preprocessing.
+
+    python3 -m benchmarks.bench_preprocess pentomino-3x20 word-squares-3
+"""
+
+import argparse
+import time
+
+from dancing_links.builder import Problem
+from dancing_links.preprocess import preprocess
+
+from .suite import INSTANCES
+
+
+def solve(solver_class, problem):
+    """
+    Return the number of solutions of problem and the time taken to find them.
+    """
+    start = time.perf_counter()
+    solver = solver_class(problem.build(solver_class))
+    return solver.count_solutions(), time.perf_counter() - start
+
+
+def reorder(instance):
+    """
+    Return the arguments of Problem for an instance from a generator.
+    """
+    primary, secondary, options, *bounds = instance
+    return (options, primary, secondary, *bounds)
+
+
+def main():
+    """
+    Run the benchmark on the requested instances.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("instances", nargs="*", help=", ".join(INSTANCES))
+    args = parser.parse_args()
+
+    for name in args.instances:
+        if name not in INSTANCES:
+            parser.error(f"unknown instance {name!r}")
+
+    for name in args.instances or INSTANCES:
+        solver_class, generator, generator_args = INSTANCES[name]
+        problem = Problem(*reorder(generator(*generator_args)))
+        start = time.perf_counter()
+        reduction = preprocess(problem)
+        elapsed = time.perf_counter() - start
+        solutions, before = solve(solver_class, problem)
+        _, after = solve(solver_class, reduction.problem)
+        print(
+            f"{name:>18}  options {len(problem.options):>6} -> {len(reduction.options):>6}  "
+            f"forced {len(reduction.forced):>4}  solutions {solutions:>6}  "
+            f"preprocess {elapsed:7.3f} s  search {before:7.3f} s -> {after:7.3f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
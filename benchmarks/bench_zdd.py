@@ -0,0 +1,69 @@
+"""
+Build the diagrams of the solution families of instances too large to
+enumerate, and measure their size and the time taken by the queries.
+
+    python3 -m benchmarks.bench_zdd dominoes-12x12 dominoes-30x4
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from dancing_links.zdd import ZDD, build_zdd
+
+from .bench_memo import INSTANCES, build
+
+
+def main():
+    """
+    Run the benchmark on the requested instances.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("instances", nargs="*", help=", ".join(INSTANCES))
+    parser.add_argument("--samples", type=int, default=1000)
+    args = parser.parse_args()
+
+    for name in args.instances:
+        if name not in INSTANCES:
+            parser.error(f"unknown instance {name!r}")
+
+    rng = random.Random(0)
+
+    for name in args.instances or INSTANCES:
+        solver = build(*INSTANCES[name], None)
+        start = time.perf_counter()
+        zdd = build_zdd(solver)
+        built = time.perf_counter() - start
+
+        start = time.perf_counter()
+        solutions = zdd.count()
+        counted = time.perf_counter() - start
+
+        start = time.perf_counter()
+
+        for _ in range(args.samples):
+            zdd.sample(rng)
+
+        sampled = (time.perf_counter() - start) / args.samples
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "family.zdd")
+            zdd.save(path)
+            size = os.path.getsize(path)
+            start = time.perf_counter()
+            ZDD.load(path)
+            loaded = time.perf_counter() - start
+
+        print(
+            f"{name:>16}  solutions {solutions:>18}  nodes {len(zdd):>8}  "
+            f"file {size:>9} B  build {built:7.3f} s  count {counted:7.3f} s  "
+            f"sample {sampled * 1e6:8.1f} us  load {loaded:7.3f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+"""
+Generators for classic exact cover instances used by the benchmarks.
+
+Each generator returns (primary, secondary, options) where options are lists of
+items, as accepted by Problem.  Generators for AlgorithmM also return the
+multiplicity bounds of the primary items.
+"""
+
+import random
+
+from dancing_links.algorithm_x import Header, Node
+
+
+def langford(n):
+    """
+    Langford pairs:  place two copies of each of 1..n in 2n slots so that the
+    copies of k are k slots apart.
+    """
+    primary = [f"v{k}" for k in range(1, n + 1)] + [f"s{j}" for j in range(2 * n)]
+    options = []
+
+    for k in range(1, n + 1):
+        for j in range(2 * n - k - 1):
+            options.append([f"v{k}", f"s{j}", f"s{j + k + 1}"])
+
+    return primary, [], options
+
+
+def queens(n):
+    """
+    N-queens:  ranks and files are primary items, diagonals are secondary.
+    """
+    primary = [f"r{i}" for i in range(n)] + [f"c{j}" for j in range(n)]
+    secondary = [f"a{k}" for k in range(2 * n - 1)] + [
+        f"b{k}" for k in range(2 * n - 1)
+    ]
+    options = []
+
+    for i in range(n):
+        for j in range(n):
+            options.append([f"r{i}", f"c{j}", f"a{i + j}", f"b{n - 1 - i + j}"])
+
+    return primary, secondary, options
+
+
+def sudoku(grid):
+    """
+    Sudoku:  every cell holds one digit, and every row, column and box holds
+    every digit once.  grid is a string of 81 digits, 0 for an empty cell.
+    """
+    primary = [f"p{i}{j}" for i in range(9) for j in range(9)]
+    primary += [
+        f"{kind}{i}{d}" for kind in "rcb" for i in range(9) for d in range(1, 10)
+    ]
+    options = []
+
+    for i in range(9):
+        for j in range(9):
+            given = int(grid[9 * i + j])
+            box = 3 * (i // 3) + j // 3
+
+            for d in range(1, 10) if given == 0 else [given]:
+                options.append([f"p{i}{j}", f"r{i}{d}", f"c{j}{d}", f"b{box}{d}"])
+
+    return primary, [], options
+
+
+def dominoes(rows, columns):
+    """
+    Domino tilings:  cover a rows x columns board with dominoes.  Every option
+    covers only two of the many cells.
+    """
+    primary = [f"{i}.{j}" for i in range(rows) for j in range(columns)]
+    options = []
+
+    for i in range(rows):
+        for j in range(columns):
+            if j + 1 < columns:
+                options.append([f"{i}.{j}", f"{i}.{j + 1}"])
+
+            if i + 1 < rows:
+                options.append([f"{i}.{j}", f"{i + 1}.{j}"])
+
+    return primary, [], options
+
+
+PENTOMINOES = {
+    "F": ((0, 1), (0, 2), (1, 0), (1, 1), (2, 1)),
+    "I": ((0, 0), (1, 0), (2, 0), (3, 0), (4, 0)),
+    "L": ((0, 0), (1, 0), (2, 0), (3, 0), (3, 1)),
+    "N": ((0, 1), (1, 1), (2, 0), (2, 1), (3, 0)),
+    "P": ((0, 0), (0, 1), (1, 0), (1, 1), (2, 0)),
+    "T": ((0, 0), (0, 1), (0, 2), (1, 1), (2, 1)),
+    "U": ((0, 0), (0, 2), (1, 0), (1, 1), (1, 2)),
+    "V": ((0, 0), (1, 0), (2, 0), (2, 1), (2, 2)),
+    "W": ((0, 0), (1, 0), (1, 1), (2, 1), (2, 2)),
+    "X": ((0, 1), (1, 0), (1, 1), (1, 2), (2, 1)),
+    "Y": ((0, 1), (1, 0), (1, 1), (2, 1), (3, 1)),
+    "Z": ((0, 0), (0, 1), (1, 1), (2, 1), (2, 2)),
+}
+
+
+def pentomino(rows, columns):
+    """
+    Pentominoes:  place the twelve pentominoes, in any orientation, to fill a
+    rows x columns board (of 60 cells).
+    """
+    primary = list(PENTOMINOES)
+    primary += [f"{i}.{j}" for i in range(rows) for j in range(columns)]
+    options = []
+
+    for name, cells in PENTOMINOES.items():
+        shapes = set()
+
+        for _ in range(2):
+            for _ in range(4):
+                cells = tuple((j, -i) for i, j in cells)
+                low_i = min(i for i, _ in cells)
+                low_j = min(j for _, j in cells)
+                shapes.add(tuple(sorted((i - low_i, j - low_j) for i, j in cells)))
+
+            cells = tuple((i, -j) for i, j in cells)
+
+        for shape in sorted(shapes):
+            height = 1 + max(i for i, _ in shape)
+            width = 1 + max(j for _, j in shape)
+
+            for top in range(rows - height + 1):
+                for left in range(columns - width + 1):
+                    options.append([name] + [f"{top + i}.{left + j}" for i, j in shape])
+
+    return primary, [], options
+
+
+WORDS = (
+    "ace act ado age ago aid ail aim air ale all and ant ape arc are ark arm "
+    "art ash ate awe bad bag ban bar bat bed bee beg bet bid big bit boa bog "
+    "bow box boy bud bug bus but cab can cap car cat cod cog con cot cow cry "
+    "cub cue cut dab den dew did die dig dim din dip doe dog don dot dry due "
+    "dug ear eat ebb eel egg ego elf elk elm end era eve ewe eye"
+).split()
+
+
+def word_rectangles(rows, columns, words=WORDS):
+    """
+    Word rectangles (AlgorithmC):  fill a rows x columns grid so every row and
+    every column spells a word.  Each row and column is a primary item, each
+    cell a secondary item colored by its letter.
+    """
+    primary = [f"r{i}" for i in range(rows)] + [f"c{j}" for j in range(columns)]
+    secondary = [f"{i}.{j}" for i in range(rows) for j in range(columns)]
+    options = []
+
+    for i in range(rows):
+        for word in words:
+            if len(word) == columns:
+                options.append(
+                    [f"r{i}"] + [(f"{i}.{j}", word[j]) for j in range(columns)]
+                )
+
+    for j in range(columns):
+        for word in words:
+            if len(word) == rows:
+                options.append([f"c{j}"] + [(f"{i}.{j}", word[i]) for i in range(rows)])
+
+    return primary, secondary, options
+
+
+def random_words(count, length, alphabet, seed=0):
+    """
+    A sorted list of count distinct random words of the given length over
+    alphabet, for word_rectangles() instances denser than the English ones.
+    """
+    rng = random.Random(seed)
+    words = set()
+
+    while len(words) < count:
+        words.add("".join(rng.choice(alphabet) for _ in range(length)))
+
+    return sorted(words)
+
+
+def scheduling(workers, days, shifts, staff=(1, 2), load=(2, 3)):
+    """
+    Scheduling (AlgorithmM):  staff every shift of every day with between
+    staff[0] and staff[1] workers, give every worker between load[0] and
+    load[1] shifts, and never give a worker two shifts on the same day.
+    """
+    slots = [f"d{d}s{s}" for d in range(days) for s in range(shifts)]
+    people = [f"w{w}" for w in range(workers)]
+    secondary = [f"w{w}d{d}" for w in range(workers) for d in range(days)]
+    bounds = {slot: staff for slot in slots}
+    bounds.update({person: load for person in people})
+    options = []
+
+    for w in range(workers):
+        for d in range(days):
+            for s in range(shifts):
+                options.append([f"d{d}s{s}", f"w{w}", f"w{w}d{d}"])
+
+    return slots + people, secondary, options, bounds
+
+
+def disjoint(generator, args, copies):
+    """
+    Several independent copies of an instance, with the items of copy k
+    suffixed by /k.
+    """
+    primary, secondary, options = [], [], []
+
+    for copy in range(copies):
+
+        def rename(item, copy=copy):
+            if isinstance(item, tuple):
+                return (f"{item[0]}/{copy}", item[1])
+
+            return f"{item}/{copy}"
+
+        instance = generator(*args)
+        primary += [rename(item) for item in instance[0]]
+        secondary += [rename(item) for item in instance[1]]
+        options += [[rename(item) for item in option] for option in instance[2]]
+
+    return primary, secondary, options
+
+
+def link_x(primary, secondary, options):
+    """
+    Build the linked structure accepted by AlgorithmX.
+    """
+    root = Header(name="root")
+    headers = {}
+
+    for name in primary:
+        headers[name] = Header(name=name)
+        root.insert_left(headers[name])
+
+    for name in secondary:
+        headers[name] = Header(name=name)
+
+    for option in options:
+        nodes = []
+
+        for name in option:
+            node = Node(
+                name=" ".join(map(str, option)), header=headers[name], row=option
+            )
+            headers[name].insert_up(node)
+            nodes.append(node)
+
+        for node in nodes[1:]:
+            nodes[0].insert_left(node)
+
+    return root
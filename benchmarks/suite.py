@@ -0,0 +1,180 @@
+"""
+Standard benchmark suite for the three solvers.
+
+Every instance is built with Problem.build() and all of its solutions are
+enumerated with search().  The results (wall time, solutions and nodes per
+second, peak memory) are printed and can be written as JSON.  With --compare,
+the results are checked against a saved baseline and the suite exits with
+status 1 if an instance got slower or used more memory by more than the
+tolerance, or if its solution or node counts changed.
+
+    python3 -m benchmarks.suite --output baseline.json
+    python3 -m benchmarks.suite --compare baseline.json --tolerance 0.1
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from dancing_links.algorithm_c import AlgorithmC
+from dancing_links.algorithm_m import AlgorithmM
+from dancing_links.algorithm_x import AlgorithmX
+from dancing_links.builder import Problem
+
+from . import problems
+
+SUDOKU = (
+    "530070000600195000098000060800060003400800001700020006060000280000419005000080079"
+)
+
+INSTANCES = {
+    "queens-8": (AlgorithmX, problems.queens, (8,)),
+    "sudoku": (AlgorithmX, problems.sudoku, (SUDOKU,)),
+    "pentomino-3x20": (AlgorithmX, problems.pentomino, (3, 20)),
+    "langford-8": (AlgorithmX, problems.langford, (8,)),
+    "word-squares-3": (AlgorithmC, problems.word_rectangles, (3, 3)),
+    "scheduling-5x3x2": (AlgorithmM, problems.scheduling, (5, 3, 2)),
+}
+
+
+class NodeCounter:
+    """
+    Search hook counting the nodes visited.
+    """
+
+    def __init__(self):
+        self.nodes = 0
+
+    def __call__(self, levels):
+        self.nodes += 1
+
+
+def build(solver_class, generator, args):
+    """
+    Generate an instance and return a solver for it.
+    """
+    primary, secondary, options, *bounds = generator(*args)
+    return solver_class(
+        Problem(options, primary, secondary, *bounds).build(solver_class)
+    )
+
+
+def run(solver_class, generator, args, repeat=1):
+    """
+    Benchmark one instance, keeping the fastest of repeat runs, then measure
+    the peak memory of building and solving it in a separate run (tracing
+    allocations slows the search down).
+    """
+    runs = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        solver = build(solver_class, generator, args)
+        built = time.perf_counter()
+        counter = NodeCounter()
+        solutions = sum(1 for _ in solver.search(hook=counter))
+        finished = time.perf_counter()
+        runs.append(
+            {
+                "solver": solver_class.__name__,
+                "solutions": solutions,
+                "nodes": counter.nodes,
+                "build_seconds": built - start,
+                "seconds": finished - built,
+            }
+        )
+
+    best = min(runs, key=lambda result: result["seconds"])
+
+    tracemalloc.start()
+    solver = build(solver_class, generator, args)
+    sum(1 for _ in solver.search())
+    best["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    best["solutions_per_second"] = best["solutions"] / best["seconds"]
+    best["nodes_per_second"] = best["nodes"] / best["seconds"]
+    return best
+
+
+def compare(results, baseline, tolerance):
+    """
+    Return a description of every regression of results against baseline.
+    """
+    regressions = []
+
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+
+        base = baseline[name]
+
+        for key in ("solutions", "nodes"):
+            if result[key] != base[key]:
+                regressions.append(f"{name}: {key} {base[key]} -> {result[key]}")
+
+        for key in ("seconds", "peak_bytes"):
+            if result[key] > base[key] * (1 + tolerance):
+                regressions.append(
+                    f"{name}: {key} {base[key]:.6g} -> {result[key]:.6g} "
+                    f"({result[key] / base[key] - 1:+.1%})"
+                )
+
+    return regressions
+
+
+def main():
+    """
+    Run the suite, then save or compare the results.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("instances", nargs="*", help=", ".join(INSTANCES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    args = parser.parse_args()
+    results = {}
+
+    for name in args.instances:
+        if name not in INSTANCES:
+            parser.error(f"unknown instance {name!r}")
+
+    for name in args.instances or INSTANCES:
+        result = run(*INSTANCES[name], repeat=args.repeat)
+        results[name] = result
+        print(
+            f"{name:>18}  {result['solver']:>10}  solutions {result['solutions']:>7}  "
+            f"nodes {result['nodes']:>8}  time {result['seconds']:8.3f} s  "
+            f"{result['nodes_per_second']:>9.0f} nodes/s  "
+            f"peak {result['peak_bytes'] / 2**20:7.2f} MiB"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as stream:
+            json.dump(
+                {"python": platform.python_version(), "results": results},
+                stream,
+                indent=2,
+            )
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as stream:
+            baseline = json.load(stream)["results"]
+
+        regressions = compare(results, baseline, args.tolerance)
+
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,9 @@
 Algorithm X constraint/exact-cover solver.
 """
 
+from .heuristics import resolve
+from .search import IterativeSearch, Level
+
 
 class Node:
     """
@@ -83,14 +86,17 @@ class Header(Node):
         self.multiplicity += 1
 
 
-class AlgorithmC:
+class AlgorithmC(IterativeSearch):
     """
     Algorithm C solution generator class.
     """
 
-    def __init__(self, root):
+    def __init__(self, root, heuristic=None):
         self.root = root
         self.solution_stack = []
+        self.level_stack = []
+        self.random = None
+        self.heuristic = resolve(heuristic)
 
     def print_headers(self):
         node = self.root.r
@@ -99,23 +105,35 @@ class AlgorithmC:
             print(node)
             node = node.r
 
-    def solutions(self):
+    def solutions(self, assume=()):
         """
-        Generate solutions to the exact cover problem.
+        Generate solutions to the exact cover problem.  If the generator is
+        closed (or garbage collected) before it is exhausted, the structure is
+        restored along the current path.  The options containing the nodes in
+        assume are included in every solution (see include()).
         """
+        if assume:
+            with self.assuming(assume):
+                yield from self.solutions()
+
+            return
+
         if self.solved():
             yield self.get_solution()
             return
 
         min_column = self.get_min_column()
         self.cover(min_column)
-        row = min_column.d
 
-        while row != min_column:
-            yield from self.enumerate_row(row)
-            row = row.d
+        try:
+            row = min_column.d
+
+            while row != min_column:
+                yield from self.enumerate_row(row)
+                row = row.d
 
-        self.uncover(min_column)
+        finally:
+            self.uncover(min_column)
 
     def enumerate_row(self, row):
         """
@@ -124,9 +142,55 @@ class AlgorithmC:
         """
         self.solution_stack.append(row)
         self.commit_columns(row)
-        yield from self.solutions()
-        self.uncommit_columns(row)
-        self.solution_stack.pop()
+
+        try:
+            yield from self.solutions()
+
+        finally:
+            self.uncommit_columns(row)
+            self.solution_stack.pop()
+
+    def open_level(self):
+        """
+        Choose the column with the least possible choices and cover it.
+        """
+        min_column = self.get_min_column()
+        self.cover(min_column)
+        return Level(min_column, total=min_column.multiplicity)
+
+    def next_branch(self, level):
+        """
+        Remove the row currently assumed at level from the solution and assume
+        the next row of the column instead.
+        """
+        if level.row is None:
+            row = level.column.d
+
+        else:
+            self.uncommit_columns(level.row)
+            self.solution_stack.pop()
+            row = level.row.d
+
+        if row == level.column:
+            self.uncover(level.column)
+            return False
+
+        level.row = row
+        level.index += 1
+        self.solution_stack.append(row)
+        self.commit_columns(row)
+        return True
+
+    def close_level(self, level):
+        """
+        Remove the row currently assumed at level from the solution and
+        uncover the column.
+        """
+        if level.row is not None:
+            self.uncommit_columns(level.row)
+            self.solution_stack.pop()
+
+        self.uncover(level.column)
 
     def commit_columns(self, row):
         """
@@ -239,16 +303,50 @@ class AlgorithmC:
 
     def get_min_column(self):
         """
-        Find the column with the least possible choices.
+        Find the column with the least possible choices.  If a heuristic is
+        set it chooses the column instead.  Otherwise, if a random number
+        generator is set, ties are broken at random.
+        """
+        if self.heuristic is not None:
+            return self.heuristic(self)
+
+        if self.random is not None:
+            return self.get_random_min_column()
+
+        min_column = None
+        min_multiplicity = 2**64
+        column = self.root.r
+
+        while column != self.root:
+            if column.multiplicity < min_multiplicity:
+                min_column = column
+                min_multiplicity = column.multiplicity
+
+            column = column.r
+
+        return min_column
+
+    def get_random_min_column(self):
+        """
+        Find a column with the least possible choices, chosen uniformly at
+        random among the columns tied for the least.
         """
         min_column = None
         min_multiplicity = 2**64
+        ties = 0
         column = self.root.r
 
         while column != self.root:
             if column.multiplicity < min_multiplicity:
                 min_column = column
                 min_multiplicity = column.multiplicity
+                ties = 1
+
+            elif column.multiplicity == min_multiplicity:
+                ties += 1
+
+                if self.random.randrange(ties) == 0:
+                    min_column = column
 
             column = column.r
 
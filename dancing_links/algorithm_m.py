@@ -2,6 +2,9 @@
 Algorithm M constraint/exact-cover solver.
 """
 
+from .heuristics import remaining, resolve
+from .search import IterativeSearch, Level, option_nodes
+
 
 class Node:
     """
@@ -108,14 +111,17 @@ class Header(Node):
         )
 
 
-class AlgorithmM:
+class AlgorithmM(IterativeSearch):
     """
     Algorithm M solution generator class.
     """
 
-    def __init__(self, root):
+    def __init__(self, root, heuristic=None):
         self.root = root
         self.solution_stack = []
+        self.level_stack = []
+        self.random = None
+        self.heuristic = resolve(heuristic)
 
     def print_headers(self):
         """
@@ -127,10 +133,20 @@ class AlgorithmM:
             print(node)
             node = node.r
 
-    def solutions(self):
+    def solutions(self, assume=()):
         """
-        Generate solutions to the multiple cover with color (MCC) problem.
+        Generate solutions to the multiple cover with color (MCC) problem.  If
+        the generator is closed (or garbage collected) before it is exhausted,
+        the structure is restored along the current path.  The options
+        containing the nodes in assume are included in every solution (see
+        include()).
         """
+        if assume:
+            with self.assuming(assume):
+                yield from self.solutions()
+
+            return
+
         if self.solved():
             yield self.get_solution()
             return
@@ -146,11 +162,13 @@ class AlgorithmM:
         if min_column.bound == 0:
             self.cover(min_column)
 
-        yield from self.enumerate_rows(min_column)
-        yield from self.min_multiplicity_generator(min_column)
+        try:
+            yield from self.enumerate_rows(min_column)
+            yield from self.min_multiplicity_generator(min_column)
 
-        self.possibly_untweak(first_tweak)
-        min_column.bound += 1
+        finally:
+            self.possibly_untweak(first_tweak)
+            min_column.bound += 1
 
     def enumerate_rows(self, min_column):
         """
@@ -168,9 +186,18 @@ class AlgorithmM:
         eliminate this column (to satisfy it) and continue solving.
         """
         if min_column.bound < min_column.slack:
+            if min_column.bound == 0:
+                # The column was already covered when its bound reached 0.
+                yield from self.solutions()
+                return
+
             min_column.unlink_horizontal()
-            yield from self.solutions()
-            min_column.relink_horizontal()
+
+            try:
+                yield from self.solutions()
+
+            finally:
+                min_column.relink_horizontal()
 
     def tweak(self, row, hide=True):
         """
@@ -243,8 +270,12 @@ class AlgorithmM:
         if (header.bound == 0) and (header.slack == 0):
             self.uncover(header)
 
+        elif header.bound == 0:
+            self.untweak(first_tweak, unhide=False)
+            self.uncover(header)
+
         else:
-            self.untweak(first_tweak, unhide=header.bound != 0)
+            self.untweak(first_tweak)
 
     def include_row(self, row):
         """
@@ -253,9 +284,150 @@ class AlgorithmM:
         """
         self.solution_stack.append(row)
         self.commit_columns(row)
-        yield from self.solutions()
-        self.uncommit_columns(row)
+
+        try:
+            yield from self.solutions()
+
+        finally:
+            self.uncommit_columns(row)
+            self.solution_stack.pop()
+
+    def include(self, row):
+        """
+        Assume an option, given as for IterativeSearch.include(), is in the
+        solution:  remove it from every column, then commit its columns as if
+        it had been chosen.  Return a node of the option, to pass to
+        exclude().  Raise ValueError if the option is no longer available,
+        e.g. because it conflicts with an option already assumed, or if it has
+        no primary item.
+        """
+        nodes = option_nodes(self.find_option(row))
+
+        for node in nodes:
+            if node.u.d is not node or (node.header.primary and node.header.bound == 0):
+                raise ValueError(f"option {row!r} is not available")
+
+        if not any(node.header.primary for node in nodes):
+            raise ValueError(f"option {row!r} has no primary item")
+
+        for node in nodes:
+            node.unlink_vertical()
+            node.header.len -= 1
+
+        for node in nodes:
+            if node.header.primary:
+                node.header.bound -= 1
+
+                if node.header.bound == 0:
+                    self.cover(node)
+
+            else:
+                self.commit(node)
+
+        self.solution_stack.append(nodes[0])
+        return nodes[0]
+
+    def exclude(self, anchor):
+        """
+        Revert the effects of include().
+        """
         self.solution_stack.pop()
+        nodes = option_nodes(anchor)
+
+        for node in reversed(nodes):
+            if node.header.primary:
+                if node.header.bound == 0:
+                    self.uncover(node)
+
+                node.header.bound += 1
+
+            else:
+                self.uncommit(node)
+
+        for node in reversed(nodes):
+            node.relink_vertical()
+            node.header.len += 1
+
+    def open_level(self):
+        """
+        Choose the column with the smallest branching degree and prepare to
+        branch on it (step 'M4').
+        """
+        min_column, branching_degree = self.get_branching_degree()
+
+        if branching_degree == 0:
+            return None
+
+        level = Level(min_column, first_tweak=min_column.d, total=branching_degree)
+        min_column.bound -= 1
+
+        if min_column.bound == 0:
+            self.cover(min_column)
+
+        return level
+
+    def next_branch(self, level):
+        """
+        Undo the row currently tried at level and try the next one.  Once the
+        rows are exhausted, the column itself is tried:  the level's row is set
+        to the column while it is set aside to satisfy its minimum
+        multiplicity.
+        """
+        min_column = level.column
+
+        if level.row is None:
+            row = min_column.d
+
+        elif level.row == min_column:
+            if min_column.bound != 0:
+                min_column.relink_horizontal()
+
+            self.possibly_untweak(level.first_tweak)
+            min_column.bound += 1
+            return False
+
+        else:
+            self.uncommit_columns(level.row)
+            self.solution_stack.pop()
+            row = level.row.d
+
+        if row != min_column and self.possibly_tweak(row):
+            level.row = row
+            level.index += 1
+            self.solution_stack.append(row)
+            self.commit_columns(row)
+            return True
+
+        if min_column.bound < min_column.slack:
+            level.row = min_column
+            level.index += 1
+
+            if min_column.bound != 0:
+                min_column.unlink_horizontal()
+
+            return True
+
+        self.possibly_untweak(level.first_tweak)
+        min_column.bound += 1
+        return False
+
+    def close_level(self, level):
+        """
+        Undo the row or minimum multiplicity branch currently tried at level,
+        then restore the column (step 'M8').
+        """
+        min_column = level.column
+
+        if level.row == min_column:
+            if min_column.bound != 0:
+                min_column.relink_horizontal()
+
+        elif level.row is not None:
+            self.uncommit_columns(level.row)
+            self.solution_stack.pop()
+
+        self.possibly_untweak(level.first_tweak)
+        min_column.bound += 1
 
     def commit_columns(self, row):
         """
@@ -395,8 +567,17 @@ class AlgorithmM:
     def get_branching_degree(self):
         """
         Find the column with the smallest branching degree.  This metric is
-        specified in the answer to exercise 166 in TAOCP 4b, page 463.
+        specified in the answer to exercise 166 in TAOCP 4b, page 463.  If a
+        heuristic is set it chooses the column instead.  Otherwise, if a
+        random number generator is set, ties are broken at random.
         """
+        if self.heuristic is not None:
+            column = self.heuristic(self)
+            return column, remaining(column)
+
+        if self.random is not None:
+            return self.get_random_branching_degree()
+
         min_column = None
         min_monus = 2**64
         column = self.root.r
@@ -423,6 +604,42 @@ class AlgorithmM:
 
         return min_column, min_monus
 
+    def get_random_branching_degree(self):
+        """
+        Find a column with the smallest branching degree, chosen uniformly at
+        random among the columns tied for the smallest (branching degree,
+        slack, -len).
+        """
+        min_column = None
+        min_key = None
+        ties = 0
+        column = self.root.r
+
+        while column != self.root:
+            key = (
+                (column.len + 1) - (column.bound - column.slack),
+                column.slack,
+                -column.len,
+            )
+
+            if min_key is None or key < min_key:
+                min_column = column
+                min_key = key
+                ties = 1
+
+            elif key == min_key:
+                ties += 1
+
+                if self.random.randrange(ties) == 0:
+                    min_column = column
+
+            if min_key[0] == 0:
+                break
+
+            column = column.r
+
+        return min_column, min_key[0]
+
     def solved(self):
         """
         Check if the problem is solved.
@@ -2,6 +2,9 @@
 Algorithm X constraint/exact-cover solver.
 """
 
+from .heuristics import resolve
+from .search import IterativeSearch, Level
+
 
 class Node:
     """
@@ -12,6 +15,7 @@ class Node:
         self,
         header=None,
         name=None,
+        row=None,
     ):
         self.u = self
         self.d = self
@@ -19,6 +23,7 @@ class Node:
         self.r = self
         self.header = header
         self.name = name
+        self.row = row
 
     def __repr__(self):
         return self.name
@@ -85,32 +90,47 @@ class Header(Node):
         self.multiplicity += 1
 
 
-class AlgorithmX:
+class AlgorithmX(IterativeSearch):
     """
     Algorithm X solution generator class.
     """
 
-    def __init__(self, root):
+    def __init__(self, root, heuristic=None):
         self.root = root
         self.solution_stack = []
+        self.level_stack = []
+        self.random = None
+        self.heuristic = resolve(heuristic)
 
-    def solutions(self):
+    def solutions(self, assume=()):
         """
-        Generate solutions to the exact cover problem.
+        Generate solutions to the exact cover problem.  If the generator is
+        closed (or garbage collected) before it is exhausted, the structure is
+        restored along the current path.  The options containing the nodes in
+        assume are included in every solution (see include()).
         """
+        if assume:
+            with self.assuming(assume):
+                yield from self.solutions()
+
+            return
+
         if self.solved():
             yield self.get_solution()
             return
 
         min_column = self.get_min_column()
         self.cover(min_column)
-        row = min_column.d
 
-        while row != min_column:
-            yield from self.enumerate_row(row)
-            row = row.d
+        try:
+            row = min_column.d
+
+            while row != min_column:
+                yield from self.enumerate_row(row)
+                row = row.d
 
-        self.uncover(min_column)
+        finally:
+            self.uncover(min_column)
 
     def enumerate_row(self, row):
         """
@@ -119,9 +139,55 @@ class AlgorithmX:
         """
         self.solution_stack.append(row)
         self.cover_columns(row)
-        yield from self.solutions()
-        self.uncover_columns(row)
-        self.solution_stack.pop()
+
+        try:
+            yield from self.solutions()
+
+        finally:
+            self.uncover_columns(row)
+            self.solution_stack.pop()
+
+    def open_level(self):
+        """
+        Choose the column with the least possible choices and cover it.
+        """
+        min_column = self.get_min_column()
+        self.cover(min_column)
+        return Level(min_column, total=min_column.multiplicity)
+
+    def next_branch(self, level):
+        """
+        Remove the row currently assumed at level from the solution and assume
+        the next row of the column instead.
+        """
+        if level.row is None:
+            row = level.column.d
+
+        else:
+            self.uncover_columns(level.row)
+            self.solution_stack.pop()
+            row = level.row.d
+
+        if row == level.column:
+            self.uncover(level.column)
+            return False
+
+        level.row = row
+        level.index += 1
+        self.solution_stack.append(row)
+        self.cover_columns(row)
+        return True
+
+    def close_level(self, level):
+        """
+        Remove the row currently assumed at level from the solution and
+        uncover the column.
+        """
+        if level.row is not None:
+            self.uncover_columns(level.row)
+            self.solution_stack.pop()
+
+        self.uncover(level.column)
 
     def cover_columns(self, row):
         """
@@ -143,6 +209,19 @@ class AlgorithmX:
             self.uncover(column)
             column = column.l
 
+    def commit_columns(self, row):
+        """
+        Cover the columns appearing in row, as AlgorithmC commits them:
+        without colors the two are the same.
+        """
+        self.cover_columns(row)
+
+    def uncommit_columns(self, row):
+        """
+        Uncover the columns appearing in row.
+        """
+        self.uncover_columns(row)
+
     def cover(self, column):
         """
         Cover a column by removing it's header and hiding every row within the
@@ -196,8 +275,16 @@ class AlgorithmX:
 
     def get_min_column(self):
         """
-        Find the column with the least possible choices.
+        Find the column with the least possible choices.  If a heuristic is
+        set it chooses the column instead.  Otherwise, if a random number
+        generator is set, ties are broken at random.
         """
+        if self.heuristic is not None:
+            return self.heuristic(self)
+
+        if self.random is not None:
+            return self.get_random_min_column()
+
         min_column = None
         min_multiplicity = 2**64
         column = self.root.r
@@ -211,6 +298,32 @@ class AlgorithmX:
 
         return min_column
 
+    def get_random_min_column(self):
+        """
+        Find a column with the least possible choices, chosen uniformly at
+        random among the columns tied for the least.
+        """
+        min_column = None
+        min_multiplicity = 2**64
+        ties = 0
+        column = self.root.r
+
+        while column != self.root:
+            if column.multiplicity < min_multiplicity:
+                min_column = column
+                min_multiplicity = column.multiplicity
+                ties = 1
+
+            elif column.multiplicity == min_multiplicity:
+                ties += 1
+
+                if self.random.randrange(ties) == 0:
+                    min_column = column
+
+            column = column.r
+
+        return min_column
+
     def solved(self):
         """
         Check if the problem is solved.
@@ -0,0 +1,485 @@
+"""
+Array-backed Algorithm M constraint/exact-cover solver.
+
+The links use the same layout as ArrayAlgorithmX.  Algorithm M additionally
+keeps parallel arrays for the item bounds, slacks and primary flags, and for
+the node colors.  The length of an item is kept in the TOP field of its header
+node, as in DLX1.
+"""
+
+from itertools import repeat
+
+from .array_x import ArrayAlgorithmX, number_options
+from .builder import check_bounds
+
+SKIP = -1
+
+
+class ArrayAlgorithmM(ArrayAlgorithmX):
+    """
+    Algorithm M solution generator backed by flat integer arrays.
+
+    The solver is built from the same linked structure accepted by AlgorithmM,
+    or with from_problem() from a Problem, and yields the same solutions in
+    the same order:  the rows of the chosen options.  No node is kept, so the
+    linked structure can be freed once the solver is built.
+    """
+
+    def __init__(self, root=None, compact=True):
+        self.bound = None
+        self.slack = None
+        self.primary = None
+        self.color = None
+        super().__init__(root, compact)
+
+    def load(self, root):
+        """
+        Convert the linked structure rooted at root into the array layout.
+        """
+        headers, rows = self.load_linked(root)
+        self.rows = [row[0].row for row in rows]
+        self.bound = self.storage([0] + [header.bound for header in headers] + [0])
+        self.slack = self.storage([0] + [header.slack for header in headers] + [0])
+        self.primary = self.storage(
+            [0] + [int(header.primary) for header in headers] + [0]
+        )
+        self.color = self.storage(repeat(0, len(headers) + 2))
+
+        for row in rows:
+            self.color.extend(node.color for node in row)
+            self.color.append(0)
+
+    def load_problem(self, problem):
+        """
+        Lay out problem, whose rows are the option indices.
+        """
+        _, options, colors = number_options(problem)
+        n_primary = len(problem.primary)
+        n_secondary = len(problem.secondary)
+        self.layout(n_primary, n_secondary, options)
+        self.rows = range(len(options))
+        bounds = [
+            check_bounds(name, problem.bounds.get(name)) for name in problem.primary
+        ]
+        self.bound = self.storage(
+            [0] + [upper for _, upper in bounds] + [1] * n_secondary + [0]
+        )
+        self.slack = self.storage(
+            [0] + [upper - lower for lower, upper in bounds] + [0] * n_secondary + [0]
+        )
+        self.primary = self.storage([0] + [1] * n_primary + [0] * (n_secondary + 1))
+        self.color = self.storage(repeat(0, n_primary + n_secondary + 2))
+        start = 0
+
+        for option in options:
+            self.color.extend(colors[start : start + len(option)])
+            self.color.append(0)
+            start += len(option)
+
+    def solutions(self):
+        """
+        Generate solutions to the multiple cover with color (MCC) problem.
+
+        The search is the same as AlgorithmM.solutions(), with the recursion
+        replaced by a stack of (item, first tweak, current row) levels.  The
+        current row is SKIP while the item has been set aside to satisfy its
+        minimum multiplicity.  Closing the generator early restores the arrays.
+        """
+        rlink = self.rlink
+        dlink = self.dlink
+        bound = self.bound
+        slack = self.slack
+        stack = self.solution_stack
+        levels = []
+
+        while True:
+            node = None
+
+            if rlink[0] == 0:
+                try:
+                    yield self.get_solution()
+
+                except GeneratorExit:
+                    self.unwind_levels(levels)
+                    raise
+
+            else:
+                item, branching_degree = self.get_branching_degree()
+
+                if branching_degree != 0:
+                    levels.append([item, dlink[item], None])
+                    bound[item] -= 1
+
+                    if bound[item] == 0:
+                        self.cover(item)
+
+                    node = dlink[item]
+
+            while levels:
+                level = levels[-1]
+                item = level[0]
+
+                if node is None:
+                    if level[2] == SKIP:
+                        if bound[item] != 0:
+                            self.relink_horizontal(item)
+
+                        self.possibly_untweak(item, level[1])
+                        bound[item] += 1
+                        levels.pop()
+                        continue
+
+                    self.uncommit_columns(level[2])
+                    stack.pop()
+                    node = dlink[level[2]]
+
+                if node != item and self.possibly_tweak(item, node):
+                    level[2] = node
+                    stack.append(node)
+                    self.commit_columns(node)
+                    break
+
+                if bound[item] < slack[item]:
+                    level[2] = SKIP
+
+                    if bound[item] != 0:
+                        self.unlink_horizontal(item)
+
+                    break
+
+                self.possibly_untweak(item, level[1])
+                bound[item] += 1
+                levels.pop()
+                node = None
+
+            else:
+                return
+
+    def unwind_levels(self, levels):
+        """
+        Undo the branch taken at every level and restore its item, restoring
+        the arrays after an abandoned search.
+        """
+        bound = self.bound
+
+        while levels:
+            item, first_tweak, row = levels.pop()
+
+            if row == SKIP:
+                if bound[item] != 0:
+                    self.relink_horizontal(item)
+
+            else:
+                self.uncommit_columns(row)
+                self.solution_stack.pop()
+
+            self.possibly_untweak(item, first_tweak)
+            bound[item] += 1
+
+    def unlink_horizontal(self, item):
+        """
+        Remove an item from its item list.
+        """
+        llink = self.llink
+        rlink = self.rlink
+        rlink[llink[item]] = rlink[item]
+        llink[rlink[item]] = llink[item]
+
+    def relink_horizontal(self, item):
+        """
+        Restore an item to its item list.
+        """
+        llink = self.llink
+        rlink = self.rlink
+        rlink[llink[item]] = item
+        llink[rlink[item]] = item
+
+    def tweak(self, item, node, hide=True):
+        """
+        Remove node from the column of item so it is not considered again by
+        later branches at this level.
+        """
+        if hide:
+            self.hide(node)
+
+        down = self.dlink[node]
+        self.dlink[item] = down
+        self.ulink[down] = item
+        self.top[item] -= 1
+
+    def untweak(self, item, first_tweak, unhide=True):
+        """
+        Restore the tweaked nodes of item, starting from first_tweak.
+        """
+        ulink = self.ulink
+        dlink = self.dlink
+        terminal = dlink[item]
+        dlink[item] = first_tweak
+        node = first_tweak
+        prev = item
+
+        while node != terminal:
+            if unhide:
+                self.unhide(node)
+
+            ulink[node] = prev
+            prev = node
+            node = dlink[node]
+            self.top[item] += 1
+
+        ulink[terminal] = prev
+
+    def possibly_tweak(self, item, node):
+        """
+        Step 'M5 possibly tweak'.  Return False if the remaining options of
+        item cannot reach its minimum multiplicity, so the outer loop can stop.
+        """
+        bound = self.bound[item]
+        slack = self.slack[item]
+
+        if (bound == 0) and (slack == 0):
+            return True
+
+        if self.top[item] <= (bound - slack):
+            return False
+
+        self.tweak(item, node, hide=bound != 0)
+        return True
+
+    def possibly_untweak(self, item, first_tweak):
+        """
+        Step 'M8 restore i'.
+        """
+        bound = self.bound[item]
+
+        if (bound == 0) and (self.slack[item] == 0):
+            self.uncover(item)
+
+        elif bound == 0:
+            self.untweak(item, first_tweak, unhide=False)
+            self.uncover(item)
+
+        else:
+            self.untweak(item, first_tweak)
+
+    def commit_columns(self, node):
+        """
+        Commit the items appearing in the option containing node, other than
+        the item of node itself.
+        """
+        top = self.top
+        ulink = self.ulink
+        bound = self.bound
+        primary = self.primary
+        other = node + 1
+
+        while other != node:
+            item = top[other]
+
+            if item <= 0:
+                other = ulink[other]
+                continue
+
+            if primary[item]:
+                bound[item] -= 1
+
+                if bound[item] == 0:
+                    self.cover(item)
+
+            else:
+                self.commit(other)
+
+            other += 1
+
+    def uncommit_columns(self, node):
+        """
+        Uncommit the items appearing in the option containing node, in the
+        reverse order of commit_columns().
+        """
+        top = self.top
+        dlink = self.dlink
+        bound = self.bound
+        primary = self.primary
+        other = node - 1
+
+        while other != node:
+            item = top[other]
+
+            if item <= 0:
+                other = dlink[other]
+                continue
+
+            if primary[item]:
+                bound[item] += 1
+
+                if bound[item] == 1:
+                    self.uncover(item)
+
+            else:
+                self.uncommit(other)
+
+            other -= 1
+
+    def cover(self, item):
+        """
+        Cover an item by removing it from its item list and hiding every option
+        within its column.
+        """
+        self.unlink_horizontal(item)
+        dlink = self.dlink
+        row = dlink[item]
+
+        while row != item:
+            self.hide(row)
+            row = dlink[row]
+
+    def hide(self, row):
+        """
+        Hide the option containing row by removing the up/down links of every
+        other uncolored or unpurified node in it.
+        """
+        top = self.top
+        ulink = self.ulink
+        dlink = self.dlink
+        color = self.color
+        node = row + 1
+
+        while node != row:
+            item = top[node]
+
+            if item <= 0:
+                node = ulink[node]
+                continue
+
+            if color[node] >= 0:
+                up = ulink[node]
+                down = dlink[node]
+                dlink[up] = down
+                ulink[down] = up
+                top[item] -= 1
+
+            node += 1
+
+    def uncover(self, item):
+        """
+        Uncover an item by restoring the links removed by cover().
+        """
+        self.relink_horizontal(item)
+        ulink = self.ulink
+        row = ulink[item]
+
+        while row != item:
+            self.unhide(row)
+            row = ulink[row]
+
+    def unhide(self, row):
+        """
+        Unhide the option containing row by restoring the links removed by
+        hide().
+        """
+        top = self.top
+        ulink = self.ulink
+        dlink = self.dlink
+        color = self.color
+        node = row - 1
+
+        while node != row:
+            item = top[node]
+
+            if item <= 0:
+                node = dlink[node]
+                continue
+
+            if color[node] >= 0:
+                dlink[ulink[node]] = node
+                ulink[dlink[node]] = node
+                top[item] += 1
+
+            node -= 1
+
+    def commit(self, node):
+        """
+        The color-compatible version of cover().  Nodes without a color cover
+        their item, colored nodes purify it.
+        """
+        if self.color[node] == 0:
+            self.cover(self.top[node])
+        elif self.color[node] > 0:
+            self.purify(node)
+
+    def purify(self, node):
+        """
+        Hide every option whose color for the item of node conflicts with the
+        color of node.
+        """
+        color = self.color
+        dlink = self.dlink
+        target = color[node]
+        item = self.top[node]
+        node = dlink[item]
+
+        while node != item:
+            if color[node] == target:
+                color[node] = -1
+            else:
+                self.hide(node)
+            node = dlink[node]
+
+    def uncommit(self, node):
+        """
+        Revert the effects of commit().
+        """
+        if self.color[node] == 0:
+            self.uncover(self.top[node])
+        elif self.color[node] > 0:
+            self.unpurify(node)
+
+    def unpurify(self, node):
+        """
+        Revert the effects of purify().
+        """
+        color = self.color
+        ulink = self.ulink
+        target = color[node]
+        item = self.top[node]
+        node = ulink[item]
+
+        while node != item:
+            if color[node] < 0:
+                color[node] = target
+            else:
+                self.unhide(node)
+            node = ulink[node]
+
+    def get_branching_degree(self):
+        """
+        Find the item with the smallest branching degree, breaking ties the
+        same way as AlgorithmM.get_branching_degree().
+        """
+        rlink = self.rlink
+        top = self.top
+        bound = self.bound
+        slack = self.slack
+        min_item = 0
+        min_monus = 2**64
+        item = rlink[0]
+
+        while item != 0:
+            monus = (top[item] + 1) - (bound[item] - slack[item])
+
+            if monus < min_monus or (
+                monus == min_monus
+                and (
+                    (slack[item] < slack[min_item])
+                    or (slack[item] == slack[min_item] and top[item] > top[min_item])
+                )
+            ):
+                min_item = item
+                min_monus = monus
+
+            if min_monus == 0:
+                break
+
+            item = rlink[item]
+
+        return min_item, min_monus
@@ -0,0 +1,480 @@
+"""
+Array-backed Algorithm X exact-cover solver.
+
+The matrix is stored in flat integer arrays following the DLX1 layout from The
+Art of Computer Programming 7.2.2.1.  Items occupy indices 1..N of the item
+arrays (index 0 is the root of the primary list and index N + 1 the root of
+the secondary list).  Nodes occupy a single node array:  indices 0..N are the
+item headers, followed by a spacer and then every option laid out left to right
+with a spacer after each one.
+"""
+
+from array import array
+from itertools import repeat
+
+
+class ArrayAlgorithmX:
+    """
+    Algorithm X solution generator backed by flat integer arrays.
+
+    Built from the same linked structure accepted by AlgorithmX, the solver
+    yields the same solutions in the same order, as lists of the original row
+    nodes, which it keeps.  Built with from_problem(), it never creates a node
+    and solutions are lists of option indices, as the row attribute of the
+    nodes linked by Problem.build().
+
+    With compact=True the links are kept in array('i') buffers (4 bytes per
+    link).  With compact=False they are kept in Python lists, which use more
+    memory but are faster to index:  in CPython the lists search about as fast
+    as the linked structure, the buffers about half as fast.
+    """
+
+    def __init__(self, root=None, compact=True):
+        self.storage = int_array if compact else list
+        self.nodes = None
+        self.rows = None
+        self.solution_stack = []
+        self.llink = self.storage(())
+        self.rlink = self.storage(())
+        self.top = self.storage(())
+        self.ulink = self.storage(())
+        self.dlink = self.storage(())
+
+        if root is not None:
+            self.load(root)
+
+    @classmethod
+    def from_problem(cls, problem, compact=True):
+        """
+        Lay out problem, a Problem, directly into the arrays.
+        """
+        solver = cls(compact=compact)
+        solver.load_problem(problem)
+        return solver
+
+    def load(self, root):
+        """
+        Convert the linked structure rooted at root into the array layout.
+        """
+        headers, rows = self.load_linked(root)
+        self.nodes = [root] + headers + [None] * (len(self.top) - len(headers) - 1)
+        position = len(headers) + 2
+
+        for row in rows:
+            self.nodes[position : position + len(row)] = row
+            position += len(row) + 1
+
+    def load_problem(self, problem):
+        """
+        Lay out problem, whose rows are the option indices.
+        """
+        if any(tuple(bounds) != (1, 1) for bounds in problem.bounds.values()):
+            raise ValueError("multiplicity bounds require AlgorithmM")
+
+        _, options, colors = number_options(problem)
+
+        if any(colors):
+            raise ValueError("colored items require AlgorithmC or AlgorithmM")
+
+        self.layout(len(problem.primary), len(problem.secondary), options)
+        self.rows = range(len(options))
+
+    def load_linked(self, root):
+        """
+        Lay out the linked structure rooted at root, keeping the order of its
+        columns, and return its headers and rows as collect() does.
+        """
+        primary = []
+        column = root.r
+
+        while column != root:
+            primary.append(column)
+            column = column.r
+
+        headers, rows = collect(primary)
+        index = {header: idx for idx, header in enumerate(headers, 1)}
+        options = [[index[node.header] for node in row] for row in rows]
+        self.layout(len(primary), len(headers) - len(primary), options)
+        self.relink_columns(headers, rows)
+        return headers, rows
+
+    def relink_columns(self, headers, rows):
+        """
+        Link every column in the order of the linked structure, which for a
+        hand linked structure need not be the order of the rows.
+        """
+        position = {}
+        spacer = len(headers) + 1
+
+        for row in rows:
+            for offset, node in enumerate(row, 1):
+                position[node] = spacer + offset
+
+            spacer += len(row) + 1
+
+        for item, header in enumerate(headers, 1):
+            prev = item
+            node = header.d
+
+            while node != header:
+                self.ulink[position[node]] = prev
+                self.dlink[prev] = position[node]
+                prev = position[node]
+                node = node.d
+
+            self.dlink[prev] = item
+            self.ulink[item] = prev
+
+    def layout(self, n_primary, n_secondary, options):
+        """
+        Fill the arrays for options given as lists of item numbers, primary
+        items numbered from 1 followed by the secondary ones.  Every column
+        lists its options in order.
+        """
+        n_items = n_primary + n_secondary
+        self.link_items(n_primary, n_items)
+
+        # Nodes:  headers, a leading spacer and then the options.
+        size = n_items + 2 + sum(len(option) + 1 for option in options)
+        top = self.top = self.storage(repeat(0, size))
+        ulink = self.ulink = self.storage(range(size))
+        dlink = self.dlink = self.storage(range(size))
+        last = list(range(n_items + 1))
+        spacer = n_items + 1
+
+        for number, option in enumerate(options, 1):
+            dlink[spacer] = spacer + len(option)
+
+            for offset, item in enumerate(option, 1):
+                node = spacer + offset
+                top[node] = item
+                top[item] += 1
+                ulink[node] = last[item]
+                dlink[last[item]] = node
+                last[item] = node
+
+            spacer += len(option) + 1
+            top[spacer] = -number
+            ulink[spacer] = spacer - len(option)
+
+        for item in range(1, n_items + 1):
+            dlink[last[item]] = item
+            ulink[item] = last[item]
+
+    def link_items(self, n_primary, n_items):
+        """
+        Fill the item lists:  0 heads the primary items, N + 1 heads the
+        secondary ones.
+        """
+        secondary_root = n_items + 1
+        self.llink = self.storage(range(-1, n_items + 1))
+        self.rlink = self.storage(range(1, n_items + 3))
+        self.llink[0] = n_primary
+        self.rlink[n_primary] = 0
+
+        if n_primary < n_items:
+            self.llink[n_primary + 1] = secondary_root
+            self.rlink[secondary_root] = n_primary + 1
+            self.llink[secondary_root] = n_items
+            self.rlink[n_items] = secondary_root
+
+        else:
+            self.llink[secondary_root] = secondary_root
+            self.rlink[secondary_root] = secondary_root
+
+    def solutions(self):
+        """
+        Generate solutions to the exact cover problem.  Closing the generator
+        early restores the arrays.
+        """
+        rlink = self.rlink
+        top = self.top
+        dlink = self.dlink
+        stack = self.solution_stack
+
+        while True:
+            if rlink[0] == 0:
+                try:
+                    yield self.get_solution()
+
+                except GeneratorExit:
+                    self.unwind()
+                    raise
+
+            else:
+                item = self.get_min_column()
+                self.cover(item)
+                node = dlink[item]
+
+                if node != item:
+                    stack.append(node)
+                    self.cover_columns(node)
+                    continue
+
+                self.uncover(item)
+
+            while stack:
+                node = stack.pop()
+                self.uncover_columns(node)
+                item = top[node]
+                node = dlink[node]
+
+                if node != item:
+                    stack.append(node)
+                    self.cover_columns(node)
+                    break
+
+                self.uncover(item)
+
+            else:
+                return
+
+    def unwind(self):
+        """
+        Undo every option on the solution stack and the covering of its item,
+        restoring the arrays after an abandoned search.
+        """
+        stack = self.solution_stack
+
+        while stack:
+            node = stack.pop()
+            self.uncover_columns(node)
+            self.uncover(self.top[node])
+
+    def cover_columns(self, node):
+        """
+        Cover the items appearing in the option containing node, other than
+        the item of node itself.
+        """
+        top = self.top
+        ulink = self.ulink
+        other = node + 1
+
+        while other != node:
+            item = top[other]
+
+            if item <= 0:
+                other = ulink[other]
+
+            else:
+                self.cover(item)
+                other += 1
+
+    def uncover_columns(self, node):
+        """
+        Uncover the items appearing in the option containing node, in the
+        reverse order of cover_columns().
+        """
+        top = self.top
+        dlink = self.dlink
+        other = node - 1
+
+        while other != node:
+            item = top[other]
+
+            if item <= 0:
+                other = dlink[other]
+
+            else:
+                self.uncover(item)
+                other -= 1
+
+    def cover(self, item):
+        """
+        Cover an item by removing it from the item list and hiding every option
+        within its column.
+        """
+        llink = self.llink
+        rlink = self.rlink
+        top = self.top
+        ulink = self.ulink
+        dlink = self.dlink
+        left = llink[item]
+        right = rlink[item]
+        rlink[left] = right
+        llink[right] = left
+        row = dlink[item]
+
+        while row != item:
+            node = row + 1
+
+            while node != row:
+                other = top[node]
+
+                if other <= 0:
+                    node = ulink[node]
+
+                else:
+                    up = ulink[node]
+                    down = dlink[node]
+                    dlink[up] = down
+                    ulink[down] = up
+                    top[other] -= 1
+                    node += 1
+
+            row = dlink[row]
+
+    def uncover(self, item):
+        """
+        Uncover an item by restoring the links removed by cover().
+        """
+        llink = self.llink
+        rlink = self.rlink
+        top = self.top
+        ulink = self.ulink
+        dlink = self.dlink
+        row = ulink[item]
+
+        while row != item:
+            node = row - 1
+
+            while node != row:
+                other = top[node]
+
+                if other <= 0:
+                    node = dlink[node]
+
+                else:
+                    dlink[ulink[node]] = node
+                    ulink[dlink[node]] = node
+                    top[other] += 1
+                    node -= 1
+
+            row = ulink[row]
+
+        rlink[llink[item]] = item
+        llink[rlink[item]] = item
+
+    def get_min_column(self):
+        """
+        Find the item with the least possible choices.
+        """
+        rlink = self.rlink
+        top = self.top
+        min_item = 0
+        min_len = 2**64
+        item = rlink[0]
+
+        while item != 0:
+            if top[item] < min_len:
+                min_item = item
+                min_len = top[item]
+
+            item = rlink[item]
+
+        return min_item
+
+    def get_solution(self):
+        """
+        Return a solution from the solution stack as the original row nodes,
+        or as the rows of the chosen options when no node is kept.
+        """
+        if self.nodes is None:
+            return [self.get_row(node) for node in self.solution_stack]
+
+        return [self.nodes[node] for node in self.solution_stack]
+
+    def get_row(self, node):
+        """
+        Return the row of the option containing node, read from the spacer
+        closing it.
+        """
+        top = self.top
+
+        while top[node] > 0:
+            node += 1
+
+        return self.rows[-top[node] - 1]
+
+
+def int_array(values):
+    """
+    Return a compact array of C ints holding values.
+    """
+    return array("i", values)
+
+
+def number_options(problem):
+    """
+    Number the items of problem from 1, primary items first, and return their
+    names, the options as lists of item numbers and the color of every node of
+    the options (0 for none), colors being numbered from 1 in order of first
+    appearance as Builder does.
+    """
+    names = list(problem.primary) + list(problem.secondary)
+    index = {}
+    colors = {}
+    options = []
+    node_colors = []
+
+    for item, name in enumerate(names, 1):
+        if name in index:
+            raise ValueError(f"duplicate item {name!r}")
+
+        index[name] = item
+
+    for row, option in enumerate(problem.options):
+        items = []
+
+        for item in option:
+            name, color = item if isinstance(item, tuple) else (item, None)
+            number = index.get(name)
+
+            if number is None:
+                raise ValueError(f"unknown item {name!r} in option {row}")
+
+            if color is not None and number <= len(problem.primary):
+                raise ValueError(f"item {name!r} cannot be colored")
+
+            if color is not None:
+                color = colors.setdefault(color, len(colors) + 1)
+
+            items.append(number)
+            node_colors.append(color or 0)
+
+        if len(set(items)) != len(items):
+            raise ValueError(f"repeated item in option {row}")
+
+        options.append(items)
+
+    return names, options, node_colors
+
+
+def collect(primary):
+    """
+    Walk the linked structure from the primary headers and return every header
+    (primary first, then secondary in discovery order) and every row as a list
+    of nodes in left to right order.
+    """
+    headers = list(primary)
+    known = set(headers)
+    seen = set()
+    rows = []
+    idx = 0
+
+    while idx < len(headers):
+        header = headers[idx]
+        node = header.d
+        idx += 1
+
+        while node != header:
+            if node not in seen:
+                row = [node]
+                other = node.r
+
+                while other != node:
+                    row.append(other)
+                    other = other.r
+
+                for other in row:
+                    seen.add(other)
+
+                    if other.header not in known:
+                        known.add(other.header)
+                        headers.append(other.header)
+
+                rows.append(row)
+
+            node = node.d
+
+    return headers, rows
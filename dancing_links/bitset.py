@@ -0,0 +1,249 @@
+"""
+Bitset Algorithm X exact-cover solver for small problems.
+
+Options and items are numbered, and the state of the search is two Python
+integers used as bit sets:  the options still available and the primary items
+still to cover.  Every option has precomputed masks of its items and of the
+options it conflicts with (those sharing an item, itself included), and every
+item the mask of the options containing it.  Choosing an option is then two
+AND-NOT operations, counting the choices of an item a popcount, and
+backtracking restores nothing since every level keeps its own state.
+
+The masks are as wide as the number of options (or items), so the engine pays
+off on problems small enough for them to fit in a few machine words, where the
+linked structure spends most of its time in attribute lookups.  solver_for()
+chooses between this engine and the linked solvers from a Problem.
+"""
+
+from heapq import heapify, heappop, heappush
+
+from .algorithm_c import AlgorithmC
+from .algorithm_m import AlgorithmM
+from .algorithm_x import AlgorithmX
+from .array_x import collect
+
+BITSET_ITEMS = 400
+
+
+class BitsetAlgorithmX:
+    """
+    Algorithm X solution generator over bit sets.
+
+    The solver is built from the same linked structure accepted by
+    AlgorithmX, and yields the same solutions in the same order (see
+    column_order() for the exception):  lists of the original row nodes, one
+    from the column branched on for each option.  The linked structure itself
+    is not modified.
+    """
+
+    def __init__(self, root):
+        self.solution_stack = []
+        self.nodes = []
+        self.headers = []
+        self.option_items = []
+        self.conflicts = []
+        self.item_options = []
+        self.primary = 0
+        self.load(root)
+
+    def load(self, root):
+        """
+        Compute the masks of the problem held by the linked structure rooted at
+        root.
+        """
+        primary = []
+        column = root.r
+
+        while column != root:
+            primary.append(column)
+            column = column.r
+
+        self.headers, rows = collect(primary)
+        rows = column_order(self.headers, rows)
+        index = {header: item for item, header in enumerate(self.headers)}
+        self.primary = (1 << len(primary)) - 1
+        self.item_options = [0] * len(self.headers)
+        self.option_items = []
+        self.nodes = []
+
+        for option, row in enumerate(rows):
+            items = 0
+
+            nodes = {}
+
+            for node in row:
+                item = index[node.header]
+                items |= 1 << item
+                self.item_options[item] |= 1 << option
+                nodes[item] = node
+
+            self.option_items.append(items)
+            self.nodes.append(nodes)
+
+        self.conflicts = []
+
+        for items in self.option_items:
+            conflicts = 0
+
+            while items:
+                low = items & -items
+                conflicts |= self.item_options[low.bit_length() - 1]
+                items ^= low
+
+            self.conflicts.append(conflicts)
+
+    def solutions(self):
+        """
+        Generate solutions to the exact cover problem.  Closing the generator
+        early clears the solution stack.
+        """
+        option_items = self.option_items
+        conflicts = self.conflicts
+        stack = self.solution_stack
+        levels = []
+        available = (1 << len(self.option_items)) - 1
+        uncovered = self.primary
+
+        while True:
+            if uncovered == 0:
+                try:
+                    yield self.get_solution()
+
+                except GeneratorExit:
+                    stack.clear()
+                    raise
+
+            else:
+                item, candidates = self.get_min_column(available, uncovered)
+
+                if candidates:
+                    levels.append([item, candidates, available, uncovered])
+                    stack.append(None)
+
+            while levels:
+                level = levels[-1]
+                candidates = level[1]
+
+                if candidates:
+                    low = candidates & -candidates
+                    level[1] = candidates ^ low
+                    option = low.bit_length() - 1
+                    stack[-1] = (option, level[0])
+                    available = level[2] & ~conflicts[option]
+                    uncovered = level[3] & ~option_items[option]
+                    break
+
+                levels.pop()
+                stack.pop()
+
+            else:
+                return
+
+    def count_solutions(self):
+        """
+        Count the solutions without materializing them.
+        """
+        return sum(1 for _ in self.solutions())
+
+    def get_min_column(self, available, uncovered):
+        """
+        Find the uncovered item with the least available options, the first
+        one in item order among ties, and return it with the mask of its
+        options.
+        """
+        item_options = self.item_options
+        min_item = None
+        min_options = 0
+        min_count = 2**64
+
+        while uncovered:
+            low = uncovered & -uncovered
+            item = low.bit_length() - 1
+            options = available & item_options[item]
+            count = options.bit_count()
+
+            if count < min_count:
+                min_item = item
+                min_options = options
+                min_count = count
+
+                if count <= 1:
+                    break
+
+            uncovered ^= low
+
+        return min_item, min_options
+
+    def get_solution(self):
+        """
+        Return a solution from the solution stack as the original row nodes.
+        """
+        nodes = self.nodes
+        return [nodes[option][item] for option, item in self.solution_stack]
+
+
+def column_order(headers, rows):
+    """
+    Return the rows sorted so that every column lists them in order (as they
+    were linked one after the other), breaking ties by their order in rows.
+    Options are branched on in this order, which is the order the linked
+    solvers walk the columns in.
+
+    A hand linked structure may list some rows in conflicting orders in two
+    columns.  No order then suits every column, and the rows caught in such a
+    cycle (or placed after one) follow the others in their order in rows:  the
+    solutions are the same, possibly found in another order.
+    """
+    number = {}
+
+    for position, row in enumerate(rows):
+        for node in row:
+            number[node] = position
+
+    successors = [[] for _ in rows]
+    predecessors = [0] * len(rows)
+
+    for header in headers:
+        node = header.d
+
+        while node.d != header:
+            successors[number[node]].append(number[node.d])
+            predecessors[number[node.d]] += 1
+            node = node.d
+
+    ready = [position for position, count in enumerate(predecessors) if count == 0]
+    heapify(ready)
+    order = []
+
+    while ready:
+        position = heappop(ready)
+        order.append(rows[position])
+
+        for successor in successors[position]:
+            predecessors[successor] -= 1
+
+            if predecessors[successor] == 0:
+                heappush(ready, successor)
+
+    order += [row for row, count in zip(rows, predecessors) if count]
+    return order
+
+
+def solver_for(problem, max_items=BITSET_ITEMS):
+    """
+    Return a solver for problem:  a BitsetAlgorithmX when it is a plain exact
+    cover problem with at most max_items items, otherwise AlgorithmM when it
+    has multiplicity bounds, AlgorithmC when it has colors, and AlgorithmX.
+    """
+    if any(tuple(bounds) != (1, 1) for bounds in problem.bounds.values()):
+        return AlgorithmM(problem.build(AlgorithmM))
+
+    if any(isinstance(item, tuple) for option in problem.options for item in option):
+        return AlgorithmC(problem.build(AlgorithmC))
+
+    root = problem.build()
+
+    if len(problem.primary) + len(problem.secondary) <= max_items:
+        return BitsetAlgorithmX(root)
+
+    return AlgorithmX(root)
@@ -0,0 +1,189 @@
+"""
+AlgorithmX and AlgorithmC with a bucket queue for choosing the column to
+branch on.
+
+get_min_column() of the plain solvers walks every active primary column at
+every node of the search tree.  The solvers here keep the active primary
+columns in buckets indexed by multiplicity, moving a column between adjacent
+buckets whenever hide() or unhide() changes its multiplicity, and removing or
+restoring it when it is covered or uncovered.  The column with the least
+multiplicity is then found by scanning up from a lower bound on the smallest
+non-empty bucket, which is usually already the answer.
+
+The index costs a few dictionary operations per update, so it pays off when
+there are many active primary columns and each option only touches a few of
+them (see benchmarks.bench_bucket).  Columns tied for the least multiplicity
+are taken in the order they entered their bucket rather than in the order of
+the item list, so the search tree may differ from that of the plain solvers
+(the solutions found are the same).  When a heuristic or a random number
+generator is set the column is chosen as by the plain solvers.
+"""
+
+from .algorithm_c import AlgorithmC
+from .algorithm_x import AlgorithmX
+
+
+class BucketQueue:
+    """
+    The active primary columns of a solver in buckets by multiplicity.  The
+    solver moves the columns between buckets as their multiplicities change,
+    and lowers low whenever a column enters a bucket below it.
+    """
+
+    def __init__(self, root):
+        columns = []
+        column = root.r
+
+        while column != root:
+            columns.append(column)
+            column = column.r
+
+        size = max((column.multiplicity for column in columns), default=0) + 1
+        self.buckets = [{} for _ in range(size)]
+        self.primary = set(columns)
+        self.indexed = set()
+        self.low = size
+
+        for column in columns:
+            self.add(column)
+
+    def add(self, header):
+        """
+        Add a column to the bucket of its multiplicity.
+        """
+        multiplicity = header.multiplicity
+        self.buckets[multiplicity][header] = None
+        self.indexed.add(header)
+        self.low = min(self.low, multiplicity)
+
+    def remove(self, header):
+        """
+        Remove a column from its bucket.
+        """
+        del self.buckets[header.multiplicity][header]
+        self.indexed.discard(header)
+
+    def minimum(self):
+        """
+        Return a column of least multiplicity, or None if there are none.
+        """
+        buckets = self.buckets
+
+        while self.low < len(buckets):
+            if buckets[self.low]:
+                return next(iter(buckets[self.low]))
+
+            self.low += 1
+
+        return None
+
+
+class BucketMixin:
+    """
+    Mixin choosing columns with a bucket queue, placed before AlgorithmX or
+    AlgorithmC in the method resolution order.  Purified nodes stay linked
+    when their row is hidden if skip_purified is set, as for Algorithm C.
+    """
+
+    skip_purified = False
+
+    def __init__(self, root, heuristic=None):
+        super().__init__(root, heuristic)
+        self.queue = BucketQueue(root)
+
+    def cover(self, column):
+        """
+        Cover a column, removing it from the queue if it is primary.
+        """
+        if column.header in self.queue.primary:
+            self.queue.remove(column.header)
+
+        super().cover(column)
+
+    def uncover(self, column):
+        """
+        Uncover a column, restoring it to the queue if it is primary.
+        """
+        super().uncover(column)
+
+        if column.header in self.queue.primary:
+            self.queue.add(column.header)
+
+    def get_min_column(self):
+        """
+        Find the column with the least possible choices from the queue.  If a
+        heuristic or a random number generator is set, the column is chosen as
+        by the plain solver.
+        """
+        if self.heuristic is not None or self.random is not None:
+            return super().get_min_column()
+
+        return self.queue.minimum()
+
+    def hide(self, row):
+        """
+        Hide a row by removing up/down links for every node in the row (but
+        the purified ones when skip_purified is set), moving each column down
+        one bucket.
+        """
+        queue = self.queue
+        buckets = queue.buckets
+        indexed = queue.indexed
+        skip_purified = self.skip_purified
+        node = row.r
+
+        while node != row:
+            if not skip_purified or node.color >= 0:
+                node.d.u = node.u
+                node.u.d = node.d
+                header = node.header
+                multiplicity = header.multiplicity - 1
+                header.multiplicity = multiplicity
+
+                if header in indexed:
+                    del buckets[multiplicity + 1][header]
+                    buckets[multiplicity][header] = None
+
+                    if multiplicity < queue.low:
+                        queue.low = multiplicity
+
+            node = node.r
+
+    def unhide(self, row):
+        """
+        Unhide a row by restoring the links removed by hide(), moving each
+        column up one bucket.
+        """
+        queue = self.queue
+        buckets = queue.buckets
+        indexed = queue.indexed
+        skip_purified = self.skip_purified
+        node = row.l
+
+        while node != row:
+            if not skip_purified or node.color >= 0:
+                node.d.u = node
+                node.u.d = node
+                header = node.header
+                multiplicity = header.multiplicity + 1
+                header.multiplicity = multiplicity
+
+                if header in indexed:
+                    del buckets[multiplicity - 1][header]
+                    buckets[multiplicity][header] = None
+
+            node = node.l
+
+
+class BucketAlgorithmX(BucketMixin, AlgorithmX):
+    """
+    Algorithm X solution generator class choosing columns with a bucket queue.
+    """
+
+
+class BucketAlgorithmC(BucketMixin, AlgorithmC):
+    """
+    Algorithm C solution generator class choosing columns with a bucket queue.
+    """
+
+    skip_purified = True
@@ -0,0 +1,246 @@
+"""
+Bulk construction of the linked structures used by the solvers.
+
+A Problem describes an exact cover instance as a list of options, each a list
+of items.  An item is either a name or a (name, color) pair, colors being
+allowed on secondary items only.  Primary items may carry multiplicity bounds
+(lower, upper), which AlgorithmM accepts.  Problem.build() links the structure
+for a solver class in a single pass; the row attribute of every node is the
+index of its option, so solutions map back to the input.
+
+Builder is the incremental interface used by Problem.build():  items are added
+first, then options are linked one by one as they arrive.
+"""
+
+from . import algorithm_c, algorithm_m, algorithm_x
+
+MODULES = {
+    algorithm_x.AlgorithmX: algorithm_x,
+    algorithm_c.AlgorithmC: algorithm_c,
+    algorithm_m.AlgorithmM: algorithm_m,
+}
+
+
+class Problem:
+    """
+    Description of an exact cover problem.
+
+    When primary is None, every item of the options not listed as secondary is
+    primary, in order of first appearance.  bounds maps primary items to their
+    (lower, upper) multiplicities.
+    """
+
+    def __init__(self, options, primary=None, secondary=(), bounds=None):
+        self.options = options
+        self.secondary = list(secondary)
+        self.bounds = {} if bounds is None else dict(bounds)
+
+        if primary is None:
+            primary = {}
+            excluded = set(self.secondary)
+
+            for option in options:
+                for item in option:
+                    name = item[0] if isinstance(item, tuple) else item
+
+                    if name not in excluded:
+                        primary[name] = None
+
+        self.primary = list(primary)
+
+    @classmethod
+    def from_matrix(cls, matrix, secondary=(), bounds=None):
+        """
+        Describe the problem given by a sparse 0/1 matrix with one row per
+        option and one column per item, named by column index.  The matrix is
+        either SciPy-style (anything with tocsr(), or with indptr and indices
+        arrays) or a pair of (row, column) index sequences.  Columns listed in
+        secondary are secondary items.
+        """
+        if hasattr(matrix, "tocsr"):
+            matrix = matrix.tocsr()
+
+        if hasattr(matrix, "indptr"):
+            indptr = as_list(matrix.indptr)
+            indices = as_list(matrix.indices)
+            options = [indices[start:stop] for start, stop in zip(indptr, indptr[1:])]
+
+        else:
+            rows, columns = (as_list(values) for values in matrix)
+            options = [[] for _ in range(max(rows, default=-1) + 1)]
+
+            for row, column in zip(rows, columns):
+                options[row].append(column)
+
+        if hasattr(matrix, "shape"):
+            n_columns = matrix.shape[1]
+        else:
+            n_columns = 1 + max(
+                (max(option, default=-1) for option in options), default=-1
+            )
+
+        excluded = set(secondary)
+        primary = [column for column in range(n_columns) if column not in excluded]
+        return cls(options, primary, secondary, bounds)
+
+    def build(self, solver_class=algorithm_x.AlgorithmX):
+        """
+        Link the structure for solver_class and return its root.
+        """
+        builder = Builder(solver_class)
+
+        for name in self.primary:
+            builder.add_item(name, bounds=self.bounds.get(name))
+
+        for name in self.secondary:
+            builder.add_item(name, primary=False)
+
+        for option in self.options:
+            builder.add_option(option)
+
+        return builder.root
+
+
+class Builder:
+    """
+    Incrementally link the structure for one of the solver classes (or a
+    subclass).  Nodes are linked directly rather than through the insert
+    methods, and the column lengths are counted as they go.
+    """
+
+    def __init__(self, solver_class=algorithm_x.AlgorithmX):
+        self.module = module_for(solver_class)
+        self.root = self.module.Header(name="root")
+        self.headers = {}
+        self.primary = set()
+        self.colors = {}
+        self.options = 0
+
+    def add_item(self, name, primary=True, bounds=None):
+        """
+        Add an item and return its header.  Primary items are appended to the
+        item list.
+        """
+        if name in self.headers:
+            raise ValueError(f"duplicate item {name!r}")
+
+        if self.module is algorithm_m:
+            lower, upper = check_bounds(name, bounds)
+            header = self.module.Header(
+                name=name, primary=primary, slack=upper - lower, bound=upper
+            )
+
+        elif bounds is None or tuple(bounds) == (1, 1):
+            header = self.module.Header(name=name)
+
+        else:
+            raise ValueError("multiplicity bounds require AlgorithmM")
+
+        if primary:
+            left = self.root.l
+            header.l = left
+            header.r = self.root
+            left.r = header
+            self.root.l = header
+            self.primary.add(header)
+
+        self.headers[name] = header
+        return header
+
+    def add_option(self, items):
+        """
+        Link an option given as a sequence of items and return its index.
+        """
+        node_class = self.module.Node
+        headers = self.headers
+        row = self.options
+        linked = []
+
+        for item in items:
+            if isinstance(item, tuple):
+                name, color = item
+            else:
+                name, color = item, None
+
+            header = headers.get(name)
+
+            if header is None:
+                raise ValueError(f"unknown item {name!r} in option {row}")
+
+            if color is None:
+                linked.append(node_class(header, name, row))
+            else:
+                linked.append(self.colored_node(header, color, row))
+
+        if len({node.header for node in linked}) != len(linked):
+            raise ValueError(f"repeated item in option {row}")
+
+        prev = linked[-1] if linked else None
+
+        for node in linked:
+            header = node.header
+            up = header.u
+            node.u = up
+            node.d = header
+            up.d = node
+            header.u = node
+            node.l = prev
+            prev.r = node
+            prev = node
+
+        if self.module is algorithm_m:
+            for node in linked:
+                node.header.len += 1
+
+        else:
+            for node in linked:
+                node.header.multiplicity += 1
+
+        self.options += 1
+        return row
+
+    def colored_node(self, header, color, row):
+        """
+        Return a node of row for a colored secondary item.  Colors are numbered
+        from 1 in order of first appearance.
+        """
+        if header in self.primary or self.module is algorithm_x:
+            raise ValueError(f"item {header.name!r} cannot be colored")
+
+        number = self.colors.get(color)
+
+        if number is None:
+            number = self.colors[color] = len(self.colors) + 1
+
+        return self.module.Node(header, f"{header.name}:{color}", row, number)
+
+
+def check_bounds(name, bounds):
+    """
+    Return the (lower, upper) multiplicities of item name given its bounds
+    (None for exactly once), raising ValueError if they are invalid.
+    """
+    lower, upper = (1, 1) if bounds is None else bounds
+
+    if not 0 <= lower <= upper or upper < 1:
+        raise ValueError(f"invalid bounds {bounds!r} for item {name!r}")
+
+    return lower, upper
+
+
+def module_for(solver_class):
+    """
+    Return the module holding the Header and Node classes for solver_class.
+    """
+    for cls in solver_class.__mro__:
+        if cls in MODULES:
+            return MODULES[cls]
+
+    raise ValueError(f"no linked structure for {solver_class.__name__}")
+
+
+def as_list(values):
+    """
+    Convert an array-like (e.g. a NumPy array) to a list of Python values.
+    """
+    return values.tolist() if hasattr(values, "tolist") else list(values)
@@ -0,0 +1,363 @@
+"""
+Dancing cells Algorithm C (XCC) solver, after Knuth's Algorithm 3C of The Art
+of Computer Programming 7.2.2.3.
+
+Instead of doubly linked lists, every item keeps the options still available
+to it as a sparse set:  a segment of the cells list holding the nodes of those
+options first, followed by the nodes removed from it, with size giving the
+boundary and where the position of every node.  Removing a node swaps it with
+the last available one and decrements size, so incrementing the size again
+undoes the removal without moving anything.  Every removal, and every item
+leaving the active items, is recorded on a trail.  Each level of the search
+keeps the length of the trail once its item is covered, and backtracking pops
+the trail back to it instead of walking the structure again as uncover() and
+unhide() do:  the cost is that of the changes made below the level.  The
+active primary items form another sparse set.
+
+Every item is active (state 0), covered (state -1) or purified to a color
+(state > 0).  Committing an option covers each of its uncolored items (every
+other option using the item is hidden) and purifies each of its colored items
+(every option giving the item another color is hidden).  Hiding an option only
+removes its nodes from the sets of active items:  the sets of the other items
+are never looked at again.  The item branched on is the active primary item
+with the fewest options left.
+"""
+
+from .array_x import collect
+
+
+class CellsAlgorithmC:
+    """
+    Algorithm C solution generator over sparse sets.
+
+    The solver is built from the same linked structure accepted by
+    AlgorithmC, which it does not modify, and yields the same solutions (as
+    lists of the original row nodes, one from the column branched on for each
+    option), possibly in another order.
+    """
+
+    def __init__(self, root):
+        self.solution_stack = []
+        self.nodes = []
+        self.active = ActiveItems(0)
+        self.state = []
+        self.trail = []
+        self.sets = SparseSets()
+        self.load(root)
+
+    def load(self, root):
+        """
+        Lay out the problem held by the linked structure rooted at root.
+        """
+        primary = []
+        column = root.r
+
+        while column != root:
+            primary.append(column)
+            column = column.r
+
+        headers, rows = collect(primary)
+        index = {header: item for item, header in enumerate(headers)}
+        self.active = ActiveItems(len(primary))
+        self.state = [0] * len(headers)
+        self.sets = SparseSets()
+        self.nodes = []
+        members = [[] for _ in headers]
+
+        for row in rows:
+            nodes = {}
+
+            for node in row:
+                item = index[node.header]
+                members[item].append(
+                    self.sets.add_node(item, max(getattr(node, "color", 0), 0))
+                )
+                nodes[item] = node
+
+            self.sets.end_option()
+            self.nodes.append(nodes)
+
+        self.sets.layout(members)
+
+    def solutions(self):
+        """
+        Generate solutions to the exact cover problem.  Closing the generator
+        early restores the sets.
+        """
+        stack = self.solution_stack
+        trail = self.trail
+        order = self.save()
+        levels = []
+
+        while True:
+            if self.active.count == 0:
+                try:
+                    yield self.get_solution()
+
+                except GeneratorExit:
+                    self.undo(0)
+                    self.restore(order)
+                    stack.clear()
+                    raise
+
+            else:
+                item = self.get_min_column()
+                options = self.sets.options(item)
+
+                if options:
+                    self.cover(item)
+                    levels.append([item, options, 0, len(trail)])
+                    stack.append(None)
+
+            while levels:
+                level = levels[-1]
+                self.undo(level[3])
+
+                if level[2] < len(level[1]):
+                    option = level[1][level[2]]
+                    level[2] += 1
+                    stack[-1] = (option, level[0])
+                    self.commit(option)
+                    break
+
+                levels.pop()
+                stack.pop()
+
+            else:
+                self.undo(0)
+                self.restore(order)
+                return
+
+    def count_solutions(self):
+        """
+        Count the solutions without materializing them.
+        """
+        return sum(1 for _ in self.solutions())
+
+    def undo(self, mark):
+        """
+        Undo the changes recorded on the trail after its first mark entries:  an
+        item removed a node from its set, or ~item left the active items.  The
+        changes commute, so they are undone in any order.
+        """
+        trail = self.trail
+        size = self.sets.size
+        state = self.state
+        active = self.active
+
+        for entry in trail[mark:]:
+            if entry >= 0:
+                size[entry] += 1
+
+            else:
+                state[~entry] = 0
+
+                if ~entry < len(active.items):
+                    active.count += 1
+
+        del trail[mark:]
+
+    def save(self):
+        """
+        Return a copy of the order of the sets and of the primary items.
+        """
+        sets = self.sets
+        lists = (sets.cells, sets.where, self.active.items, self.active.where)
+        return [values[:] for values in lists]
+
+    def restore(self, saved):
+        """
+        Restore an order returned by save(), so that every search walks the
+        sets in the same order.
+        """
+        sets = self.sets
+        active = self.active
+        sets.cells[:], sets.where[:], active.items[:], active.where[:] = saved
+
+    def cover(self, item):
+        """
+        Cover an active primary item, hiding every option using it.
+        """
+        sets = self.sets
+        self.retire(item, -1)
+        sets.hide(sets.members(item), self.state, self.trail)
+
+    def commit(self, option):
+        """
+        Cover or purify every active item of option, its item branched on being
+        covered already.
+        """
+        sets = self.sets
+        state = self.state
+        trail = self.trail
+        colors = sets.color
+
+        for node in sets.option_nodes(option):
+            item = sets.item[node]
+
+            if state[item] != 0:
+                continue
+
+            color = colors[node]
+            self.retire(item, color or -1)
+
+            if color == 0:
+                sets.hide(sets.members(item), state, trail)
+
+            else:
+                sets.hide(
+                    [other for other in sets.members(item) if colors[other] != color],
+                    state,
+                    trail,
+                )
+
+    def retire(self, item, value):
+        """
+        Set the state of an active item to value (-1 when covered, its color
+        when purified) and record it on the trail, removing it from the active
+        items if it is primary.
+        """
+        self.state[item] = value
+        self.trail.append(~item)
+
+        if item < len(self.active.items):
+            self.active.remove(item)
+
+    def get_min_column(self):
+        """
+        Find the active primary item with the fewest options left.
+        """
+        size = self.sets.size
+        active = self.active
+        return min(active.items[: active.count], key=size.__getitem__)
+
+    def get_solution(self):
+        """
+        Return a solution from the solution stack as the original row nodes.
+        """
+        nodes = self.nodes
+        return [nodes[option][item] for option, item in self.solution_stack]
+
+
+class ActiveItems:
+    """
+    The active primary items as a sparse set:  the first count of items, where
+    giving the position of every item.
+    """
+
+    def __init__(self, count):
+        self.items = list(range(count))
+        self.where = list(range(count))
+        self.count = count
+
+    def remove(self, item):
+        """
+        Remove item by swapping it with the last active item.
+        """
+        items = self.items
+        where = self.where
+        self.count -= 1
+        last = items[self.count]
+        position = where[item]
+        items[position] = last
+        where[last] = position
+        items[self.count] = item
+        where[item] = self.count
+
+
+class SparseSets:
+    """
+    The nodes of every option (item, color and option of each, options laid
+    out one after the other) and, for every item, the sparse set of the nodes
+    of the options still available to it.
+    """
+
+    def __init__(self):
+        self.item = []
+        self.color = []
+        self.option = []
+        self.option_start = [0]
+        self.cells = []
+        self.where = []
+        self.start = []
+        self.size = []
+
+    def add_node(self, item, color):
+        """
+        Append a node to the option being laid out and return it.
+        """
+        self.item.append(item)
+        self.color.append(color)
+        self.option.append(len(self.option_start) - 1)
+        return len(self.item) - 1
+
+    def end_option(self):
+        """
+        Close the option being laid out.
+        """
+        self.option_start.append(len(self.item))
+
+    def layout(self, members):
+        """
+        Fill the sets, members listing the nodes of every item.
+        """
+        self.where = [0] * len(self.item)
+
+        for nodes in members:
+            self.start.append(len(self.cells))
+            self.size.append(len(nodes))
+
+            for node in nodes:
+                self.where[node] = len(self.cells)
+                self.cells.append(node)
+
+    def option_nodes(self, option):
+        """
+        Return the nodes of option.
+        """
+        return range(self.option_start[option], self.option_start[option + 1])
+
+    def members(self, item):
+        """
+        Return the nodes in the set of item.
+        """
+        start = self.start[item]
+        return self.cells[start : start + self.size[item]]
+
+    def options(self, item):
+        """
+        Return the options in the set of item.
+        """
+        option = self.option
+        return [option[node] for node in self.members(item)]
+
+    def hide(self, nodes, state, trail):
+        """
+        Remove the options of nodes from the sets of their items which are
+        active in state, recording every item whose set shrinks on trail.
+        """
+        cells = self.cells
+        where = self.where
+        items = self.item
+        size = self.size
+        start = self.start
+        owner = self.option
+        option_start = self.option_start
+        record = trail.append
+
+        for node in nodes:
+            option = owner[node]
+
+            for other in range(option_start[option], option_start[option + 1]):
+                item = items[other]
+
+                if state[item] == 0:
+                    record(item)
+                    size[item] -= 1
+                    last = start[item] + size[item]
+                    position = where[other]
+                    moved = cells[last]
+                    cells[position] = moved
+                    where[moved] = position
+                    cells[last] = other
+                    where[other] = last
@@ -0,0 +1,73 @@
+"""
+Checkpoints for resuming long-running searches.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+
+class Checkpoint:
+    """
+    Search hook saving the search position to a file every node_interval nodes
+    and/or every time_interval seconds.
+
+    The position is the branch index taken at each level of the search, which
+    is enough to replay the chosen rows (and the AlgorithmM tweaks preceding
+    them) on a freshly built copy of the same problem.  The file also records
+    the number of nodes visited and solutions found before that position.  A
+    path of None marks a finished search.
+    """
+
+    def __init__(self, path, node_interval=None, time_interval=None):
+        self.path = Path(path)
+        self.node_interval = node_interval
+        self.time_interval = time_interval
+        self.nodes = 0
+        self.solutions = 0
+        self.saved_nodes = 0
+        self.saved_time = time.monotonic()
+
+    def __call__(self, levels):
+        self.nodes += 1
+
+        if (
+            self.node_interval is not None
+            and self.nodes - self.saved_nodes >= self.node_interval
+        ) or (
+            self.time_interval is not None
+            and time.monotonic() - self.saved_time >= self.time_interval
+        ):
+            self.save(levels)
+
+    def save(self, levels, explored=False):
+        """
+        Save the position given by levels.  With explored, the current node
+        has already been searched (e.g. its solution was returned) and is
+        skipped when resuming.
+        """
+        state = {
+            "path": None if levels is None else [level.index for level in levels],
+            "explored": explored,
+            "nodes": self.nodes,
+            "solutions": self.solutions,
+        }
+        temporary = self.path.with_name(self.path.name + ".tmp")
+
+        with open(temporary, "w", encoding="utf-8") as f_out:
+            json.dump(state, f_out)
+
+        os.replace(temporary, self.path)
+        self.saved_nodes = self.nodes
+        self.saved_time = time.monotonic()
+
+    def load(self):
+        """
+        Return the saved state, or None if nothing has been saved.
+        """
+        if not self.path.exists():
+            return None
+
+        with open(self.path, encoding="utf-8") as f_in:
+            return json.load(f_in)
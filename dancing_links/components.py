@@ -0,0 +1,315 @@
+"""
+Splitting a problem into independent subproblems.
+
+Two active primary items are connected when an option still available
+contains both, or contains one of them and an item which is no longer active
+(a secondary item, or for AlgorithmM a primary item set aside) whose column
+holds an option containing the other.  The connected components of this graph
+never interact:  the options of one component only touch its own items.
+
+split() moves the primary items of each component to a ring of their own
+under a new root, with a solver of the same class for each, so the components
+can be searched independently, even concurrently.  Counts then multiply and
+solutions are the Cartesian product of the solutions of the components, which
+turns a search of the product into a sum of searches.  With dynamic, the
+split is attempted again after every option committed, at every node of the
+search tree, which pays off when committing options disconnects the
+problem (e.g. tilings of long boards), and costs a walk of the active
+structure per node otherwise.
+"""
+
+from contextlib import contextmanager
+from math import prod
+
+
+def components(solver):
+    """
+    Return the active primary columns of solver grouped by connected
+    component, each group in item order.
+    """
+    order = active_columns(solver)
+    position = {column: index for index, column in enumerate(order)}
+    seen = set()
+    groups = []
+
+    for start in order:
+        if start in seen:
+            continue
+
+        group = []
+        groups.append(group)
+        seen.add(start)
+        stack = [start]
+
+        while stack:
+            header = stack.pop()
+
+            if header in position:
+                group.append(header)
+
+            row = header.d
+
+            while row != header:
+                node = row.r
+
+                while node != row:
+                    if node.header not in seen:
+                        seen.add(node.header)
+                        stack.append(node.header)
+
+                    node = node.r
+
+                row = row.d
+
+        group.sort(key=position.get)
+
+    return groups
+
+
+def active_columns(solver):
+    """
+    Return the active primary columns of solver in item order.
+    """
+    root = solver.root
+    columns = []
+    column = root.r
+
+    while column != root:
+        columns.append(column)
+        column = column.r
+
+    return columns
+
+
+@contextmanager
+def split(solver):
+    """
+    Context manager yielding one solver per connected component of the
+    problem, or [solver] if it is connected.  The component solvers share
+    the nodes of solver and must be left fully backtracked (their searches
+    finished or closed) before the context exits and the item list of solver
+    is restored.
+    """
+    groups = components(solver)
+
+    if len(groups) < 2:
+        yield [solver]
+        return
+
+    root = solver.root
+    order = active_columns(solver)
+    parts = []
+
+    for group in groups:
+        part_root = type(root)(name=f"{root.name}.{len(parts)}")
+        link_ring(part_root, group)
+        part = type(solver)(part_root, solver.heuristic)
+        part.random = solver.random
+        parts.append(part)
+
+    try:
+        yield parts
+
+    finally:
+        link_ring(root, order)
+
+
+def link_ring(root, headers):
+    """
+    Link headers in a ring under root, in order.
+    """
+    left = root
+
+    for header in headers:
+        left.r = header
+        header.l = left
+        left = header
+
+    left.r = root
+    root.l = left
+
+
+def count_solutions(solver, dynamic=False):
+    """
+    Count the solutions by counting those of each component and multiplying.
+    """
+    if dynamic:
+        return count_dynamic(solver)
+
+    with split(solver) as parts:
+        if len(parts) == 1:
+            return solver.count_solutions()
+
+        total = 1
+
+        for part in parts:
+            total *= part.count_solutions()
+
+            if total == 0:
+                break
+
+        return total
+
+
+def count_dynamic(solver):
+    """
+    Count the solutions, splitting the problem at every node.
+    """
+    if solver.solved():
+        return 1
+
+    with split(solver) as parts:
+        if len(parts) > 1:
+            counts = []
+
+            for part in parts:
+                counts.append(count_dynamic(part))
+
+                if counts[-1] == 0:
+                    return 0
+
+            return prod(counts)
+
+    level = solver.open_level()
+
+    if level is None:
+        return 0
+
+    total = 0
+
+    while solver.next_branch(level):
+        total += count_dynamic(solver)
+
+    return total
+
+
+def solutions(solver, dynamic=False):
+    """
+    Generate the solutions as the Cartesian product of the solutions of the
+    components.  Each solution lists the options of the components in order,
+    as returned by get_solution().  The first component is searched as the
+    product is generated, the solutions of the others are kept as they are
+    found so they are only searched once.
+    """
+    prefix = solver.get_solution()
+
+    if dynamic:
+        for solution in solutions_dynamic(solver):
+            yield prefix + solution
+
+        return
+
+    with split(solver) as parts:
+        if len(parts) == 1:
+            yield from solver.solutions()
+            return
+
+        for solution in product([part.solutions() for part in parts]):
+            yield prefix + solution
+
+
+def solutions_dynamic(solver):
+    """
+    Generate the options added to the solution below the current node,
+    splitting the problem at every node.
+    """
+    if solver.solved():
+        yield []
+        return
+
+    with split(solver) as parts:
+        if len(parts) > 1:
+            yield from product([solutions_dynamic(part) for part in parts])
+            return
+
+    level = solver.open_level()
+
+    if level is None:
+        return
+
+    depth = len(solver.solution_stack)
+
+    try:
+        while solver.next_branch(level):
+            chosen = solver.get_solution()[depth:]
+
+            for solution in solutions_dynamic(solver):
+                yield chosen + solution
+
+    except GeneratorExit:
+        solver.close_level(level)
+        raise
+
+
+def product(generators):
+    """
+    Generate the concatenations of one solution from each generator.  The
+    first generator is consumed as the product is generated, the others are
+    cached.  Every generator is closed once the product is exhausted or
+    closed.
+    """
+    first, *others = generators
+    caches = [Cached(generator) for generator in others]
+
+    try:
+        if all(cache.nonempty() for cache in caches):
+            for head in first:
+                for tail in concatenations(caches):
+                    yield head + tail
+
+    finally:
+        first.close()
+
+        for cache in caches:
+            cache.source.close()
+
+
+def concatenations(caches):
+    """
+    Generate the concatenations of one item from each cache.
+    """
+    if not caches:
+        yield []
+        return
+
+    for head in caches[0]:
+        for tail in concatenations(caches[1:]):
+            yield head + tail
+
+
+class Cached:
+    """
+    Iterable over the items of a generator, generating them only once.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.items = []
+        self.exhausted = False
+
+    def nonempty(self):
+        """
+        Check if the generator has at least one item.
+        """
+        for _ in self:
+            return True
+
+        return False
+
+    def __iter__(self):
+        index = 0
+
+        while True:
+            if index == len(self.items):
+                if self.exhausted:
+                    return
+
+                try:
+                    self.items.append(next(self.source))
+
+                except StopIteration:
+                    self.exhausted = True
+                    return
+
+            yield self.items[index]
+            index += 1
@@ -0,0 +1,102 @@
+"""
+Loader for the text format read by Knuth's DLX1, DLX2 and DLX3 programs.
+
+Lines beginning with '|' are comments, and blank lines are ignored.  The first
+remaining line lists the primary items, then '|', then the secondary items.  A
+primary item written 'u:v|name' has multiplicities u to v, and 'v|name' has
+multiplicity exactly v (DLX3).  Every following line is an option:  a list of
+items, with 'item:color' giving a color to a secondary item (DLX2).
+
+The options are linked one line at a time as they are read, so the input is
+never held in memory.  Option indices (the row attribute of every node) count
+the option lines from 0.
+"""
+
+from .algorithm_x import AlgorithmX
+from .builder import Builder
+
+
+def load(lines, solver_class=AlgorithmX):
+    """
+    Link the problem read from an iterable of lines (such as an open file) for
+    solver_class and return its root.
+    """
+    builder = Builder(solver_class)
+    items = False
+
+    for number, line in enumerate(lines, 1):
+        fields = line.split()
+
+        if not fields or line.startswith("|"):
+            continue
+
+        try:
+            if not items:
+                add_items(builder, fields)
+                items = True
+
+            else:
+                builder.add_option(
+                    tuple(field.split(":", 1)) if ":" in field else field
+                    for field in fields
+                )
+
+        except ValueError as error:
+            raise ValueError(f"line {number}: {error}") from error
+
+    if not items:
+        raise ValueError("missing item line")
+
+    return builder.root
+
+
+def load_file(path, solver_class=AlgorithmX):
+    """
+    Link the problem stored in the file at path for solver_class and return
+    its root.
+    """
+    with open(path, encoding="utf-8") as stream:
+        return load(stream, solver_class)
+
+
+def add_items(builder, fields):
+    """
+    Add the items named on the item line to builder.
+    """
+    primary = True
+
+    for field in fields:
+        if field == "|":
+            if not primary:
+                raise ValueError("more than one '|' in the item line")
+
+            primary = False
+
+        elif primary:
+            name, bounds = parse_bounds(field)
+            builder.add_item(name, bounds=bounds)
+
+        else:
+            builder.add_item(field, primary=False)
+
+
+def parse_bounds(field):
+    """
+    Split a primary item into its name and bounds:  'u:v|name' and 'v|name'
+    give (u, v) and (v, v), a plain name gives no bounds.
+    """
+    bounds, separator, name = field.rpartition("|")
+
+    if not separator:
+        return name, None
+
+    lower, _, upper = bounds.rpartition(":")
+
+    try:
+        upper = int(upper)
+        lower = int(lower) if lower else upper
+
+    except ValueError:
+        raise ValueError(f"invalid bounds in item {field!r}") from None
+
+    return name, (lower, upper)
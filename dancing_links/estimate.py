@@ -0,0 +1,108 @@
+"""
+Monte Carlo estimate of the size of a search tree, by the method of Knuth and
+Purdom (TAOCP 7.2.2, 'Estimating the running time').
+
+Each sample follows a random path from the root of the search tree down to a
+leaf, choosing uniformly among the branches at every node.  If the nodes on the
+path have d1, d2, ... branches, then 1 + d1 + d1 d2 + ... is an unbiased
+estimate of the number of nodes in the tree.  Weighting each node by the
+product of the degrees above it in the same way estimates the number of
+solutions (the leaves which are solutions) and the cost of the search, counted
+in updates (see Instrument).  Averaging the samples gives confidence intervals
+from the normal approximation.
+
+Dividing the estimated nodes by the nodes per second measured on a small
+instance (e.g. with benchmarks.suite) gives a rough running time.
+"""
+
+import math
+import random
+from statistics import NormalDist, fmean, stdev
+
+from .instrument import Instrument
+
+
+def estimate(solver, samples=1000, seed=None, confidence=0.95):
+    """
+    Estimate the number of nodes, solutions and updates of a full search from
+    random paths.  Return a dictionary mapping each quantity to its mean and
+    the bounds (low, high) of its confidence interval.  The structure is
+    restored afterwards.
+    """
+    if samples < 1:
+        raise ValueError("at least one sample is required")
+
+    rng = random.Random(seed)
+    totals = {"nodes": [], "solutions": [], "updates": []}
+
+    with Instrument(solver) as instrument:
+        for _ in range(samples):
+            for key, value in random_path(solver, instrument, rng).items():
+                totals[key].append(value)
+
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    result = {"samples": samples, "confidence": confidence}
+
+    for key, values in totals.items():
+        mean = fmean(values)
+        error = z * stdev(values) / math.sqrt(samples) if samples > 1 else math.inf
+        result[key] = {"mean": mean, "low": max(mean - error, 0), "high": mean + error}
+
+    return result
+
+
+def random_path(solver, instrument, rng):
+    """
+    Follow one random path down the search tree and return its estimates.  The
+    cost of a node is the number of updates made trying all of its branches,
+    as the full search would.
+    """
+    levels = solver.level_stack
+    weight = 1
+    path = {"nodes": 0, "solutions": 0, "updates": 0}
+
+    try:
+        while True:
+            path["nodes"] += weight
+
+            if solver.solved():
+                path["solutions"] += weight
+                break
+
+            updates = instrument.updates
+            degree = count_branches(solver)
+            path["updates"] += weight * (instrument.updates - updates)
+
+            if degree == 0:
+                break
+
+            level = solver.open_level()
+            levels.append(level)
+
+            for _ in range(rng.randrange(degree) + 1):
+                solver.next_branch(level)
+
+            weight *= degree
+
+    finally:
+        solver.unwind()
+
+    return path
+
+
+def count_branches(solver):
+    """
+    Return the number of branches at the current node by trying every one of
+    them.  The structure is restored afterwards.
+    """
+    level = solver.open_level()
+
+    if level is None:
+        return 0
+
+    degree = 0
+
+    while solver.next_branch(level):
+        degree += 1
+
+    return degree
@@ -0,0 +1,88 @@
+"""
+Branching heuristics for the AlgorithmX, AlgorithmC and AlgorithmM solvers.
+
+A heuristic is a callable taking the solver and returning the active primary
+column to branch on.  Pass it as the heuristic argument of the solver, or
+assign it to solver.heuristic between searches (None restores the solver's
+own rule).  The built-in heuristics may also be given to the solver by name:
+
+mrv:  minimum remaining values, the column with the fewest rows (for
+AlgorithmM, the smallest branching degree (len + 1) - (bound - slack)).  This
+is the solvers' own rule without its tie breakers.
+
+sharp:  Knuth's preference for items whose names begin with '#' (DLX1 to
+DLX3):  the column with the fewest rows among those whose names begin with
+'#', unless another column has at most one row (a forced move).
+
+first:  the first active column, i.e. no heuristic.
+"""
+
+
+def remaining(column):
+    """
+    Return the number of ways column can still be branched on.
+    """
+    if hasattr(column, "bound"):
+        return (column.len + 1) - (column.bound - column.slack)
+
+    return column.multiplicity
+
+
+def active_columns(solver):
+    """
+    Generate the active primary columns of solver, in item order.
+    """
+    root = solver.root
+    column = root.r
+
+    while column != root:
+        yield column
+        column = column.r
+
+
+def mrv(solver):
+    """
+    Choose the first column with the minimum remaining values.
+    """
+    return min(active_columns(solver), key=remaining, default=None)
+
+
+def sharp(solver):
+    """
+    Choose the column with the minimum remaining values, preferring columns
+    whose names begin with '#' unless a column has at most one row.
+    """
+
+    def key(column):
+        values = remaining(column)
+
+        if values <= 1 or str(column.name).startswith("#"):
+            return (0, values)
+
+        return (1, values)
+
+    return min(active_columns(solver), key=key, default=None)
+
+
+def first(solver):
+    """
+    Choose the first active column.
+    """
+    return next(active_columns(solver), None)
+
+
+HEURISTICS = {"mrv": mrv, "sharp": sharp, "first": first}
+
+
+def resolve(heuristic):
+    """
+    Return the heuristic callable for a name, callable or None.
+    """
+    if heuristic is None or callable(heuristic):
+        return heuristic
+
+    try:
+        return HEURISTICS[heuristic]
+
+    except KeyError:
+        raise ValueError(f"unknown heuristic {heuristic!r}") from None
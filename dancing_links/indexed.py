@@ -0,0 +1,199 @@
+"""
+AlgorithmM with a priority queue for choosing the column to branch on.
+
+get_branching_degree() of AlgorithmM walks the active primary columns at every
+node of the search tree, computing the branching degree (len + 1) - (bound -
+slack) of each.  IndexedAlgorithmM keeps the columns in a heap keyed by
+(branching degree, slack, -len), the same order with the same tie breakers.
+
+The heap is lazy:  an entry is pushed whenever the key of a column decreases
+(its len drops in hide() or tweak(), its bound is restored on backtracking or
+it is uncovered), while entries whose column was covered or whose key has
+since increased are only dropped, or refreshed, when they reach the top.  The
+top entry is then always the column of least key.  The heap is rebuilt from
+the active columns whenever stale entries make it too large.
+
+The branching order relies on every change going through open_level(),
+next_branch(), close_level(), include() and exclude(), so solutions() runs the
+iterative search.  Columns tied on the full key are taken in heap order, and a
+column of branching degree 0 is only returned once it is the least, so the
+search tree may differ from that of AlgorithmM (the solutions found are the
+same).  When a heuristic or a random number generator is set the column
+is chosen as by AlgorithmM.
+"""
+
+import heapq
+from itertools import count
+
+from .algorithm_m import AlgorithmM
+
+
+class IndexedAlgorithmM(AlgorithmM):
+    """
+    Algorithm M solution generator class choosing columns with a heap.
+    """
+
+    def __init__(self, root, heuristic=None):
+        super().__init__(root, heuristic)
+        self.heap = []
+        self.sequence = count()
+        self.rebuild()
+        self.columns = len(self.heap)
+
+    def rebuild(self):
+        """
+        Rebuild the heap from the active primary columns.
+        """
+        self.heap = []
+        column = self.root.r
+
+        while column != self.root:
+            self.heap.append(self.entry(column))
+            column = column.r
+
+        heapq.heapify(self.heap)
+
+    def entry(self, column):
+        """
+        Return a heap entry holding the current key of column.
+        """
+        return (
+            (column.len + 1) - (column.bound - column.slack),
+            column.slack,
+            -column.len,
+            next(self.sequence),
+            column,
+        )
+
+    def push(self, column):
+        """
+        Record the current key of a primary column, whose key may have
+        decreased.
+        """
+        heap = self.heap
+
+        if len(heap) > 4 * self.columns + 64:
+            self.rebuild()
+
+        else:
+            heapq.heappush(heap, self.entry(column))
+
+    def solutions(self, assume=()):
+        """
+        Generate solutions to the multiple cover with color (MCC) problem with
+        the iterative search.
+        """
+        yield from self.iterative_solutions(assume)
+
+    def get_branching_degree(self):
+        """
+        Find the column with the smallest branching degree from the heap.  If
+        a heuristic or a random number generator is set, the column is chosen
+        as by AlgorithmM.
+        """
+        if self.heuristic is not None or self.random is not None:
+            return super().get_branching_degree()
+
+        heap = self.heap
+
+        while heap:
+            top = heap[0]
+            column = top[-1]
+
+            if column.l.r is not column:
+                heapq.heappop(heap)
+                continue
+
+            entry = self.entry(column)
+
+            if entry[:3] == top[:3]:
+                return column, top[0]
+
+            heapq.heapreplace(heap, entry)
+
+        return None, 2**64
+
+    def next_branch(self, level):
+        """
+        Undo the row currently tried at level and try the next one, recording
+        the column once it is restored.
+        """
+        if super().next_branch(level):
+            return True
+
+        self.push(level.column)
+        return False
+
+    def close_level(self, level):
+        """
+        Undo everything done at level, recording the column once it is
+        restored.
+        """
+        super().close_level(level)
+        self.push(level.column)
+
+    def exclude(self, anchor):
+        """
+        Revert the effects of include(), recording the primary columns whose
+        bounds were restored.
+        """
+        super().exclude(anchor)
+        node = anchor
+
+        while True:
+            if node.header.primary:
+                self.push(node.header)
+
+            node = node.r
+
+            if node == anchor:
+                break
+
+    def uncommit_columns(self, row):
+        """
+        Uncommit the columns appearing in row, recording the primary columns
+        whose bounds were restored.
+        """
+        super().uncommit_columns(row)
+        column = row.r
+
+        while column != row:
+            if column.header.primary:
+                self.push(column.header)
+
+            column = column.r
+
+    def uncover(self, column):
+        """
+        Uncover a column, recording it if it is primary.
+        """
+        super().uncover(column)
+
+        if column.header.primary:
+            self.push(column.header)
+
+    def hide(self, row):
+        """
+        Hide a row by removing up/down links for every node in the row,
+        recording the primary columns which lost a node.
+        """
+        node = row.r
+
+        while node != row:
+            if node.color >= 0:
+                node.unlink_vertical()
+                header = node.header
+                header.len -= 1
+
+                if header.primary:
+                    self.push(header)
+
+            node = node.r
+
+    def tweak(self, row, hide=True):
+        """
+        Remove the row from consideration in future solutions, recording its
+        column.
+        """
+        super().tweak(row, hide)
+        self.push(row.header)
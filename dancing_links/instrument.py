@@ -0,0 +1,275 @@
+"""
+Optional instrumentation of the AlgorithmX, AlgorithmC and AlgorithmM solvers.
+
+Attaching an Instrument to a solver shadows some of its methods with counting
+wrappers on that instance only.  The solver classes are never modified, so
+solvers without an attached Instrument (and the solver once detached) run the
+original methods with no overhead.
+
+The figures follow Knuth's reports for DLX1/DLX2/DLX3:
+
+updates:  links removed from the structure, i.e. nodes hidden from their
+columns, headers covered and rows tweaked.  Restoring a link is not counted as
+every removal is eventually undone.
+
+mems:  a simplified count of memory accesses:  one per node or header visited
+by cover(), hide(), uncover(), unhide(), purify(), unpurify() and tweak(), and
+one per column in the item list when choosing a column to branch on.
+
+nodes and solutions:  nodes of the search tree, and the nodes which are
+solutions.  The profile records, for each depth (the number of options chosen
+so far), the number of nodes, the solutions and the total branching degree of
+the columns branched on.
+
+The nodes entered by replay() belong to the search which generated the
+prefix, so they are left out of the nodes and the profile (their updates and
+mems are still counted).  Options assumed with include() are not part of the
+search tree and do not count toward the depth.
+"""
+
+import json
+
+
+class Instrument:
+    """
+    Count the updates, mems, nodes and solutions of a solver, and the search
+    profile per depth.  Use as a context manager, or call attach() and
+    detach().
+    """
+
+    WRAPPED = ("cover", "uncover", "hide", "unhide", "purify", "unpurify", "tweak")
+    SHADOWED = WRAPPED + (
+        "solved",
+        "get_min_column",
+        "get_branching_degree",
+        "replay",
+        "include",
+        "exclude",
+    )
+
+    def __init__(self, solver):
+        self.solver = solver
+        self.updates = 0
+        self.mems = 0
+        self.nodes = 0
+        self.solutions = 0
+        self.levels = []
+        self.paused = 0
+        self.assumed = 0
+
+    def __enter__(self):
+        self.attach()
+        return self
+
+    def __exit__(self, *args):
+        self.detach()
+
+    def attach(self):
+        """
+        Shadow the methods of the solver with counting wrappers.
+        """
+        solver = self.solver
+        self.assumed = len(solver.solution_stack)
+
+        for name in self.WRAPPED:
+            if hasattr(solver, name):
+                self.wrap(name, getattr(self, f"count_{name}"))
+
+        self.wrap("solved", None, self.count_solved)
+
+        for name in ("get_min_column", "get_branching_degree"):
+            if hasattr(solver, name):
+                self.wrap(name, None, self.count_branching)
+
+        self.wrap("include", None, self.count_include)
+        self.wrap("exclude", self.count_exclude)
+        self.pause("replay")
+
+    def detach(self):
+        """
+        Remove the wrappers, restoring the original methods.
+        """
+        for name in self.SHADOWED:
+            self.solver.__dict__.pop(name, None)
+
+    def wrap(self, name, before, after=None):
+        """
+        Shadow the method name of the solver, calling before with its
+        arguments and after with its result.
+        """
+        original = getattr(self.solver, name)
+
+        if after is None:
+
+            def wrapper(*args, **kwargs):
+                before(*args)
+                return original(*args, **kwargs)
+
+        else:
+
+            def wrapper(*args, **kwargs):
+                result = original(*args, **kwargs)
+                after(result)
+                return result
+
+        setattr(self.solver, name, wrapper)
+
+    def pause(self, name):
+        """
+        Shadow the method name of the solver, leaving the nodes and the
+        profile untouched while it runs.
+        """
+        original = getattr(self.solver, name)
+
+        def wrapper(*args, **kwargs):
+            self.paused += 1
+
+            try:
+                return original(*args, **kwargs)
+
+            finally:
+                self.paused -= 1
+
+        setattr(self.solver, name, wrapper)
+
+    def level(self):
+        """
+        Return the profile entry for the current depth.
+        """
+        depth = len(self.solver.solution_stack) - self.assumed
+
+        while len(self.levels) <= depth:
+            self.levels.append({"nodes": 0, "solutions": 0, "branches": 0})
+
+        return self.levels[depth]
+
+    def count_solved(self, solved):
+        """
+        Count a node of the search tree.
+        """
+        if self.paused:
+            return
+
+        level = self.level()
+        level["nodes"] += 1
+        self.nodes += 1
+
+        if solved:
+            level["solutions"] += 1
+            self.solutions += 1
+
+    def count_branching(self, result):
+        """
+        Record the branching degree of the chosen column, and the columns
+        examined to choose it.
+        """
+        if isinstance(result, tuple):
+            degree = result[1]
+        else:
+            degree = result.multiplicity
+
+        if not self.paused:
+            self.level()["branches"] += max(degree, 0)
+
+        root = self.solver.root
+        column = root.r
+
+        while column != root:
+            self.mems += 1
+            column = column.r
+
+    def count_include(self, _anchor):
+        """
+        Count an assumed option.
+        """
+        self.assumed += 1
+
+    def count_exclude(self, _anchor):
+        """
+        Count an assumed option being excluded again.
+        """
+        self.assumed -= 1
+
+    def count_cover(self, column):
+        """
+        Count the header removed by cover() and the rows it visits.
+        """
+        header = column.header
+        self.updates += 1
+        self.mems += 1 + length(header)
+
+    def count_uncover(self, column):
+        """
+        Count the rows visited by uncover().
+        """
+        self.mems += 1 + length(column.header)
+
+    def count_hide(self, row):
+        """
+        Count the nodes removed and visited by hide().
+        """
+        node = row.r
+
+        while node != row:
+            self.mems += 1
+
+            if getattr(node, "color", 0) >= 0:
+                self.updates += 1
+
+            node = node.r
+
+    def count_unhide(self, row):
+        """
+        Count the nodes visited by unhide().
+        """
+        node = row.l
+
+        while node != row:
+            self.mems += 1
+            node = node.l
+
+    def count_purify(self, node):
+        """
+        Count the rows visited by purify().
+        """
+        self.mems += 1 + length(node.header)
+
+    def count_unpurify(self, node):
+        """
+        Count the rows visited by unpurify().
+        """
+        self.mems += 1 + length(node.header)
+
+    def count_tweak(self, _row):
+        """
+        Count the row removed by tweak().
+        """
+        self.updates += 1
+        self.mems += 1
+
+    def profile(self):
+        """
+        Return the counts and the per depth profile as a dictionary.
+        """
+        return {
+            "updates": self.updates,
+            "mems": self.mems,
+            "nodes": self.nodes,
+            "solutions": self.solutions,
+            "levels": [
+                dict(level, depth=depth) for depth, level in enumerate(self.levels)
+            ],
+        }
+
+    def dump(self, stream):
+        """
+        Write the profile to a text stream as JSON.
+        """
+        json.dump(self.profile(), stream, indent=2)
+
+
+def length(header):
+    """
+    Return the number of rows in the column of header.
+    """
+    return header.len if hasattr(header, "len") else header.multiplicity
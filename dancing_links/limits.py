@@ -0,0 +1,99 @@
+"""
+Node budgets, deadlines, cancellation and progress reports for a search.
+
+A Limits object is a search hook (see IterativeSearch.search()).  It counts the
+nodes visited and raises StopSearch when the node budget is spent, the timeout
+has passed or the cancellation token is set.  The clock and the token are only
+checked every interval nodes, when the progress callback is also called.
+
+The progress callback receives a dictionary with the nodes visited so far, the
+current depth, the (index, total) pair of the branch taken at every level and
+Knuth's estimate of the fraction of the search tree already explored.
+"""
+
+import time
+
+from .search import StopSearch
+
+
+class Limits:
+    """
+    Search hook enforcing a node budget, a timeout (in seconds from the start
+    of the search) and a cancellation token (any object with an is_set()
+    method, such as a threading.Event), and reporting progress.  After the
+    search, reason is "nodes", "timeout" or "cancelled" if it was stopped, and
+    None if it completed.
+    """
+
+    def __init__(
+        self, max_nodes=None, timeout=None, cancel=None, progress=None, interval=1000
+    ):
+        self.max_nodes = max_nodes
+        self.timeout = timeout
+        self.cancel = cancel
+        self.progress = progress
+        self.interval = interval
+        self.deadline = None
+        self.nodes = 0
+        self.reason = None
+
+    def start(self):
+        """
+        Reset the counts and start the clock.
+        """
+        self.nodes = 0
+        self.reason = None
+
+        if self.timeout is not None:
+            self.deadline = time.monotonic() + self.timeout
+
+    def __call__(self, levels):
+        if self.nodes == self.max_nodes:
+            self.stop("nodes")
+
+        self.nodes += 1
+
+        if (self.nodes - 1) % self.interval:
+            return
+
+        if self.cancel is not None and self.cancel.is_set():
+            self.stop("cancelled")
+
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            self.stop("timeout")
+
+        if self.progress is not None:
+            branches = [(level.index, level.total) for level in levels]
+            self.progress(
+                {
+                    "nodes": self.nodes,
+                    "depth": len(levels),
+                    "branches": branches,
+                    "fraction": fraction(branches),
+                }
+            )
+
+    def stop(self, reason):
+        """
+        Record why the search is stopped and stop it.
+        """
+        self.reason = reason
+        raise StopSearch(reason)
+
+
+def fraction(branches):
+    """
+    Estimate the fraction of the search tree explored before the current node
+    from the (index, total) pairs of the branches leading to it:  each level
+    splits the share of its parent evenly among its branches, and the branches
+    before the current one are explored.
+    """
+    explored = 0.0
+    share = 1.0
+
+    for index, total in branches:
+        total = max(total or 0, index + 1)
+        share /= total
+        explored += index * share
+
+    return explored
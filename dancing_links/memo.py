@@ -0,0 +1,205 @@
+"""
+Memoized solution counting for AlgorithmX and AlgorithmC, after Knuth's
+Algorithm Z.
+
+The problem left at a node of the search tree only depends on the items
+covered by the options chosen so far and, for AlgorithmC, on the colors they
+gave to secondary items:  every option still available is one whose items are
+not covered and whose colors agree.  Different paths reaching the same
+residual problem (e.g. tilings placing the same pieces in a different order)
+have the same number of solutions, so the count is cached under a signature
+of that state:  a bit mask of the covered items and the set of (item bit,
+color) pairs.  The signatures are relative to the state when count() is
+called and the cache is cleared on every call.
+
+The number of distinct residual problems depends on the branching order:  a
+tiling of a long narrow board only has few of them when the columns chosen
+sweep it across its short side, which the default heuristic does when the
+board is given with its short side first.
+
+AlgorithmM is not supported:  its tweaks remove options depending on the
+branches taken, so the residual problem is not a function of the items
+covered.
+"""
+
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Mapping with at most capacity entries, evicting the least recently used
+    entry when full, which counts its hits and misses.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        """
+        Return the value cached for key, or None.
+        """
+        value = self.entries.get(key)
+
+        if value is None:
+            self.misses += 1
+
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+
+        return value
+
+    def put(self, key, value):
+        """
+        Cache value for key, evicting the least recently used entry if the
+        cache is full.
+        """
+        self.entries[key] = value
+
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """
+        Remove every entry and reset the statistics.
+        """
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def hit_rate(self):
+        """
+        Return the fraction of lookups answered from the cache.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class MemoCounter:
+    """
+    Count the solutions of an AlgorithmX or AlgorithmC solver, caching the
+    count of every residual problem in an LRU cache of the given capacity.
+    The cache statistics of the last count are kept in cache.
+    """
+
+    def __init__(self, solver, capacity=2**20):
+        if hasattr(solver, "tweak"):
+            raise ValueError(f"{type(solver).__name__} cannot be memoized")
+
+        self.solver = solver
+        self.cache = LRUCache(capacity)
+        self.signatures = {}
+
+    def count(self):
+        """
+        Count the solutions below the current state of the solver.  The
+        structure is restored before returning.
+        """
+        self.cache.clear()
+        self.signatures = self.option_signatures()
+        return self.evaluate(0, frozenset())
+
+    def option_signatures(self):
+        """
+        Map every node of the options still available to the signature of its
+        option:  the mask of its items and the colors it gives.  Items already
+        colored (nodes with color -1) are part of the state and left out.
+        """
+        solver = self.solver
+        bits = {}
+        signatures = {}
+        column = solver.root.r
+
+        while column != solver.root:
+            row = column.d
+
+            while row != column:
+                if row not in signatures:
+                    mask = 0
+                    colors = []
+                    node = row
+
+                    while True:
+                        bit = bits.setdefault(node.header, 1 << len(bits))
+
+                        if getattr(node, "color", 0) >= 0:
+                            mask |= bit
+
+                        if getattr(node, "color", 0) > 0:
+                            colors.append((bit, node.color))
+
+                        node = node.r
+
+                        if node == row:
+                            break
+
+                    signature = (mask, frozenset(colors))
+
+                    while True:
+                        signatures[node] = signature
+                        node = node.r
+
+                        if node == row:
+                            break
+
+                row = row.d
+
+            column = column.r
+
+        return signatures
+
+    def evaluate(self, mask, colors):
+        """
+        Return the value of the residual problem with signature (mask,
+        colors), from the cache if it was seen before:  1 for a solved
+        problem, otherwise the values of its branches folded by combine(),
+        starting from 0.
+        """
+        solver = self.solver
+
+        if solver.solved():
+            return 1
+
+        key = (mask, colors)
+        total = self.cache.get(key)
+
+        if total is not None:
+            return total
+
+        total = 0
+        level = solver.open_level()
+
+        if level is not None:
+            while solver.next_branch(level):
+                option_mask, option_colors = self.signatures[level.row]
+                value = self.evaluate(
+                    mask | option_mask,
+                    colors | option_colors if option_colors else colors,
+                )
+                total = self.combine(total, level.row, value)
+
+        self.cache.put(key, total)
+        return total
+
+    def combine(self, total, row, value):  # pylint: disable=unused-argument
+        """
+        Fold the value of the branch choosing the option of row into the
+        total of the branches before it.
+        """
+        return total + value
+
+
+def count_solutions(solver, capacity=2**20):
+    """
+    Count the solutions of solver with a MemoCounter of the given capacity.
+    """
+    return MemoCounter(solver, capacity).count()
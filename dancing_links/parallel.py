@@ -0,0 +1,362 @@
+"""
+Parallel search over a process pool.
+
+The top of the search tree is enumerated in the calling process down to a fixed
+depth.  Every node at that depth is described by its prefix:  the branch index
+chosen at each level above it.  Each worker rebuilds the problem, replays its
+prefix and finishes that subtree.  Results are merged in prefix order, which is
+the order the sequential search would produce them in.
+
+Static splitting balances badly when one subtree holds most of the work, so
+WorkStealingSearch splits dynamically instead:  when a worker is idle, a busy
+worker hands over the unexplored branches at its shallowest level as a new
+prefix.
+
+The problem is described by a factory, a picklable callable (e.g. a module
+level function) returning the root of the linked structure.  Every worker
+process builds the problem once and restores it after each subtree.  Solutions
+are returned as the row attribute of each chosen node, since nodes cannot be
+sent between processes, so every node needs its row set (as Problem.build() and
+the DLX loader do):  solutions() checks the problem in the calling process and
+raises ValueError otherwise.
+"""
+
+import multiprocessing
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+from .array_x import collect
+
+WORKER = {}
+
+
+class ParallelSearch:
+    """
+    Split the search tree of a problem at a fixed depth and search the
+    subtrees in a process pool.
+    """
+
+    def __init__(self, solver_class, factory, args=(), depth=2, max_workers=None):
+        self.solver_class = solver_class
+        self.factory = factory
+        self.args = args
+        self.depth = depth
+        self.max_workers = max_workers
+
+    def prefixes(self):
+        """
+        Return the prefixes of the nodes at the split depth.
+        """
+        solver = self.solver_class(self.factory(*self.args))
+        return list(solver.prefixes(self.depth))
+
+    def count_solutions(self):
+        """
+        Count the solutions of every subtree in parallel and return the total.
+        """
+        return sum(self.map(count_prefix))
+
+    def solutions(self):
+        """
+        Generate the solutions of every subtree, in the same order as the
+        sequential search.
+        """
+        check_rows(self.factory(*self.args))
+
+        for solutions in self.map(solve_prefix):
+            yield from solutions
+
+    def map(self, function):
+        """
+        Apply function to every prefix in the process pool, returning the
+        results in prefix order.
+        """
+        prefixes = self.prefixes()
+        workers = self.max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(prefixes) // (4 * workers))
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_worker,
+            initargs=(self.solver_class, self.factory, self.args),
+        ) as executor:
+            yield from executor.map(function, prefixes, chunksize=chunksize)
+
+
+class WorkStealingSearch:
+    """
+    Search a problem with a pool of worker processes which split their work
+    on demand.
+
+    Every task is a prefix whose last index is open ended:  the worker searches
+    that branch and the remaining branches after it at the same level.  A
+    coordinator (the calling process) hands out tasks and tracks the
+    outstanding ones.  While a worker is idle and no task is queued, busy
+    workers check every check_interval nodes whether to give up the branches
+    after the current one at their shallowest level that has not been split
+    yet.
+    """
+
+    def __init__(
+        self, solver_class, factory, args=(), max_workers=None, check_interval=1000
+    ):
+        self.solver_class = solver_class
+        self.factory = factory
+        self.args = args
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.check_interval = check_interval
+
+    def count_solutions(self):
+        """
+        Count the solutions.
+        """
+        return sum(result for _, result in self.run(count_only=True))
+
+    def solutions(self):
+        """
+        Generate the solutions, in the same order as the sequential search.
+        Solutions are collected from every worker before the first is
+        returned.
+        """
+        check_rows(self.factory(*self.args))
+
+        for _, solutions in sorted(self.run(count_only=False), key=first):
+            yield from solutions
+
+    def run(self, count_only):
+        """
+        Run the workers until every task is done and return the (prefix,
+        result) pair of every task.
+        """
+        tasks = multiprocessing.Queue()
+        results = multiprocessing.Queue()
+        hungry = multiprocessing.RawValue("b", 0)
+        workers = [
+            multiprocessing.Process(
+                target=steal_worker,
+                args=(
+                    (self.solver_class, self.factory, self.args),
+                    (tasks, results, hungry),
+                    count_only,
+                    self.check_interval,
+                ),
+                daemon=True,
+            )
+            for _ in range(self.max_workers)
+        ]
+
+        for worker in workers:
+            worker.start()
+
+        try:
+            collected = self.coordinate(tasks, results, hungry)
+
+        except BaseException:
+            # The other workers may be blocked flushing results which will
+            # never be read, so they would not reach a None task.
+            for worker in workers:
+                worker.terminate()
+
+            raise
+
+        else:
+            for worker in workers:
+                tasks.put(None)
+
+        finally:
+            for worker in workers:
+                worker.join()
+
+        return collected
+
+    def coordinate(self, tasks, results, hungry):
+        """
+        Hand out tasks until none are outstanding.  Workers report when they
+        start a task, the prefixes they give away and the result of each task.
+        """
+        collected = []
+        tasks.put([])
+        queued = outstanding = 1
+        busy = 0
+
+        while outstanding:
+            message = results.get()
+
+            if message[0] == "start":
+                queued -= 1
+                busy += 1
+
+            elif message[0] == "donate":
+                tasks.put(message[1])
+                queued += 1
+                outstanding += 1
+
+            elif message[0] == "done":
+                collected.append((message[1], message[2]))
+                busy -= 1
+                outstanding -= 1
+
+            else:
+                raise RuntimeError(f"worker failed:\n{message[1]}")
+
+            hungry.value = int(queued == 0 and busy < self.max_workers)
+
+        return collected
+
+
+def steal_worker(problem, queues, count_only, check_interval):
+    """
+    Worker process for WorkStealingSearch:  run tasks until a None task is
+    received.
+    """
+    solver_class, factory, args = problem
+    tasks, results, hungry = queues
+
+    try:
+        solver = solver_class(factory(*args))
+
+        for prefix in iter(tasks.get, None):
+            results.put(("start",))
+            donations = Donations(results, hungry, check_interval)
+            result = search_stolen(solver, prefix, count_only, donations)
+            results.put(("done", prefix, result))
+
+    except Exception:  # pylint: disable=broad-exception-caught
+        results.put(("error", traceback.format_exc()))
+
+
+def search_stolen(solver, prefix, count_only, hook=None):
+    """
+    Search the branch given by the last index of prefix and the remaining
+    branches after it at that level.  The levels above belong to other tasks,
+    so they are marked as already split.  Return the number of solutions, or
+    the solutions themselves.
+    """
+    floor = max(len(prefix) - 1, 0)
+
+    try:
+        if not solver.replay(prefix):
+            return 0 if count_only else []
+
+        for level in solver.level_stack[:floor]:
+            level.last = level.index
+
+        search = solver.search(floor=floor, hook=hook)
+
+        if count_only:
+            return sum(1 for _ in search)
+
+        return [encode(solver.get_solution()) for _ in search]
+
+    finally:
+        solver.unwind()
+
+
+class Donations:
+    """
+    Search hook giving away work while the coordinator reports idle workers.
+    """
+
+    def __init__(self, results, hungry, check_interval):
+        self.results = results
+        self.hungry = hungry
+        self.check_interval = check_interval
+        self.nodes = 0
+
+    def __call__(self, levels):
+        self.nodes += 1
+
+        if self.nodes % self.check_interval == 0 and self.hungry.value:
+            prefix = split(levels)
+
+            if prefix is not None:
+                self.results.put(("donate", prefix))
+
+
+def split(levels):
+    """
+    Give up the branches after the current one at the shallowest level which
+    has not been split yet.  Return the prefix of the branches given up, or
+    None if every level has already been split.
+    """
+    for depth, level in enumerate(levels):
+        if level.last is None:
+            level.last = level.index
+            return [other.index for other in levels[:depth]] + [level.index + 1]
+
+    return None
+
+
+def first(pair):
+    """
+    Return the first element of a pair.
+    """
+    return pair[0]
+
+
+def init_worker(solver_class, factory, args):
+    """
+    Build the solver used by every task run in this process.
+    """
+    WORKER["solver"] = solver_class(factory(*args))
+
+
+def count_prefix(prefix):
+    """
+    Count the solutions below prefix.
+    """
+    solver = WORKER["solver"]
+
+    try:
+        if not solver.replay(prefix):
+            return 0
+
+        return solver.count_solutions()
+
+    finally:
+        solver.unwind()
+
+
+def solve_prefix(prefix):
+    """
+    Return the solutions below prefix, with each chosen node replaced by its
+    row.
+    """
+    solver = WORKER["solver"]
+
+    try:
+        if not solver.replay(prefix):
+            return []
+
+        return [encode(solution) for solution in solver.iterative_solutions()]
+
+    finally:
+        solver.unwind()
+
+
+def check_rows(root):
+    """
+    Raise ValueError unless every node of the linked structure rooted at root
+    has its row set.
+    """
+    primary = []
+    column = root.r
+
+    while column != root:
+        primary.append(column)
+        column = column.r
+
+    for row in collect(primary)[1]:
+        if any(node.row is None for node in row):
+            raise ValueError(
+                "every node needs its row set to report solutions from workers"
+            )
+
+
+def encode(solution):
+    """
+    Replace the nodes of a solution by their rows.  Solutions from AlgorithmM
+    already hold rows and are returned unchanged.
+    """
+    return [getattr(option, "row", option) for option in solution]
@@ -0,0 +1,308 @@
+"""
+Preprocessing of a Problem before search, in the spirit of Knuth's DLX-PRE and
+the preprocessing of SSXCC.
+
+The reductions below never change the solutions, and are repeated until none
+applies:
+
+Options with no primary item are removed, as the solvers never choose them.
+
+An option blocks a primary item when fewer options containing that item than
+its lower bound are compatible with it.  Two options are compatible when they
+can appear in the same solution:  every primary item they share has an upper
+bound of at least 2, and every secondary item they share has the same color in
+both.  A blocking option is removed.
+
+A primary item with exactly as many options as its lower bound forces those
+options into every solution.  They are applied immediately:  the options
+incompatible with them are removed, the bounds of their primary items are
+lowered (removing the items whose upper bound reaches 0), and their secondary
+items are dropped, as the options left agree with them.
+
+A primary item with the same options and the same bounds as another
+duplicates it.  It adds no constraint and is removed.  This is only the
+simplest case of the dominance checks of DLX-PRE:  when the options of one
+item are a strict subset of the options of another, the options containing
+the second item but not the first are kept.
+
+The options left form the reduced problem, in their original order.  Reduction
+maps its solutions back to the original option indices, adding the forced
+options.  When the preprocessing finds the problem has no solution, the
+reduced problem is an unsatisfiable primary item with no options.
+"""
+
+from .builder import Problem
+
+
+class Reduction:
+    """
+    The result of preprocess():  the reduced problem, the original index of
+    each of its options and the original indices of the forced options.
+    """
+
+    def __init__(self, problem, options, forced):
+        self.problem = problem
+        self.options = options
+        self.forced = forced
+
+    def restore(self, solution):
+        """
+        Return the original option indices of a solution of the reduced
+        problem, given as option indices or as nodes (the row attribute of
+        the nodes built by Problem.build()).
+        """
+        rows = (getattr(option, "row", option) for option in solution)
+        return sorted(self.forced + [self.options[row] for row in rows])
+
+
+class Infeasible(Exception):
+    """
+    Raised while preprocessing when a primary item cannot be satisfied.
+    """
+
+    def __init__(self, item):
+        super().__init__(item)
+        self.item = item
+
+
+def preprocess(problem):
+    """
+    Reduce problem and return a Reduction.
+    """
+    state = State(problem)
+
+    try:
+        state.reduce()
+
+    except Infeasible as error:
+        return Reduction(Problem([], [error.item]), [], [])
+
+    return state.reduction()
+
+
+class State:
+    """
+    The options and items of a problem being reduced.  Each option is kept as
+    a dictionary mapping its items to their colors (None for no color), and
+    every item maps to the set of option indices containing it.
+    """
+
+    def __init__(self, problem):
+        self.problem = problem
+        self.primary = list(problem.primary)
+        self.secondary = list(problem.secondary)
+        self.bounds = {item: problem.bounds.get(item, (1, 1)) for item in self.primary}
+        self.options = {}
+        self.containing = {item: set() for item in self.primary + self.secondary}
+        self.forced = []
+
+        for index, option in enumerate(problem.options):
+            items = {}
+
+            for item in option:
+                name, color = item if isinstance(item, tuple) else (item, None)
+
+                if name not in self.containing:
+                    raise ValueError(f"unknown item {name!r} in option {index}")
+
+                items[name] = color
+                self.containing[name].add(index)
+
+            self.options[index] = items
+
+    def reduce(self):
+        """
+        Apply the reductions until none applies.
+        """
+        changed = True
+
+        while changed:
+            changed = self.remove_secondary_only()
+            changed |= self.apply_forced()
+            changed |= self.remove_blocking()
+            changed |= self.remove_duplicate_items()
+
+    def remove(self, index):
+        """
+        Remove an option.
+        """
+        for name in self.options.pop(index):
+            self.containing[name].discard(index)
+
+    def compatible(self, first, second):
+        """
+        Check if two options can appear in the same solution.
+        """
+        items = self.options[second]
+
+        for name, color in self.options[first].items():
+            if name not in items:
+                continue
+
+            if name in self.bounds:
+                if self.bounds[name][1] < 2:
+                    return False
+
+            elif color is None or items[name] != color:
+                return False
+
+        return True
+
+    def remove_secondary_only(self):
+        """
+        Remove the options with no primary item.
+        """
+        removed = [
+            index
+            for index, items in self.options.items()
+            if not any(name in self.bounds for name in items)
+        ]
+
+        for index in removed:
+            self.remove(index)
+
+        return bool(removed)
+
+    def apply_forced(self):
+        """
+        Apply the options forced by an item with exactly as many options as
+        its lower bound.
+        """
+        for item in self.primary:
+            lower = self.bounds[item][0]
+            options = self.containing[item]
+
+            if len(options) < lower:
+                raise Infeasible(item)
+
+            if lower and len(options) == lower:
+                for index in sorted(options):
+                    self.force(index)
+
+                return True
+
+        return False
+
+    def force(self, index):
+        """
+        Include an option in every solution.
+        """
+        if index not in self.options:
+            return
+
+        neighbours = set()
+
+        for name in self.options[index]:
+            neighbours |= self.containing[name]
+
+        for other in sorted(neighbours - {index}):
+            if not self.compatible(index, other):
+                self.remove(other)
+
+        items = self.options[index]
+        self.remove(index)
+        self.forced.append(index)
+
+        for name in items:
+            if name in self.bounds:
+                lower, upper = self.bounds[name]
+                self.bounds[name] = (max(lower - 1, 0), upper - 1)
+
+                if upper == 1:
+                    self.drop_item(name)
+
+            else:
+                self.drop_item(name)
+
+    def drop_item(self, name):
+        """
+        Remove an item from the problem and from the options left.
+        """
+        for index in self.containing.pop(name):
+            del self.options[index][name]
+
+        if name in self.bounds:
+            del self.bounds[name]
+            self.primary.remove(name)
+
+        else:
+            self.secondary.remove(name)
+
+    def remove_blocking(self):
+        """
+        Remove the options which block a primary item.
+        """
+        removed = False
+
+        for index in sorted(self.options):
+            if index not in self.options:
+                continue
+
+            neighbours = set()
+
+            for name in self.options[index]:
+                neighbours |= self.containing[name]
+
+            conflicts = {}
+
+            for other in neighbours - {index}:
+                if not self.compatible(index, other):
+                    for name in self.options[other]:
+                        conflicts[name] = conflicts.get(name, 0) + 1
+
+            for name, count in conflicts.items():
+                if name not in self.bounds or name in self.options[index]:
+                    continue
+
+                if len(self.containing[name]) - count < self.bounds[name][0]:
+                    self.remove(index)
+                    removed = True
+                    break
+
+        return removed
+
+    def remove_duplicate_items(self):
+        """
+        Remove the primary items with the same options and bounds as an
+        earlier one.
+        """
+        seen = {}
+        duplicates = []
+
+        for item in self.primary:
+            key = (frozenset(self.containing[item]), self.bounds[item])
+
+            if key in seen:
+                duplicates.append(item)
+
+            else:
+                seen[key] = item
+
+        for item in duplicates:
+            self.drop_item(item)
+
+        return bool(duplicates)
+
+    def reduction(self):
+        """
+        Return the reduced problem and the mapping to the original options.
+        """
+        options = []
+        originals = []
+
+        for index, items in sorted(self.options.items()):
+            originals.append(index)
+            options.append(
+                [
+                    name if color is None else (name, color)
+                    for name, color in items.items()
+                ]
+            )
+
+        bounds = {
+            item: bounds
+            for item, bounds in self.bounds.items()
+            if item in self.problem.bounds or bounds != (1, 1)
+        }
+        problem = Problem(options, self.primary, self.secondary, bounds or None)
+        return Reduction(problem, originals, sorted(self.forced))
@@ -0,0 +1,142 @@
+"""
+Randomized search with restarts, for finding a first solution quickly.
+
+Every run shuffles the rows within each primary column and breaks ties in the
+column choice at random.  A run is abandoned once it has visited its node
+budget, and the next run starts from scratch with a fresh shuffle.  The budgets
+follow a restart policy:  a generator of multiples of the scale.  Since every
+policy here grows without bound, a run eventually completes, so the search
+stays complete:  a run that finishes within its budget without finding a
+solution proves there is none.  The result is deterministic for a given seed.
+"""
+
+import random
+
+from .search import StopSearch
+
+
+def first_solution(solver, seed=None, policy=None, scale=100):
+    """
+    Find a solution with randomized branching and restarts.  Return the
+    solution, or None if there is none.  The row order of every column is
+    restored afterwards.
+    """
+    rng = random.Random(seed)
+    budgets = luby() if policy is None else policy
+    orders = column_rows(solver.root)
+    solver.random = rng
+
+    try:
+        for budget in budgets:
+            for column, rows in orders:
+                shuffled = rows.copy()
+                rng.shuffle(shuffled)
+                link_rows(column, shuffled)
+
+            try:
+                for _ in solver.search(floor=0, hook=NodeBudget(budget * scale)):
+                    solution = solver.get_solution()
+                    solver.unwind()
+                    return solution
+
+                return None
+
+            except StopSearch:
+                solver.unwind()
+
+        return None
+
+    finally:
+        solver.random = None
+
+        for column, rows in orders:
+            link_rows(column, rows)
+
+
+class NodeBudget:
+    """
+    Search hook stopping the search once it has visited a number of nodes.
+    """
+
+    def __init__(self, nodes):
+        self.nodes = nodes
+
+    def __call__(self, levels):
+        self.nodes -= 1
+
+        if self.nodes < 0:
+            raise StopSearch
+
+
+def luby():
+    """
+    Generate the Luby sequence 1, 1, 2, 1, 1, 2, 4, 1, 1, 2, ... using Knuth's
+    'reluctant doubling' recurrence.
+    """
+    u, v = 1, 1
+
+    while True:
+        yield v
+
+        if u & -u == v:
+            u, v = u + 1, 1
+        else:
+            v *= 2
+
+
+def geometric(factor=2):
+    """
+    Return a generator of the budgets 1, factor, factor**2, ... rounded down.
+    The factor must be greater than 1 for the budgets to grow.
+    """
+    if factor <= 1:
+        raise ValueError(f"geometric factor must be greater than 1, not {factor!r}")
+
+    return powers(factor)
+
+
+def powers(factor):
+    """
+    Generate 1, factor, factor**2, ... rounded down.
+    """
+    budget = 1
+
+    while True:
+        yield int(budget)
+        budget *= factor
+
+
+def column_rows(root):
+    """
+    Return every primary column together with its rows, from top to bottom.
+    """
+    orders = []
+    column = root.r
+
+    while column != root:
+        rows = []
+        row = column.d
+
+        while row != column:
+            rows.append(row)
+            row = row.d
+
+        orders.append((column, rows))
+        column = column.r
+
+    return orders
+
+
+def link_rows(column, rows):
+    """
+    Relink the rows of a column in the given order.
+    """
+    prev = column
+
+    for row in rows:
+        prev.d = row
+        row.u = prev
+        prev = row
+
+    prev.d = column
+    column.u = prev
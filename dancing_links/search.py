@@ -0,0 +1,439 @@
+"""
+Non-recursive search shared by the AlgorithmX, AlgorithmC and AlgorithmM
+solvers.
+"""
+
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+
+
+class StopSearch(Exception):
+    """
+    Raised by a search hook to stop the search.  The hook is called before a
+    node is examined, so the level stack is consistent and unwind() restores
+    the structure.
+    """
+
+
+class Level:
+    """
+    One level of the explicit search stack:  the column being branched on, the
+    row currently tried in it, the index of that branch and the number of
+    branches expected when the column was chosen.  When last is set, the level
+    is closed after that branch instead of trying the next one (the remaining
+    branches were handed to another worker).  AlgorithmM also keeps the first
+    tweaked row so the tweaks can be undone when the level is closed.
+    """
+
+    __slots__ = ("column", "row", "index", "last", "total", "first_tweak")
+
+    def __init__(self, column, first_tweak=None, total=None):
+        self.column = column
+        self.row = None
+        self.index = -1
+        self.last = None
+        self.total = total
+        self.first_tweak = first_tweak
+
+    def __repr__(self):
+        return f"Level({self.column!r}, {self.row!r})"
+
+
+class IterativeSearch(ABC):
+    """
+    Mixin providing an iterative search loop with an explicit level stack, in
+    the style of steps X1-X8 of Algorithm X.
+
+    A solver using the mixin provides root, level_stack and solution_stack
+    attributes, the cover(), uncover(), commit_columns() and
+    uncommit_columns() operations used by include() and three methods:
+
+    open_level():  choose a column and prepare to branch on it.  Return a
+    Level, or None when the column shows the current branch is a dead end.
+
+    next_branch(level):  undo the row currently tried at level (if any) and
+    try the next one.  Return False, with the level fully undone, when there
+    are no more rows to try.
+
+    close_level(level):  undo the row currently tried at level (if any) and
+    the preparation done by open_level(), without trying further rows.
+    """
+
+    root = None
+    level_stack = None
+    solution_stack = None
+
+    def iterative_solutions(self, assume=()):
+        """
+        Generate the same solutions as solutions(), without recursion.  Each
+        solution is yielded once rather than through a chain of generators.
+        Closing the generator early restores the structure.
+        """
+        if assume:
+            with self.assuming(assume):
+                yield from self.iterative_solutions()
+
+            return
+
+        for _ in self.search():
+            try:
+                yield self.get_solution()
+
+            except GeneratorExit:
+                self.unwind()
+                raise
+
+    def count_solutions(self, per_level=False):
+        """
+        Count the solutions without materializing them.  With per_level, return
+        (count, counts) where counts[depth] is the number of solutions found
+        at that depth of the search.
+        """
+        if not per_level:
+            return sum(1 for _ in self.search())
+
+        counts = []
+        levels = self.level_stack
+
+        for _ in self.search():
+            depth = len(levels)
+
+            while len(counts) <= depth:
+                counts.append(0)
+
+            counts[depth] += 1
+
+        return sum(counts), counts
+
+    def has_solution(self):
+        """
+        Check if the problem has a solution, stopping at the first one found.
+        The structure is restored before returning.
+        """
+        for _ in self.search():
+            self.unwind()
+            return True
+
+        return False
+
+    @contextmanager
+    def assuming(self, rows):
+        """
+        Context manager including the options containing rows in the solution
+        (see include()), for searches run within it.  The options are excluded
+        again, in reverse order, on exit.
+        """
+        included = []
+
+        try:
+            for row in rows:
+                included.append(self.include(row))
+
+            yield
+
+        finally:
+            while included:
+                self.exclude(included.pop())
+
+    def unwind(self):
+        """
+        Close every open level, restoring the structure to its state before
+        the search started.
+        """
+        levels = self.level_stack
+
+        while levels:
+            self.close_level(levels.pop())
+
+    def close(self):
+        """
+        Restore the structure after an iterative search was abandoned.
+        """
+        self.unwind()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def limited_solutions(self, limits):
+        """
+        Generate solutions until the search is complete or stopped by limits
+        (a Limits hook).  When it is stopped, the structure is restored and
+        limits.reason tells why.  Closing the generator early also restores
+        the structure.
+        """
+        limits.start()
+
+        try:
+            for _ in self.search(hook=limits):
+                yield self.get_solution()
+
+        except StopSearch:
+            self.unwind()
+
+        except GeneratorExit:
+            self.unwind()
+            raise
+
+    def resumable_solutions(self, checkpoint):
+        """
+        Generate solutions, saving the search position to checkpoint as it
+        goes.  If checkpoint holds a saved position, the search resumes from
+        it:  the branches taken at each level are replayed, which also
+        reapplies any tweaks, and solutions continue from where the saved
+        search stopped.  Closing the generator saves the current position.
+        """
+        state = checkpoint.load()
+        levels = self.level_stack
+
+        if state is not None:
+            if state["path"] is None:
+                return
+
+            if not self.replay(state["path"]):
+                self.unwind()
+                raise ValueError("checkpoint does not match the problem")
+
+            checkpoint.nodes = state["nodes"]
+            checkpoint.solutions = state["solutions"]
+
+            if state["explored"] and not self.backtrack():
+                checkpoint.save(None)
+                return
+
+        try:
+            for _ in self.search(floor=0, hook=checkpoint):
+                checkpoint.solutions += 1
+                yield self.get_solution()
+
+        except GeneratorExit:
+            checkpoint.save(levels, explored=True)
+            self.unwind()
+            raise
+
+        checkpoint.save(None)
+
+    def prefixes(self, depth):
+        """
+        Generate the branch indices leading to every node at the given depth of
+        the search tree, and to every solution found above that depth.  Each
+        prefix can be passed to replay() to continue the search below it.
+        """
+        levels = self.level_stack
+
+        for _ in self.search(max_depth=depth):
+            yield [level.index for level in levels]
+
+    def replay(self, prefix):
+        """
+        Enter the branches given by prefix, a list of branch indices (one per
+        level) as generated by prefixes().  Return False if the prefix leads to
+        a dead end, in which case the levels entered so far are left open.
+        """
+        levels = self.level_stack
+
+        for index in prefix:
+            if self.solved():
+                return False
+
+            level = self.open_level()
+
+            if level is None:
+                return False
+
+            levels.append(level)
+
+            while level.index < index:
+                if not self.next_branch(level):
+                    levels.pop()
+                    return False
+
+        return True
+
+    def search(self, max_depth=None, floor=None, hook=None):
+        """
+        Run the search below the current position, yielding once for every
+        solution while the structure holds that solution.  Levels already on
+        the stack (from replay()) are not backtracked, unless floor is given:
+        then the levels from depth floor on are backtracked, so the remaining
+        branches of the level at that depth are searched as well.  With
+        max_depth, nodes at that depth are yielded as if they were solutions.
+        If given, hook is called with the level stack before each node.
+        """
+        levels = self.level_stack
+
+        if floor is None:
+            floor = len(levels)
+
+        while True:
+            if hook is not None:
+                hook(levels)
+
+            if self.solved() or len(levels) == max_depth:
+                yield
+
+            else:
+                level = self.open_level()
+
+                if level is not None:
+                    levels.append(level)
+
+            if not self.backtrack(floor):
+                return
+
+    def backtrack(self, floor=0):
+        """
+        Move on to the next node once the current one has been explored.
+        Return False when the levels from depth floor on are exhausted.
+        """
+        levels = self.level_stack
+
+        while len(levels) > floor:
+            level = levels[-1]
+
+            if level.index == level.last:
+                self.close_level(level)
+
+            elif self.next_branch(level):
+                return True
+
+            levels.pop()
+
+        return False
+
+    def include(self, row):
+        """
+        Assume an option is in the solution:  cover its first uncovered
+        primary column and commit its other columns as if it had been chosen.
+        The option is given by one of its nodes or by its row, the option
+        index set by Problem.build().  Return the node of that column, to pass
+        to exclude().  Raise ValueError if the option is no longer available,
+        e.g. because it conflicts with an option already assumed, or if it has
+        no primary item.
+        """
+        nodes = option_nodes(self.find_option(row))
+        active = set()
+        column = self.root.r
+
+        while column != self.root:
+            active.add(column)
+            column = column.r
+
+        if any(node.u.d is not node for node in nodes):
+            raise ValueError(f"option {row!r} is not available")
+
+        anchor = next((node for node in nodes if node.header in active), None)
+
+        if anchor is None:
+            # A secondary header is never linked into the root list.
+            if all(node.header.l is node.header for node in nodes):
+                raise ValueError(f"option {row!r} has no primary item")
+
+            raise ValueError(f"option {row!r} is not available")
+
+        self.cover(anchor)
+        self.commit_columns(anchor)
+        self.solution_stack.append(anchor)
+        return anchor
+
+    def exclude(self, anchor):
+        """
+        Revert the effects of include(), given its result.
+        """
+        self.solution_stack.pop()
+        self.uncommit_columns(anchor)
+        self.uncover(anchor)
+
+    def find_option(self, row):
+        """
+        Return a node of the option given by row, one of its nodes or its
+        option index.  Only options with an uncovered primary column are
+        found by index.
+        """
+        if not isinstance(row, int):
+            return row
+
+        column = self.root.r
+
+        while column != self.root:
+            node = column.d
+
+            while node != column:
+                if node.row == row:
+                    return node
+
+                node = node.d
+
+            column = column.r
+
+        raise ValueError(f"option {row!r} is not available or has no primary item")
+
+    @abstractmethod
+    def open_level(self):
+        """
+        Choose a column and prepare to branch on it.
+        """
+
+    @abstractmethod
+    def next_branch(self, level):
+        """
+        Move level on to its next row.
+        """
+
+    @abstractmethod
+    def close_level(self, level):
+        """
+        Undo everything done at level.
+        """
+
+    @abstractmethod
+    def cover(self, column):
+        """
+        Cover column.
+        """
+
+    @abstractmethod
+    def uncover(self, column):
+        """
+        Undo cover().
+        """
+
+    @abstractmethod
+    def commit_columns(self, row):
+        """
+        Commit the columns appearing in row, other than its own.
+        """
+
+    @abstractmethod
+    def uncommit_columns(self, row):
+        """
+        Undo commit_columns().
+        """
+
+    @abstractmethod
+    def solved(self):
+        """
+        Check if the problem is solved.
+        """
+
+    @abstractmethod
+    def get_solution(self):
+        """
+        Return a solution from the solution stack.
+        """
+
+
+def option_nodes(row):
+    """
+    Return the nodes of the option containing row, from row rightwards.
+    """
+    nodes = [row]
+    node = row.r
+
+    while node != row:
+        nodes.append(node)
+        node = node.r
+
+    return nodes
@@ -0,0 +1,97 @@
+"""
+Problems shared by the tests.
+"""
+
+import random
+from benchmarks import problems
+from ..algorithm_c import AlgorithmC
+from ..algorithm_m import AlgorithmM
+from ..algorithm_x import AlgorithmX
+from ..builder import Problem
+
+
+def queens_problem(n):
+    primary, secondary, options = problems.queens(n)
+    return Problem(options, primary, secondary)
+
+
+def colored_problem():
+    return Problem(
+        [
+            ("p", "q", "x", ("y", 1)),
+            ("p", "r", ("x", 1), "y"),
+            ("p", ("x", 2)),
+            ("q", ("x", 1)),
+            ("r", ("y", 2)),
+            ("p", ("x", 1)),
+            ("r", ("y", 1)),
+            ("q", "r", ("y", 1)),
+        ],
+        secondary=["x", "y"],
+    )
+
+
+def multiplicities_problem():
+    return Problem(
+        [
+            ("q",),
+            ("p", "q", "r"),
+            ("r", ("x", 1)),
+            ("q", "r", ("x", 2)),
+            ("r", ("x", 2)),
+            ("p", "r"),
+        ],
+        ["p", "q", "r"],
+        ["x"],
+        bounds={"p": (0, 1), "q": (1, 2), "r": (2, 3)},
+    )
+
+
+def random_problem(seed, bounded=False, colors=True):
+    rng = random.Random(seed)
+    primary = [f"p{i}" for i in range(rng.randint(3, 7))]
+    secondary = ["x", "y", "z"]
+    options = []
+
+    for _ in range(rng.randint(4, 14)):
+        option = rng.sample(primary, rng.randint(1, 3))
+
+        for item in secondary:
+            if rng.random() < 0.3:
+                color = rng.randint(1, 2) if colors and rng.random() < 0.7 else None
+                option.append(item if color is None else (item, color))
+
+        if rng.random() < 0.1:
+            option = option[len(option) // 2 :]
+
+        options.append(option)
+
+    bounds = None
+
+    if bounded:
+        bounds = {}
+
+        for item in primary:
+            lower = rng.randint(0, 2)
+            bounds[item] = (lower, max(lower, 1) + rng.randint(0, 1))
+
+    return Problem(options, primary, secondary, bounds)
+
+
+def queens(n):
+    return queens_problem(n).build(AlgorithmX)
+
+
+def colored():
+    return colored_problem().build(AlgorithmC)
+
+
+def multiplicities():
+    return multiplicities_problem().build(AlgorithmM)
+
+
+CASES = [
+    (AlgorithmX, queens, (6,)),
+    (AlgorithmC, colored, ()),
+    (AlgorithmM, multiplicities, ()),
+]
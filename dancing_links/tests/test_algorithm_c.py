@@ -151,3 +151,141 @@ class TestAlgorithmC(unittest.TestCase):
             solutions,
             [[["a", "d", "f"], ["b", "g"], ["c", "e"]]],
         )
+
+    def test_iterative(self):
+        """
+        Ensure the iterative search yields the same solutions, in the same
+        order, as the recursive search.
+        """
+        root = generate_graph(
+            primary=["p", "q", "r"],
+            secondary=["x", "y"],
+            constraints=[
+                ["p", "q", "x", "y:A"],
+                ["p", "r", "x:A", "y"],
+                ["p", "x:B"],
+                ["q", "x:A"],
+                ["r", "y:B"],
+                ["p", "x:A"],
+                ["r", "y:A"],
+                ["q", "r", "y:A"],
+            ],
+        )
+        expected = list(AlgorithmC(root).solutions())
+        actual = list(AlgorithmC(root).iterative_solutions())
+
+        self.assertEqual(len(expected), 6)
+        self.assertEqual(actual, expected)
+
+    def test_count_solutions(self):
+        """
+        Ensure solutions can be counted, and that has_solution() leaves the
+        structure intact.
+        """
+        root = generate_graph(
+            primary=["p", "q", "r"],
+            secondary=["x", "y"],
+            constraints=[
+                ["p", "q", "x", "y:A"],
+                ["p", "r", "x:A", "y"],
+                ["p", "x:B"],
+                ["q", "x:A"],
+                ["r", "y:B"],
+                ["p", "x:A"],
+                ["r", "y:A"],
+                ["q", "r", "y:A"],
+            ],
+        )
+        solver = AlgorithmC(root)
+        expected = list(solver.solutions())
+
+        self.assertEqual(solver.count_solutions(), 6)
+        self.assertEqual(solver.count_solutions(per_level=True), (6, [0, 0, 4, 2]))
+        self.assertTrue(solver.has_solution())
+        self.assertEqual(list(solver.solutions()), expected)
+
+    def test_close(self):
+        """
+        Ensure closing a solution generator after any number of solutions
+        restores the structure.
+        """
+        root = generate_graph(
+            primary=["p", "q", "r"],
+            secondary=["x", "y"],
+            constraints=[
+                ["p", "q", "x", "y:A"],
+                ["p", "r", "x:A", "y"],
+                ["p", "x:B"],
+                ["q", "x:A"],
+                ["r", "y:B"],
+                ["p", "x:A"],
+                ["r", "y:A"],
+                ["q", "r", "y:A"],
+            ],
+        )
+        solver = AlgorithmC(root)
+        expected = list(solver.solutions())
+
+        for count in range(len(expected) + 1):
+            for generate in (solver.solutions, solver.iterative_solutions):
+                with self.subTest(count=count, generator=generate.__name__):
+                    solutions = generate()
+                    self.assertEqual(
+                        [next(solutions) for _ in range(count)], expected[:count]
+                    )
+                    solutions.close()
+
+                    self.assertEqual(solver.solution_stack, [])
+                    self.assertEqual(list(solver.solutions()), expected)
+
+    def test_assume(self):
+        """
+        Ensure the solutions under an assumption are the solutions containing
+        the assumed options, including colored ones.
+        """
+        constraints = [
+            ["p", "q", "x", "y:A"],
+            ["p", "r", "x:A", "y"],
+            ["p", "x:B"],
+            ["q", "x:A"],
+            ["r", "y:B"],
+            ["p", "x:A"],
+            ["r", "y:A"],
+            ["q", "r", "y:A"],
+        ]
+        root = generate_graph(["p", "q", "r"], ["x", "y"], constraints)
+        solver = AlgorithmC(root)
+        expected = [sorted(map(str, (n.row for n in s))) for s in solver.solutions()]
+        options = {}
+        column = root.r
+
+        while column != root:
+            node = column.d
+
+            while node != column:
+                options.setdefault(str(node.row), node)
+                node = node.d
+
+            column = column.r
+
+        self.assertEqual(len(options), len(constraints))
+
+        for name, node in options.items():
+            with self.subTest(option=name):
+                actual = [
+                    sorted(map(str, (n.row for n in s)))
+                    for s in solver.solutions([node])
+                ]
+                self.assertEqual(
+                    sorted(actual), sorted(s for s in expected if name in s)
+                )
+
+        with self.assertRaises(ValueError):
+            with solver.assuming(
+                [options[str(constraints[3])], options[str(constraints[2])]]
+            ):
+                pass
+
+        self.assertEqual(
+            [sorted(map(str, (n.row for n in s))) for s in solver.solutions()], expected
+        )
@@ -125,3 +125,161 @@ class TestAlgorithmM(unittest.TestCase):
                     convert_to_frozenset(solutions),
                     convert_to_frozenset(expected),
                 )
+
+    def test_slack_after_bound_exhausted(self):
+        """
+        Ensure the solver restores an item whose bound reaches zero while it
+        still has slack.  The item is covered when it is chosen, so the branch
+        that leaves it below its upper bound must not relink it.
+        """
+        root = generate_graph(
+            primary_items=["p", "q"],
+            primary_multiplicities=[(0, 1), (1, 2)],
+            secondary_items=[],
+            options=[["q"], ["p", "q"]],
+        )
+        solutions = list(AlgorithmM(root).solutions())
+        self.assertEqual(
+            convert_to_frozenset(solutions),
+            convert_to_frozenset([[["q"]], [["p", "q"]], [["q"], ["p", "q"]]]),
+        )
+
+    def test_iterative(self):
+        """
+        Ensure the iterative search yields the same solutions, in the same
+        order, as the recursive search, including the branches that leave an
+        item below its upper bound.
+        """
+        root = generate_graph(
+            primary_items=["p", "q", "r"],
+            primary_multiplicities=[(0, 1), (1, 2), (2, 3)],
+            secondary_items=["x"],
+            options=[
+                ["q"],
+                ["p", "q", "r"],
+                ["r", "x:1"],
+                ["q", "r", "x:2"],
+                ["r", "x:2"],
+                ["p", "r"],
+            ],
+        )
+        expected = list(AlgorithmM(root).solutions())
+        actual = list(AlgorithmM(root).iterative_solutions())
+
+        self.assertEqual(len(expected), 14)
+        self.assertEqual(actual, expected)
+
+    def test_count_solutions(self):
+        """
+        Ensure solutions can be counted, and that has_solution() leaves the
+        structure intact.
+        """
+        root = generate_graph(
+            primary_items=["p", "q", "r"],
+            primary_multiplicities=[(0, 1), (1, 2), (2, 3)],
+            secondary_items=["x"],
+            options=[
+                ["q"],
+                ["p", "q", "r"],
+                ["r", "x:1"],
+                ["q", "r", "x:2"],
+                ["r", "x:2"],
+                ["p", "r"],
+            ],
+        )
+        solver = AlgorithmM(root)
+        expected = list(solver.solutions())
+
+        self.assertEqual(solver.count_solutions(), 14)
+        self.assertTrue(solver.has_solution())
+        self.assertEqual(list(solver.solutions()), expected)
+
+        root = generate_graph(
+            primary_items=["p"],
+            primary_multiplicities=[(2, 2)],
+            secondary_items=[],
+            options=[["p"]],
+        )
+        self.assertEqual(AlgorithmM(root).count_solutions(), 0)
+        self.assertFalse(AlgorithmM(root).has_solution())
+
+    def test_close(self):
+        """
+        Ensure closing a solution generator after any number of solutions
+        restores the structure, including the tweaks and bounds.
+        """
+        root = generate_graph(
+            primary_items=["p", "q", "r"],
+            primary_multiplicities=[(0, 1), (1, 2), (2, 3)],
+            secondary_items=["x"],
+            options=[
+                ["q"],
+                ["p", "q", "r"],
+                ["r", "x:1"],
+                ["q", "r", "x:2"],
+                ["r", "x:2"],
+                ["p", "r"],
+            ],
+        )
+        solver = AlgorithmM(root)
+        expected = list(solver.solutions())
+
+        for count in range(len(expected) + 1):
+            for generate in (solver.solutions, solver.iterative_solutions):
+                with self.subTest(count=count, generator=generate.__name__):
+                    solutions = generate()
+                    self.assertEqual(
+                        [next(solutions) for _ in range(count)], expected[:count]
+                    )
+                    solutions.close()
+
+                    self.assertEqual(solver.solution_stack, [])
+                    self.assertEqual(list(solver.solutions()), expected)
+
+    def test_assume(self):
+        """
+        Ensure the solutions under an assumption are the solutions containing
+        the assumed options, and that the bounds are restored afterwards.
+        """
+        options = [
+            ["q"],
+            ["p", "q", "r"],
+            ["r", "x:1"],
+            ["q", "r", "x:2"],
+            ["r", "x:2"],
+            ["p", "r"],
+        ]
+        root = generate_graph(
+            primary_items=["p", "q", "r"],
+            primary_multiplicities=[(0, 1), (1, 2), (2, 3)],
+            secondary_items=["x"],
+            options=options,
+        )
+        solver = AlgorithmM(root)
+        expected = convert_to_frozenset(solver.solutions())
+        nodes = {}
+        column = root.r
+
+        while column != root:
+            node = column.d
+
+            while node != column:
+                nodes.setdefault(str(node.row), node)
+                node = node.d
+
+            column = column.r
+
+        for option in options:
+            for generate in (solver.solutions, solver.iterative_solutions):
+                with self.subTest(option=option, generator=generate.__name__):
+                    actual = convert_to_frozenset(generate([nodes[str(option)]]))
+                    self.assertEqual(
+                        actual,
+                        frozenset(s for s in expected if frozenset(option) in s),
+                    )
+
+        with self.assertRaises(ValueError):
+            with solver.assuming([nodes[str(options[1])], nodes[str(options[5])]]):
+                pass
+
+        self.assertEqual(convert_to_frozenset(solver.solutions()), expected)
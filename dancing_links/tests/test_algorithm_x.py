@@ -3,7 +3,10 @@ Tests for AlgorithmX solver.
 """
 
 import unittest
+from ..algorithm_c import AlgorithmC
+from ..algorithm_m import AlgorithmM
 from ..algorithm_x import AlgorithmX, Header, Node
+from ..builder import Problem
 
 
 class TestAlgorithmX(unittest.TestCase):
@@ -48,3 +51,144 @@ class TestAlgorithmX(unittest.TestCase):
             solutions,
             [["adf", "bg", "ce"]],
         )
+
+    def test_iterative(self):
+        """
+        Ensure the iterative search yields the same solutions, in the same
+        order, as the recursive search.
+        """
+        root = Problem(
+            ["ce", "adg", "bcf", "adf", "bg", "deg", "ab", "cdefg", "g", "cef"]
+        ).build()
+        expected = list(AlgorithmX(root).solutions())
+        actual = list(AlgorithmX(root).iterative_solutions())
+
+        self.assertEqual(len(expected), 2)
+        self.assertEqual(actual, expected)
+
+    def test_iterative_deep(self):
+        """
+        Ensure the iterative search handles problems deeper than the recursion
+        limit.
+        """
+        items = [f"i{idx}" for idx in range(5000)]
+        root = Problem([(item,) for item in items]).build()
+        solutions = list(AlgorithmX(root).iterative_solutions())
+
+        self.assertEqual(len(solutions), 1)
+        self.assertEqual(len(solutions[0]), 5000)
+        self.assertEqual(root.r.multiplicity, 1)
+
+    def test_count_solutions(self):
+        """
+        Ensure solutions can be counted, in total and per search depth, and
+        that has_solution() leaves the structure intact.
+        """
+        root = Problem(
+            ["ce", "adg", "bcf", "adf", "bg", "deg", "ab", "cdefg", "g", "cef"]
+        ).build()
+        solver = AlgorithmX(root)
+
+        self.assertEqual(solver.count_solutions(), 2)
+        self.assertEqual(solver.count_solutions(per_level=True), (2, [0, 0, 1, 1]))
+        self.assertTrue(solver.has_solution())
+        self.assertEqual(solver.level_stack, [])
+        self.assertEqual(solver.solution_stack, [])
+        self.assertEqual(solver.count_solutions(), 2)
+
+        root = Problem(["ab", "bc"], "abc").build()
+        self.assertEqual(AlgorithmX(root).count_solutions(), 0)
+        self.assertFalse(AlgorithmX(root).has_solution())
+
+    def test_close(self):
+        """
+        Ensure abandoning a solution generator after any number of solutions
+        restores the structure, whether it is closed or garbage collected.
+        """
+        root = Problem(
+            ["ce", "adg", "bcf", "adf", "bg", "deg", "ab", "cdefg", "g", "cef"]
+        ).build()
+        solver = AlgorithmX(root)
+        expected = list(solver.solutions())
+
+        for count in range(len(expected) + 1):
+            for generate in (solver.solutions, solver.iterative_solutions):
+                with self.subTest(count=count, generator=generate.__name__):
+                    solutions = generate()
+                    self.assertEqual(
+                        [next(solutions) for _ in range(count)], expected[:count]
+                    )
+                    solutions.close()
+
+                    self.assertEqual(solver.solution_stack, [])
+                    self.assertEqual(list(solver.solutions()), expected)
+
+        solutions = solver.solutions()
+        next(solutions)
+        del solutions
+        self.assertEqual(list(solver.solutions()), expected)
+
+        with AlgorithmX(root) as other:
+            next(other.search())
+
+        self.assertEqual(other.level_stack, [])
+        self.assertEqual(list(solver.solutions()), expected)
+
+    def test_assume(self):
+        """
+        Ensure the solutions under an assumption are the solutions containing
+        the assumed options, and that the structure is restored afterwards.
+        """
+        rows = ["ce", "adg", "bcf", "adf", "bg", "deg", "ab", "cdefg", "g", "cef"]
+        solver = AlgorithmX(Problem(rows).build())
+        expected = [sorted(rows[node.row] for node in s) for s in solver.solutions()]
+
+        for row, name in enumerate(rows):
+            for generate in (solver.solutions, solver.iterative_solutions):
+                with self.subTest(option=name, generator=generate.__name__):
+                    actual = [
+                        sorted(rows[node.row] for node in s) for s in generate([row])
+                    ]
+                    self.assertEqual(
+                        sorted(actual), sorted(s for s in expected if name in s)
+                    )
+
+        with solver.assuming([rows.index("adf"), rows.index("bg")]):
+            self.assertEqual(solver.count_solutions(), 1)
+
+            with self.assertRaises(ValueError):
+                solver.include(rows.index("ab"))
+
+        self.assertEqual(solver.solution_stack, [])
+        self.assertEqual(
+            [sorted(rows[node.row] for node in s) for s in solver.solutions()],
+            expected,
+        )
+
+    def test_assume_rows(self):
+        """
+        Ensure every solver accepts options by row as well as by node, and
+        that an option without a primary item is reported as such.
+        """
+        problem = Problem([["a", "x"], ["b"], ["a", "b"], ["x"]], secondary=["x"])
+
+        for solver_class in (AlgorithmX, AlgorithmC, AlgorithmM):
+            with self.subTest(solver=solver_class.__name__):
+                root = problem.build(solver_class)
+                solver = solver_class(root)
+
+                with solver.assuming([0]):
+                    stack = solver.solution_stack
+                    found = [[node.row for node in stack] for _ in solver.search()]
+                    self.assertEqual(found, [[0, 1]])
+
+                    with self.assertRaisesRegex(ValueError, "not available"):
+                        solver.include(2)
+
+                self.assertEqual(solver.solution_stack, [])
+                node = root.r.d.r.d
+
+                with self.assertRaisesRegex(ValueError, "has no primary item"):
+                    solver.include(node)
+
+                self.assertEqual(solver.count_solutions(), 2)
@@ -0,0 +1,111 @@
+"""
+Tests for ArrayAlgorithmM solver.
+"""
+
+import gc
+import unittest
+import weakref
+from ..algorithm_m import AlgorithmM
+from ..array_m import ArrayAlgorithmM
+from ..builder import Problem
+from .problems import colored_problem, multiplicities_problem, random_problem
+
+
+class TestArrayAlgorithmM(unittest.TestCase):
+    """
+    Tests for ArrayAlgorithmM solver.
+    """
+
+    def test_0(self):
+        """
+        Ensure the solver handles a small multiple cover problem with colors.
+        """
+        problem = Problem(
+            [
+                ["A", ("X", 1)],
+                ["A", "B", ("X", 2)],
+                ["A", ("X", 1)],
+                ["B", ("X", 1)],
+            ],
+            ["A", "B"],
+            ["X"],
+            {"A": (1, 2), "B": (1, 1)},
+        )
+        expected = list(AlgorithmM(problem.build(AlgorithmM)).solutions())
+
+        for compact in (True, False):
+            with self.subTest(compact=compact):
+                solver = ArrayAlgorithmM(problem.build(AlgorithmM), compact)
+                self.assertEqual(list(solver.solutions()), expected)
+
+        self.assertEqual(
+            sorted(map(sorted, expected)), [[0, 2, 3], [0, 3], [1], [2, 3]]
+        )
+
+    def test_matches_linked(self):
+        """
+        Ensure the solver yields the same solutions, in the same order, as
+        AlgorithmM on randomly generated problems.
+        """
+        for seed in range(300):
+            problem = random_problem(seed, bounded=True)
+
+            with self.subTest(seed=seed):
+                actual = list(ArrayAlgorithmM(problem.build(AlgorithmM)).solutions())
+                expected = list(AlgorithmM(problem.build(AlgorithmM)).solutions())
+                self.assertEqual(actual, expected)
+
+    def test_from_problem(self):
+        """
+        Ensure the solver built from a Problem yields the same rows, in the
+        same order, as AlgorithmM on the linked problem.
+        """
+        problems = [multiplicities_problem(), colored_problem()]
+        problems += [random_problem(seed, bounded=True) for seed in range(300)]
+
+        for idx, problem in enumerate(problems):
+            expected = list(AlgorithmM(problem.build(AlgorithmM)).solutions())
+
+            for compact in (True, False):
+                with self.subTest(idx=idx, compact=compact):
+                    solver = ArrayAlgorithmM.from_problem(problem, compact)
+                    self.assertEqual(list(solver.solutions()), expected)
+
+        with self.assertRaises(ValueError):
+            ArrayAlgorithmM.from_problem(Problem([["a"]], bounds={"a": (2, 1)}))
+
+    def test_releases_nodes(self):
+        """
+        Ensure the solver keeps no reference to the linked structure it was
+        built from.
+        """
+        root = multiplicities_problem().build(AlgorithmM)
+        expected = list(AlgorithmM(root).solutions())
+        solver = ArrayAlgorithmM(root)
+        reference = weakref.ref(root)
+        del root
+        gc.collect()
+
+        self.assertIsNone(reference())
+        self.assertEqual(list(solver.solutions()), expected)
+
+    def test_close(self):
+        """
+        Ensure closing the generator after any number of solutions restores
+        the arrays, on randomly generated problems.
+        """
+        for idx in range(50):
+            problem = random_problem(idx, bounded=True)
+            solver = ArrayAlgorithmM(problem.build(AlgorithmM))
+            expected = list(solver.solutions())
+
+            for count in range(min(len(expected), 5) + 1):
+                with self.subTest(idx=idx, count=count):
+                    solutions = solver.solutions()
+                    self.assertEqual(
+                        [next(solutions) for _ in range(count)], expected[:count]
+                    )
+                    solutions.close()
+
+                    self.assertEqual(solver.solution_stack, [])
+                    self.assertEqual(list(solver.solutions()), expected)
@@ -0,0 +1,106 @@
+"""
+Tests for ArrayAlgorithmX solver.
+"""
+
+import unittest
+from ..algorithm_x import AlgorithmX
+from ..array_x import ArrayAlgorithmX
+from ..builder import Problem
+from ..parallel import encode
+from .problems import colored_problem, multiplicities_problem, queens, queens_problem
+
+
+def elementary():
+    return Problem(["ce", "adg", "bcf", "adf", "bg", "deg"], "abcdefg")
+
+
+class TestArrayAlgorithmX(unittest.TestCase):
+    """
+    Tests for ArrayAlgorithmX solver.
+    """
+
+    def test_0(self):
+        """
+        Ensure the sovler handles the elementary problem described in
+        The Art of Computer Programming:  7.2.2.1
+        """
+        root = elementary().build()
+
+        for compact in (True, False):
+            with self.subTest(compact=compact):
+                solutions = ArrayAlgorithmX(root, compact).solutions()
+                self.assertEqual(list(map(encode, solutions)), [[3, 4, 0]])
+
+    def test_matches_linked(self):
+        """
+        Ensure the solver yields the same row nodes, in the same order, as
+        AlgorithmX on a problem with secondary items.
+        """
+        root = queens(6)
+        expected = list(AlgorithmX(root).solutions())
+        actual = list(ArrayAlgorithmX(root).solutions())
+
+        self.assertEqual(len(expected), 4)
+        self.assertEqual(actual, expected)
+
+    def test_from_problem(self):
+        """
+        Ensure the solver built from a Problem keeps no node and yields the
+        rows AlgorithmX finds on the linked problem, in the same order.
+        """
+        problems = [elementary(), Problem(["ab", "bc"], "abc"), Problem([])]
+        problems += [queens_problem(n) for n in range(1, 8)]
+
+        for index, problem in enumerate(problems):
+            expected = list(map(encode, AlgorithmX(problem.build()).solutions()))
+
+            for compact in (True, False):
+                with self.subTest(index=index, compact=compact):
+                    solver = ArrayAlgorithmX.from_problem(problem, compact)
+                    self.assertEqual(list(solver.solutions()), expected)
+                    self.assertIsNone(solver.nodes)
+
+    def test_from_problem_errors(self):
+        """
+        Ensure problems AlgorithmX cannot solve are rejected.
+        """
+        problems = [
+            colored_problem(),
+            multiplicities_problem(),
+            Problem([["a", "b"]], ["a"]),
+            Problem([["a", "a"]], ["a"]),
+            Problem([["a"]], ["a", "a"]),
+        ]
+
+        for index, problem in enumerate(problems):
+            with self.subTest(index=index):
+                with self.assertRaises(ValueError):
+                    ArrayAlgorithmX.from_problem(problem)
+
+    def test_no_solution(self):
+        """
+        Ensure the solver terminates without solutions on an infeasible
+        problem, and yields the empty solution for an empty problem.
+        """
+        root = Problem(["ab", "bc"], "abc").build()
+        self.assertEqual(list(ArrayAlgorithmX(root).solutions()), [])
+        root = Problem([]).build()
+        self.assertEqual(list(ArrayAlgorithmX(root).solutions()), [[]])
+
+    def test_close(self):
+        """
+        Ensure closing the generator after any number of solutions restores
+        the arrays.
+        """
+        solver = ArrayAlgorithmX(queens(6))
+        expected = list(solver.solutions())
+
+        for count in range(len(expected) + 1):
+            with self.subTest(count=count):
+                solutions = solver.solutions()
+                self.assertEqual(
+                    [next(solutions) for _ in range(count)], expected[:count]
+                )
+                solutions.close()
+
+                self.assertEqual(list(solver.solutions()), expected)
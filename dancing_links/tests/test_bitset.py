@@ -0,0 +1,138 @@
+"""
+Tests for BitsetAlgorithmX solver.
+"""
+
+import unittest
+from ..algorithm_c import AlgorithmC
+from ..algorithm_m import AlgorithmM
+from ..algorithm_x import AlgorithmX, Header, Node
+from ..bitset import BitsetAlgorithmX, solver_for
+from ..builder import Problem
+from ..parallel import encode
+from .test_array_x import elementary
+from .problems import (
+    colored_problem,
+    multiplicities_problem,
+    queens,
+    queens_problem,
+    random_problem,
+)
+
+
+def crossed():
+    root = Header(name="root")
+    headers = {}
+
+    for item in "abcd":
+        headers[item] = Header(name=item)
+        root.insert_left(headers[item])
+
+    for row in ("R1", "R2", "R3"):
+        nodes = [
+            Node(name=row, header=headers[item], row=row)
+            for item in ("cd" if row == "R3" else "ab")
+        ]
+
+        for node in nodes:
+            if row == "R2" and node.header.name == "b":
+                node.header.insert_down(node)
+            else:
+                node.header.insert_up(node)
+
+        nodes[0].insert_left(nodes[1])
+
+    return root
+
+
+class TestBitsetAlgorithmX(unittest.TestCase):
+    """
+    Tests for BitsetAlgorithmX solver.
+    """
+
+    def test_0(self):
+        """
+        Ensure the solver handles the elementary problem described in
+        The Art of Computer Programming:  7.2.2.1
+        """
+        root = elementary().build()
+        solutions = BitsetAlgorithmX(root).solutions()
+        self.assertEqual(list(map(encode, solutions)), [[3, 4, 0]])
+
+    def test_matches_linked(self):
+        """
+        Ensure the solver yields the same row nodes, in the same order, as
+        AlgorithmX.
+        """
+        roots = [queens(6), queens_problem(5).build()]
+        roots += [random_problem(seed, colors=False).build() for seed in range(200)]
+
+        for index, root in enumerate(roots):
+            with self.subTest(index=index):
+                expected = list(AlgorithmX(root).solutions())
+                self.assertEqual(list(BitsetAlgorithmX(root).solutions()), expected)
+
+        self.assertEqual(BitsetAlgorithmX(roots[0]).count_solutions(), 4)
+
+    def test_crossed_columns(self):
+        """
+        Ensure rows listed in conflicting orders by two columns (R2 above R1
+        in column b but below it in column a) are all kept.
+        """
+        root = crossed()
+        expected = list(map(encode, AlgorithmX(root).solutions()))
+        self.assertEqual(expected, [["R3", "R1"], ["R3", "R2"]])
+        self.assertEqual(
+            list(map(encode, BitsetAlgorithmX(root).solutions())), expected
+        )
+
+    def test_no_solution(self):
+        """
+        Ensure the solver terminates without solutions on an infeasible
+        problem, and yields the empty solution for an empty problem.
+        """
+        root = Problem(["ab", "bc"], "abc").build()
+        self.assertEqual(list(BitsetAlgorithmX(root).solutions()), [])
+        root = Problem([]).build()
+        self.assertEqual(list(BitsetAlgorithmX(root).solutions()), [[]])
+
+    def test_close(self):
+        """
+        Ensure closing the generator after any number of solutions leaves the
+        solver ready for another search.
+        """
+        solver = BitsetAlgorithmX(queens(6))
+        expected = list(solver.solutions())
+
+        for count in range(len(expected) + 1):
+            with self.subTest(count=count):
+                solutions = solver.solutions()
+                self.assertEqual(
+                    [next(solutions) for _ in range(count)], expected[:count]
+                )
+                solutions.close()
+                self.assertEqual(list(solver.solutions()), expected)
+
+    def test_solver_for(self):
+        """
+        Ensure the engine is chosen from the size and the features of the
+        problem, and that every choice finds the solutions.
+        """
+        cases = [
+            (queens_problem(6), {}, BitsetAlgorithmX, AlgorithmX),
+            (queens_problem(6), {"max_items": 20}, AlgorithmX, AlgorithmX),
+            (colored_problem(), {}, AlgorithmC, AlgorithmC),
+            (multiplicities_problem(), {}, AlgorithmM, AlgorithmM),
+            (
+                Problem(["ab", "b"], bounds={"a": [1, 1]}),
+                {},
+                BitsetAlgorithmX,
+                AlgorithmX,
+            ),
+        ]
+
+        for problem, kwargs, solver_class, linked_class in cases:
+            with self.subTest(solver=solver_class.__name__):
+                solver = solver_for(problem, **kwargs)
+                self.assertIs(type(solver), solver_class)
+                linked = linked_class(problem.build(linked_class))
+                self.assertEqual(solver.count_solutions(), linked.count_solutions())
@@ -0,0 +1,98 @@
+"""
+Tests for BucketAlgorithmX and BucketAlgorithmC solvers.
+"""
+
+import random
+import unittest
+from functools import partial
+from ..algorithm_c import AlgorithmC
+from ..algorithm_x import AlgorithmX
+from ..bucket import BucketAlgorithmC, BucketAlgorithmX
+from ..parallel import encode
+from .problems import colored, queens
+
+CASES = [
+    (AlgorithmX, BucketAlgorithmX, queens, (6,)),
+    (AlgorithmC, BucketAlgorithmC, colored, ()),
+]
+
+
+def check_index(test, solver):
+    active = []
+    column = solver.root.r
+
+    while column != solver.root:
+        active.append(column)
+        column = column.r
+
+    test.assertEqual(solver.queue.indexed, set(active))
+
+    for multiplicity, bucket in enumerate(solver.queue.buckets):
+        for column in bucket:
+            test.assertEqual(column.multiplicity, multiplicity)
+
+    test.assertEqual(sum(map(len, solver.queue.buckets)), len(active))
+
+
+def check_node(test, solver, _levels):
+    check_index(test, solver)
+
+    if not solver.solved():
+        test.assertEqual(
+            solver.get_min_column().multiplicity,
+            min(column.multiplicity for column in solver.queue.indexed),
+        )
+
+
+class TestBucket(unittest.TestCase):
+    """
+    Tests for BucketAlgorithmX and BucketAlgorithmC solvers.
+    """
+
+    def test_solutions(self):
+        """
+        Ensure the bucket solvers find the same solutions as the plain solvers,
+        always branch on a column of least multiplicity, and restore the index.
+        """
+        for plain_class, bucket_class, factory, args in CASES:
+            with self.subTest(solver=bucket_class.__name__):
+                expected = {
+                    frozenset(encode(solution))
+                    for solution in plain_class(factory(*args)).solutions()
+                }
+                solver = bucket_class(factory(*args))
+                found = [
+                    frozenset(encode(solver.get_solution()))
+                    for _ in solver.search(hook=partial(check_node, self, solver))
+                ]
+                self.assertEqual(set(found), expected)
+                self.assertEqual(len(found), len(expected))
+                self.assertEqual(
+                    {frozenset(encode(s)) for s in solver.solutions()}, expected
+                )
+                check_index(self, solver)
+
+    def test_restore(self):
+        """
+        Ensure the index is restored when a search is abandoned, and that
+        randomized tie breaking still finds every solution.
+        """
+        for _, bucket_class, factory, args in CASES:
+            with self.subTest(solver=bucket_class.__name__):
+                solver = bucket_class(factory(*args))
+                expected = solver.count_solutions()
+
+                generator = solver.solutions()
+                next(generator)
+                generator.close()
+                check_index(self, solver)
+
+                with solver:
+                    next(solver.iterative_solutions())
+
+                check_index(self, solver)
+                solver.random = random.Random(0)
+                self.assertEqual(solver.count_solutions(), expected)
+                solver.random = None
+                self.assertEqual(solver.count_solutions(), expected)
+                check_index(self, solver)
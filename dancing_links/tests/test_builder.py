@@ -0,0 +1,165 @@
+"""
+Tests for Problem and Builder.
+"""
+
+import unittest
+from .. import algorithm_c, algorithm_m, algorithm_x
+from ..algorithm_c import AlgorithmC
+from ..algorithm_m import AlgorithmM
+from ..algorithm_x import AlgorithmX
+from ..builder import Builder, Problem
+from ..parallel import encode
+from .problems import colored_problem, multiplicities_problem, queens_problem
+
+
+def names(option):
+    return sorted(
+        f"{item[0]}:{item[1]}" if isinstance(item, tuple) else item for item in option
+    )
+
+
+def link(module, problem):
+    root = module.Header(name="root")
+    headers = {}
+
+    for name in problem.primary:
+        if module is algorithm_m:
+            lower, upper = problem.bounds.get(name, (1, 1))
+            headers[name] = module.Header(name=name, slack=upper - lower, bound=upper)
+
+        else:
+            headers[name] = module.Header(name=name)
+
+        root.insert_left(headers[name])
+
+    for name in problem.secondary:
+        if module is algorithm_m:
+            headers[name] = module.Header(name=name, primary=False)
+
+        else:
+            headers[name] = module.Header(name=name)
+
+    for row, option in enumerate(problem.options):
+        nodes = []
+
+        for item in option:
+            name, color = item if isinstance(item, tuple) else (item, None)
+            node = module.Node(name=name, header=headers[name], row=row)
+
+            if color is not None:
+                node.color = color
+
+            headers[name].insert_up(node)
+            nodes.append(node)
+
+        for other in nodes[1:]:
+            nodes[0].insert_left(other)
+
+    return root
+
+
+class TestBuilder(unittest.TestCase):
+    """
+    Tests for Problem and Builder.
+    """
+
+    def test_build(self):
+        """
+        Ensure the built structures give the same solutions as the hand linked
+        ones.
+        """
+        cases = [
+            (algorithm_x, AlgorithmX, queens_problem(6)),
+            (algorithm_c, AlgorithmC, colored_problem()),
+            (algorithm_m, AlgorithmM, multiplicities_problem()),
+        ]
+
+        for module, solver_class, problem in cases:
+            with self.subTest(solver=solver_class.__name__):
+                expected = sorted(
+                    sorted(names(problem.options[row]) for row in encode(solution))
+                    for solution in solver_class(link(module, problem)).solutions()
+                )
+                solutions = sorted(
+                    sorted(names(problem.options[row]) for row in encode(solution))
+                    for solution in solver_class(
+                        problem.build(solver_class)
+                    ).solutions()
+                )
+
+                self.assertGreater(len(expected), 0)
+                self.assertEqual(solutions, expected)
+
+    def test_lengths(self):
+        """
+        Ensure the column lengths are counted.
+        """
+        root = queens_problem(4).build()
+        column = root.r
+        lengths = []
+
+        while column != root:
+            lengths.append(column.multiplicity)
+            column = column.r
+
+        self.assertEqual(lengths, [4] * 8)
+        self.assertEqual(multiplicities_problem().build(AlgorithmM).r.len, 2)
+
+    def test_from_matrix(self):
+        """
+        Ensure CSR style matrices and index arrays describe the same problem.
+        """
+
+        class Matrix:
+            """
+            Minimal stand in for a SciPy CSR matrix.
+            """
+
+            indptr = [0, 2, 3, 5, 6]
+            indices = [0, 2, 1, 1, 2, 0]
+            shape = (4, 4)
+
+        csr = Problem.from_matrix(Matrix(), secondary=[3])
+        coo = Problem.from_matrix(([0, 0, 1, 2, 2, 3], [0, 2, 1, 1, 2, 0]))
+
+        self.assertEqual(csr.options, [[0, 2], [1], [1, 2], [0]])
+        self.assertEqual(csr.primary, [0, 1, 2])
+        self.assertEqual(csr.secondary, [3])
+        self.assertEqual(coo.options, csr.options)
+        self.assertEqual(coo.primary, [0, 1, 2])
+        self.assertEqual(
+            sorted(sorted(encode(s)) for s in AlgorithmX(csr.build()).solutions()),
+            [[0, 1], [2, 3]],
+        )
+
+    def test_errors(self):
+        """
+        Ensure invalid problems are rejected.
+        """
+        builder = Builder(AlgorithmC)
+        builder.add_item("p")
+        builder.add_item("x", primary=False)
+
+        with self.assertRaises(ValueError):
+            builder.add_item("p")
+
+        with self.assertRaises(ValueError):
+            builder.add_option(["q"])
+
+        with self.assertRaises(ValueError):
+            builder.add_option(["p", "p"])
+
+        with self.assertRaises(ValueError):
+            builder.add_option([("p", 1)])
+
+        with self.assertRaises(ValueError):
+            builder.add_item("q", bounds=(0, 2))
+
+        with self.assertRaises(ValueError):
+            Builder(AlgorithmM).add_item("p", bounds=(2, 1))
+
+        with self.assertRaises(ValueError):
+            Builder(object)
+
+        self.assertEqual(builder.add_option(["p", ("x", "red")]), 0)
+        self.assertEqual(builder.colors, {"red": 1})
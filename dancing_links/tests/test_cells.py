@@ -0,0 +1,83 @@
+"""
+Tests for CellsAlgorithmC solver.
+"""
+
+import unittest
+from ..algorithm_c import AlgorithmC
+from ..builder import Problem
+from ..cells import CellsAlgorithmC
+from .test_array_x import elementary
+from .problems import colored_problem, queens, random_problem
+
+
+def rows(solutions):
+    return sorted(sorted(node.row for node in solution) for solution in solutions)
+
+
+class TestCellsAlgorithmC(unittest.TestCase):
+    """
+    Tests for CellsAlgorithmC solver.
+    """
+
+    def test_0(self):
+        """
+        Ensure the solver handles the elementary problem described in
+        The Art of Computer Programming:  7.2.2.1
+        """
+        root = elementary().build()
+        self.assertEqual(rows(CellsAlgorithmC(root).solutions()), [[0, 3, 4]])
+
+    def test_matches_linked(self):
+        """
+        Ensure the solver yields the same solutions as AlgorithmC, for colored
+        and uncolored problems.
+        """
+        problems = [colored_problem()]
+        problems += [random_problem(seed) for seed in range(300)]
+
+        for index, problem in enumerate(problems):
+            with self.subTest(index=index):
+                root = problem.build(AlgorithmC)
+                expected = rows(AlgorithmC(root).solutions())
+                self.assertEqual(rows(CellsAlgorithmC(root).solutions()), expected)
+
+    def test_secondary_only(self):
+        """
+        Ensure options without primary items are never chosen, and that the
+        colors of shared secondary items are respected.
+        """
+        problem = Problem(
+            [["a", ("x", "red")], ["b", ("x", "red")], ["b", ("x", "blue")], ["x"]],
+            ["a", "b"],
+            ["x"],
+        )
+        root = problem.build(AlgorithmC)
+        self.assertEqual(CellsAlgorithmC(root).count_solutions(), 1)
+
+    def test_no_solution(self):
+        """
+        Ensure the solver terminates without solutions on an infeasible
+        problem, and yields the empty solution for an empty problem.
+        """
+        root = Problem(["ab", "bc"], "abc").build()
+        self.assertEqual(list(CellsAlgorithmC(root).solutions()), [])
+        root = Problem([]).build()
+        self.assertEqual(list(CellsAlgorithmC(root).solutions()), [[]])
+
+    def test_close(self):
+        """
+        Ensure closing the generator after any number of solutions leaves the
+        solver ready for another search.
+        """
+        solver = CellsAlgorithmC(queens(6))
+        expected = list(solver.solutions())
+        self.assertEqual(len(expected), 4)
+
+        for count in range(len(expected) + 1):
+            with self.subTest(count=count):
+                solutions = solver.solutions()
+                self.assertEqual(
+                    [next(solutions) for _ in range(count)], expected[:count]
+                )
+                solutions.close()
+                self.assertEqual(list(solver.solutions()), expected)
@@ -0,0 +1,87 @@
+"""
+Tests for resuming searches from a Checkpoint.
+"""
+
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from ..algorithm_m import AlgorithmM
+from ..builder import Problem
+from ..checkpoint import Checkpoint
+from .problems import multiplicities
+
+
+class TestCheckpoint(unittest.TestCase):
+    """
+    Tests for resuming searches from a Checkpoint.
+    """
+
+    def setUp(self):
+        self.directory = Path(tempfile.mkdtemp())
+        self.expected = list(AlgorithmM(multiplicities()).solutions())
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_close_and_resume(self):
+        """
+        Ensure a search closed after some solutions continues with the next
+        solution when resumed on a new copy of the problem.
+        """
+        path = self.directory / "search.json"
+
+        for count in range(len(self.expected) + 1):
+            with self.subTest(count=count):
+                path.unlink(missing_ok=True)
+                solver = AlgorithmM(multiplicities())
+                search = solver.resumable_solutions(Checkpoint(path))
+                actual = [next(search) for _ in range(count)]
+                search.close()
+                self.assertEqual(solver.level_stack, [])
+
+                solver = AlgorithmM(multiplicities())
+                actual += list(solver.resumable_solutions(Checkpoint(path)))
+                self.assertEqual(actual, self.expected)
+                self.assertEqual(list(solver.resumable_solutions(Checkpoint(path))), [])
+
+    def test_periodic(self):
+        """
+        Ensure a search resumed from a periodic checkpoint (as after a crash)
+        repeats only the solutions found after the checkpoint was saved.
+        """
+        path = self.directory / "search.json"
+        backup = self.directory / "backup.json"
+        search = AlgorithmM(multiplicities()).resumable_solutions(
+            Checkpoint(path, node_interval=3)
+        )
+
+        for _ in range(5):
+            next(search)
+
+        shutil.copy(path, backup)
+        search.close()
+        shutil.copy(backup, path)
+
+        with open(path, encoding="utf-8") as f_in:
+            found = json.load(f_in)["solutions"]
+
+        solver = AlgorithmM(multiplicities())
+        actual = list(solver.resumable_solutions(Checkpoint(path)))
+        self.assertLessEqual(found, 5)
+        self.assertEqual(actual, self.expected[found:])
+
+    def test_mismatch(self):
+        """
+        Ensure resuming on a different problem is reported.
+        """
+        path = self.directory / "search.json"
+        search = AlgorithmM(multiplicities()).resumable_solutions(Checkpoint(path))
+        next(search)
+        search.close()
+
+        root = Problem([["p"]]).build(AlgorithmM)
+
+        with self.assertRaises(ValueError):
+            list(AlgorithmM(root).resumable_solutions(Checkpoint(path)))
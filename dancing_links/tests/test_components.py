@@ -0,0 +1,151 @@
+"""
+Tests for splitting problems into independent components.
+"""
+
+import unittest
+from itertools import islice
+from ..algorithm_c import AlgorithmC
+from ..algorithm_m import AlgorithmM
+from ..algorithm_x import AlgorithmX
+from ..builder import Problem
+from ..components import components, count_solutions, solutions
+from ..parallel import encode
+from .problems import colored_problem, multiplicities_problem, queens_problem
+
+
+def rename(problem, suffix):
+    def item(value):
+        if isinstance(value, tuple):
+            return (f"{value[0]}{suffix}", value[1])
+
+        return f"{value}{suffix}"
+
+    return Problem(
+        [[item(value) for value in option] for option in problem.options],
+        [item(value) for value in problem.primary],
+        [item(value) for value in problem.secondary],
+        {item(key): value for key, value in problem.bounds.items()},
+    )
+
+
+def combine(*problems):
+    return Problem(
+        [option for problem in problems for option in problem.options],
+        [item for problem in problems for item in problem.primary],
+        [item for problem in problems for item in problem.secondary],
+        {key: value for problem in problems for key, value in problem.bounds.items()},
+    )
+
+
+def item_order(root):
+    names = []
+    column = root.r
+
+    while column != root:
+        names.append(column.name)
+        column = column.r
+
+    return names
+
+
+CASES = [
+    (AlgorithmX, queens_problem(4), 3),
+    (AlgorithmX, queens_problem(5), 2),
+    (AlgorithmC, colored_problem(), 3),
+    (AlgorithmM, multiplicities_problem(), 3),
+]
+
+
+class TestComponents(unittest.TestCase):
+    """
+    Tests for splitting problems into independent components.
+    """
+
+    def test_combined(self):
+        """
+        Ensure independent problems combined are split, and that counting and
+        generating solutions by components agree with the plain search and
+        restore the structure.
+        """
+        for solver_class, problem, copies in CASES:
+            combined = combine(*(rename(problem, f"_{copy}") for copy in range(copies)))
+            root = combined.build(solver_class)
+            solver = solver_class(root)
+            order = item_order(root)
+            expected = sorted(sorted(encode(s)) for s in solver.solutions())
+
+            for dynamic in (False, True):
+                with self.subTest(solver=solver_class.__name__, dynamic=dynamic):
+                    self.assertEqual(len(components(solver)), copies)
+                    self.assertEqual(
+                        count_solutions(solver, dynamic=dynamic), len(expected)
+                    )
+                    self.assertEqual(
+                        sorted(
+                            sorted(encode(s))
+                            for s in solutions(solver, dynamic=dynamic)
+                        ),
+                        expected,
+                    )
+                    self.assertEqual(item_order(root), order)
+                    self.assertEqual(solver.solution_stack, [])
+                    self.assertEqual(solver.count_solutions(), len(expected))
+
+    def test_close(self):
+        """
+        Ensure abandoning the product restores the structure.
+        """
+        problem = combine(*(rename(queens_problem(5), f"_{copy}") for copy in range(3)))
+        root = problem.build()
+        solver = AlgorithmX(root)
+        order = item_order(root)
+        expected = solver.count_solutions()
+
+        for dynamic in (False, True):
+            with self.subTest(dynamic=dynamic):
+                generator = solutions(solver, dynamic=dynamic)
+                self.assertEqual(len(list(islice(generator, 7))), 7)
+                generator.close()
+                self.assertEqual(item_order(root), order)
+                self.assertEqual(solver.count_solutions(), expected)
+
+    def test_dynamic(self):
+        """
+        Ensure splitting after every commit finds components which only
+        appear during the search:  two copies of a problem joined by an item
+        whose options each block a diagonal of one copy.
+        """
+        copies = [rename(queens_problem(6), f"_{copy}") for copy in range(2)]
+        problem = combine(*copies)
+        problem.options += [["hub", "a5_0"], ["hub", "b5_1"]]
+        problem.primary.insert(0, "hub")
+        root = problem.build()
+        solver = AlgorithmX(root)
+        expected = sorted(sorted(encode(s)) for s in solver.solutions())
+
+        self.assertEqual(len(components(solver)), 1)
+        self.assertGreater(len(expected), 0)
+        self.assertEqual(count_solutions(solver), len(expected))
+        self.assertEqual(count_solutions(solver, dynamic=True), len(expected))
+        self.assertEqual(
+            sorted(sorted(encode(s)) for s in solutions(solver, dynamic=True)),
+            expected,
+        )
+
+        with solver.assuming([root.r.d]):
+            self.assertEqual(len(components(solver)), 2)
+
+    def test_connected(self):
+        """
+        Ensure a connected problem is searched as usual, with colored
+        secondary items connecting the options which share them.
+        """
+        problem = colored_problem()
+        solver = AlgorithmC(problem.build(AlgorithmC))
+        self.assertEqual(len(components(solver)), 1)
+        self.assertEqual(count_solutions(solver), solver.count_solutions())
+
+        problem = Problem([("a", ("x", 1)), ("b", ("x", 2))], secondary=["x"])
+        solver = AlgorithmC(problem.build(AlgorithmC))
+        self.assertEqual(len(components(solver)), 1)
+        self.assertEqual(count_solutions(solver), 0)
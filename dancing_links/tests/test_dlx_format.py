@@ -0,0 +1,103 @@
+"""
+Tests for the DLX text format loader.
+"""
+
+import os
+import tempfile
+import unittest
+from ..algorithm_c import AlgorithmC
+from ..algorithm_m import AlgorithmM
+from ..algorithm_x import AlgorithmX
+from ..dlx_format import load, load_file, parse_bounds
+from ..parallel import encode
+
+QUEENS = """\
+| 4 queens:  ranks and files are primary, diagonals secondary
+r0 r1 r2 r3 c0 c1 c2 c3 | a0 a1 a2 a3 a4 a5 a6 b0 b1 b2 b3 b4 b5 b6
+""" + "".join(f"r{i} c{j} a{i + j} b{3 - i + j}\n" for i in range(4) for j in range(4))
+
+COLORED = """\
+p q r | x y
+
+p q x y:1
+p r x:1 y
+p x:2
+q x:1
+r y:2
+p x:1
+r y:1
+q r y:1
+"""
+
+MULTIPLICITIES = """\
+| DLX3 style bounds
+0:1|p 1:2|q 2:3|r | x
+q
+p q r
+r x:1
+q r x:2
+r x:2
+p r
+"""
+
+
+class TestDLXFormat(unittest.TestCase):
+    """
+    Tests for the DLX text format loader.
+    """
+
+    def test_load(self):
+        """
+        Ensure the loaded problems have the expected solutions.
+        """
+        queens = AlgorithmX(load(QUEENS.splitlines(keepends=True)))
+        colored = AlgorithmC(load(COLORED.splitlines(), AlgorithmC))
+        multiplicities = AlgorithmM(load(MULTIPLICITIES.splitlines(), AlgorithmM))
+
+        self.assertEqual(
+            sorted(sorted(encode(s)) for s in queens.solutions()),
+            [[1, 7, 8, 14], [2, 4, 11, 13]],
+        )
+        self.assertEqual(
+            sorted(sorted(encode(s)) for s in colored.solutions()),
+            [[0, 6], [1, 3], [2, 7], [3, 4, 5], [3, 5, 6], [5, 7]],
+        )
+        self.assertEqual(multiplicities.count_solutions(), 14)
+
+    def test_load_file(self):
+        """
+        Ensure problems can be loaded from a file.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "queens.dlx")
+
+            with open(path, "w", encoding="utf-8") as stream:
+                stream.write(QUEENS)
+
+            self.assertEqual(AlgorithmX(load_file(path)).count_solutions(), 2)
+
+    def test_bounds(self):
+        """
+        Ensure item bounds are parsed.
+        """
+        self.assertEqual(parse_bounds("p"), ("p", None))
+        self.assertEqual(parse_bounds("3|p"), ("p", (3, 3)))
+        self.assertEqual(parse_bounds("0:2|p"), ("p", (0, 2)))
+
+    def test_errors(self):
+        """
+        Ensure malformed input is rejected with the line number.
+        """
+        cases = [
+            ("", "missing item line"),
+            ("p | x | y\n", "line 1"),
+            ("a:b|p\n", "line 1"),
+            ("p | x\np\nq\n", "line 3"),
+            ("p | x\np:1\n", "line 2"),
+            ("1:2|p\np\n", "line 1"),
+        ]
+
+        for text, message in cases:
+            with self.subTest(text=text):
+                with self.assertRaisesRegex(ValueError, message):
+                    load(text.splitlines())
@@ -0,0 +1,50 @@
+"""
+Tests for the search tree size estimate.
+"""
+
+import unittest
+from ..estimate import estimate
+from ..instrument import Instrument
+from .problems import CASES
+
+
+class TestEstimate(unittest.TestCase):
+    """
+    Tests for the search tree size estimate.
+    """
+
+    def test_estimate(self):
+        """
+        Ensure the confidence intervals contain the exact figures, and the
+        structure is restored.
+        """
+        for solver_class, factory, args in CASES:
+            with self.subTest(solver=solver_class.__name__):
+                solver = solver_class(factory(*args))
+
+                with Instrument(solver) as exact:
+                    solver.count_solutions()
+
+                result = estimate(solver, samples=2000, seed=1, confidence=0.999)
+
+                for key in ("nodes", "solutions", "updates"):
+                    self.assertLessEqual(result[key]["low"], getattr(exact, key))
+                    self.assertGreaterEqual(result[key]["high"], getattr(exact, key))
+
+                self.assertEqual(solver.level_stack, [])
+                self.assertEqual(solver.solution_stack, [])
+                self.assertEqual(solver.count_solutions(), exact.solutions)
+
+    def test_seed(self):
+        """
+        Ensure the estimate depends only on the seed.
+        """
+        solver_class, factory, args = CASES[0]
+        solver = solver_class(factory(*args))
+
+        self.assertEqual(
+            estimate(solver, samples=10, seed=3), estimate(solver, samples=10, seed=3)
+        )
+
+        with self.assertRaises(ValueError):
+            estimate(solver, samples=0)
@@ -0,0 +1,94 @@
+"""
+Tests for branching heuristics.
+"""
+
+import unittest
+from ..algorithm_x import AlgorithmX
+from ..bucket import BucketAlgorithmX
+from ..builder import Problem
+from ..heuristics import first, mrv, resolve, sharp
+from ..indexed import IndexedAlgorithmM
+from ..parallel import encode
+from .problems import CASES, multiplicities
+
+
+def last(solver):
+    column = solver.root.l
+    return column if column != solver.root else None
+
+
+def branched(solver):
+    columns = []
+
+    def hook(levels):
+        if levels:
+            columns.append(levels[-1].column.name)
+
+    list(solver.search(hook=hook))
+    return columns
+
+
+class TestHeuristics(unittest.TestCase):
+    """
+    Tests for branching heuristics.
+    """
+
+    def test_solutions(self):
+        """
+        Ensure every heuristic finds the same solutions on every solver, and
+        that resetting the heuristic restores the solver's own rule.
+        """
+        for solver_class, factory, args in CASES:
+            expected = {
+                frozenset(encode(solution))
+                for solution in solver_class(factory(*args)).solutions()
+            }
+
+            for heuristic in ("mrv", "sharp", "first", last):
+                with self.subTest(solver=solver_class.__name__, heuristic=heuristic):
+                    solver = solver_class(factory(*args), heuristic=heuristic)
+                    self.assertEqual(
+                        {frozenset(encode(s)) for s in solver.solutions()}, expected
+                    )
+                    self.assertEqual(
+                        {frozenset(encode(s)) for s in solver.iterative_solutions()},
+                        expected,
+                    )
+                    solver.heuristic = None
+                    self.assertEqual(solver.count_solutions(), len(expected))
+
+    def test_choice(self):
+        """
+        Ensure each heuristic chooses the expected column.
+        """
+        root = Problem(
+            [("a", "#b"), ("a", "c"), ("#b", "c"), ("#d", "a"), ("#d", "c")],
+            ["a", "#b", "c", "#d"],
+        ).build()
+        solver = AlgorithmX(root)
+        self.assertEqual(first(solver).name, "a")
+        self.assertEqual(mrv(solver).name, "#b")
+        self.assertEqual(sharp(solver).name, "#b")
+        self.assertEqual(resolve(last)(solver).name, "#d")
+        self.assertEqual(resolve(None), None)
+
+        with self.assertRaises(ValueError):
+            resolve("fastest")
+
+        root = Problem(
+            [("a", "b"), ("a", "b"), ("b", "#c"), ("a", "#c"), ("#c",)],
+            ["a", "b", "#c"],
+        ).build()
+        solver = AlgorithmX(root)
+        self.assertEqual(mrv(solver).name, "a")
+        self.assertEqual(sharp(solver).name, "#c")
+        self.assertEqual(branched(AlgorithmX(root, heuristic=sharp))[0], "#c")
+        self.assertEqual(branched(BucketAlgorithmX(root, heuristic=first))[0], "a")
+
+    def test_indexed(self):
+        """
+        Ensure IndexedAlgorithmM follows a heuristic when one is set.
+        """
+        solver = IndexedAlgorithmM(multiplicities(), heuristic="first")
+        self.assertEqual(set(branched(solver)) - {"p"}, {"q", "r"})
+        self.assertEqual(branched(solver)[0], "p")
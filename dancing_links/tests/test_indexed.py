@@ -0,0 +1,94 @@
+"""
+Tests for IndexedAlgorithmM solver.
+"""
+
+import random
+import unittest
+from functools import partial
+from ..algorithm_m import AlgorithmM
+from ..indexed import IndexedAlgorithmM
+from .problems import random_problem
+from .test_algorithm_m import convert_to_frozenset, generate_graph
+
+
+def key(column):
+    return ((column.len + 1) - (column.bound - column.slack), column.slack, -column.len)
+
+
+def check_node(test, solver, _levels):
+    if solver.solved():
+        return
+
+    columns = []
+    column = solver.root.r
+
+    while column != solver.root:
+        columns.append(column)
+        column = column.r
+
+    chosen, degree = solver.get_branching_degree()
+    test.assertIn(chosen, columns)
+    test.assertEqual(key(chosen), min(map(key, columns)))
+    test.assertEqual(degree, key(chosen)[0])
+
+
+class TestIndexedAlgorithmM(unittest.TestCase):
+    """
+    Tests for IndexedAlgorithmM solver.
+    """
+
+    def test_solutions(self):
+        """
+        Ensure the indexed solver finds the same solutions as AlgorithmM on
+        random problems, always branching on a column of least key.
+        """
+        for seed in range(100):
+            with self.subTest(seed=seed):
+                problem = random_problem(seed, bounded=True)
+                expected = AlgorithmM(problem.build(AlgorithmM)).count_solutions()
+                solver = IndexedAlgorithmM(problem.build(AlgorithmM))
+                count = sum(
+                    1 for _ in solver.search(hook=partial(check_node, self, solver))
+                )
+                self.assertEqual(count, expected)
+                self.assertEqual(
+                    {frozenset(s) for s in solver.solutions()},
+                    {
+                        frozenset(s)
+                        for s in AlgorithmM(problem.build(AlgorithmM)).solutions()
+                    },
+                )
+
+    def test_restore(self):
+        """
+        Ensure the heap stays consistent across abandoned searches,
+        assumptions and randomized tie breaking.
+        """
+        options = [
+            ["q"],
+            ["p", "q", "r"],
+            ["r", "x:1"],
+            ["q", "r", "x:2"],
+            ["r", "x:2"],
+            ["p", "r"],
+        ]
+        root = generate_graph(["p", "q", "r"], [(0, 1), (1, 2), (2, 3)], ["x"], options)
+        solver = IndexedAlgorithmM(root)
+        expected = convert_to_frozenset(solver.solutions())
+        hook = partial(check_node, self, solver)
+
+        with solver:
+            next(solver.search(hook=hook))
+
+        option = root.r.d
+
+        with solver.assuming([option]):
+            self.assertEqual(
+                convert_to_frozenset(solver.solutions()),
+                frozenset(s for s in expected if frozenset(option.row) in s),
+            )
+
+        solver.random = random.Random(0)
+        self.assertEqual(convert_to_frozenset(solver.solutions()), expected)
+        solver.random = None
+        self.assertEqual(sum(1 for _ in solver.search(hook=hook)), len(expected))
@@ -0,0 +1,122 @@
+"""
+Tests for Instrument.
+"""
+
+import io
+import json
+import unittest
+from ..algorithm_x import AlgorithmX
+from ..instrument import Instrument
+from .problems import CASES, queens
+
+
+class TestInstrument(unittest.TestCase):
+    """
+    Tests for Instrument.
+    """
+
+    def test_counts(self):
+        """
+        Ensure the counts agree between the recursive and iterative searches,
+        and with the search itself.
+        """
+        for solver_class, factory, args in CASES:
+            with self.subTest(solver=solver_class.__name__):
+                solver = solver_class(factory(*args))
+                expected = solver.count_solutions()
+
+                with Instrument(solver) as recursive:
+                    self.assertEqual(sum(1 for _ in solver.solutions()), expected)
+
+                with Instrument(solver) as iterative:
+                    self.assertEqual(solver.count_solutions(), expected)
+
+                self.assertEqual(recursive.profile(), iterative.profile())
+                self.assertEqual(recursive.solutions, expected)
+                self.assertGreater(recursive.updates, 0)
+                self.assertGreater(recursive.mems, recursive.updates)
+                self.assertEqual(
+                    sum(level["nodes"] for level in recursive.levels),
+                    recursive.nodes,
+                )
+
+    def test_replay(self):
+        """
+        Ensure the nodes entered by replay() are not counted again and that
+        assumed options do not count toward the depth, the solutions agreeing
+        with count_solutions(per_level=True).
+        """
+        for solver_class, factory, args in CASES:
+            with self.subTest(solver=solver_class.__name__):
+                solver = solver_class(factory(*args))
+                total, _ = solver.count_solutions(per_level=True)
+                prefixes = list(solver.prefixes(2))
+
+                with Instrument(solver) as full:
+                    solver.count_solutions()
+
+                with Instrument(solver) as replayed:
+                    for prefix in prefixes:
+                        solver.replay(prefix)
+                        solver.unwind()
+
+                self.assertEqual(replayed.nodes, 0)
+                self.assertEqual(replayed.levels, [])
+
+                with Instrument(solver) as replayed:
+                    for prefix in prefixes:
+                        if solver.replay(prefix):
+                            list(solver.search())
+
+                        solver.unwind()
+
+                self.assertEqual(replayed.solutions, total)
+                self.assertEqual(replayed.levels[2:], full.levels[2:])
+                node = solver.root.r.d
+
+                with solver.assuming([node]):
+                    total, _ = solver.count_solutions(per_level=True)
+
+                    with Instrument(solver) as inside:
+                        solver.count_solutions()
+
+                for generate in (solver.solutions, solver.iterative_solutions):
+                    with Instrument(solver) as assumed:
+                        list(generate([node]))
+
+                    self.assertEqual(assumed.solutions, total)
+                    self.assertEqual(assumed.levels[0]["nodes"], 1)
+                    self.assertEqual(assumed.levels, inside.levels)
+
+    def test_queens(self):
+        """
+        Ensure the profile of the 4 queens problem matches its search tree.
+        """
+        solver = AlgorithmX(queens(4))
+
+        with Instrument(solver) as instrument:
+            solver.count_solutions()
+
+        self.assertEqual(instrument.solutions, 2)
+        self.assertEqual(instrument.levels[0]["nodes"], 1)
+        self.assertEqual(instrument.levels[0]["branches"], 4)
+        self.assertEqual(instrument.levels[-1]["solutions"], 2)
+
+    def test_detach(self):
+        """
+        Ensure detaching restores the original methods and the profile can be
+        exported as JSON.
+        """
+        solver = AlgorithmX(queens(4))
+        instrument = Instrument(solver)
+        instrument.attach()
+        self.assertIn("cover", vars(solver))
+
+        instrument.detach()
+        solver.count_solutions()
+        self.assertNotIn("cover", vars(solver))
+        self.assertEqual(instrument.nodes, 0)
+
+        stream = io.StringIO()
+        instrument.dump(stream)
+        self.assertEqual(json.loads(stream.getvalue())["levels"], [])
@@ -0,0 +1,97 @@
+"""
+Tests for Limits.
+"""
+
+import threading
+import unittest
+from ..limits import Limits, fraction
+from .problems import CASES
+
+
+class TestLimits(unittest.TestCase):
+    """
+    Tests for Limits.
+    """
+
+    def test_budget(self):
+        """
+        Ensure the node budget stops the search and the structure is restored.
+        """
+        for solver_class, factory, args in CASES:
+            with self.subTest(solver=solver_class.__name__):
+                solver = solver_class(factory(*args))
+                expected = solver.count_solutions()
+                limits = Limits(max_nodes=5)
+
+                list(solver.limited_solutions(limits))
+
+                self.assertEqual(limits.reason, "nodes")
+                self.assertEqual(limits.nodes, 5)
+                self.assertEqual(solver.level_stack, [])
+                self.assertEqual(solver.count_solutions(), expected)
+
+                limits = Limits(max_nodes=10**6)
+                self.assertEqual(len(list(solver.limited_solutions(limits))), expected)
+                self.assertIsNone(limits.reason)
+
+    def test_cancel_and_timeout(self):
+        """
+        Ensure a set cancellation token or a passed timeout stops the search.
+        """
+        solver_class, factory, args = CASES[0]
+        solver = solver_class(factory(*args))
+        event = threading.Event()
+        event.set()
+        cancelled = Limits(cancel=event)
+        timed_out = Limits(timeout=0)
+
+        self.assertEqual(list(solver.limited_solutions(cancelled)), [])
+        self.assertEqual(list(solver.limited_solutions(timed_out)), [])
+        self.assertEqual(cancelled.reason, "cancelled")
+        self.assertEqual(timed_out.reason, "timeout")
+        self.assertEqual(solver.level_stack, [])
+
+    def test_progress(self):
+        """
+        Ensure the progress reports describe the path to every node and the
+        explored fraction grows from 0 to 1.
+        """
+        for solver_class, factory, args in CASES:
+            with self.subTest(solver=solver_class.__name__):
+                solver = solver_class(factory(*args))
+                reports = []
+                limits = Limits(progress=reports.append, interval=1)
+                list(solver.limited_solutions(limits))
+                fractions = [report["fraction"] for report in reports]
+
+                self.assertEqual(len(reports), limits.nodes)
+                self.assertEqual(reports[0]["depth"], 0)
+                self.assertEqual(fractions, sorted(fractions))
+                self.assertEqual(fractions[0], 0)
+                self.assertLess(fractions[-1], 1)
+
+                for report in reports:
+                    self.assertEqual(report["depth"], len(report["branches"]))
+
+    def test_fraction(self):
+        """
+        Ensure the explored fraction follows Knuth's definition.
+        """
+        self.assertEqual(fraction([]), 0)
+        self.assertEqual(fraction([(1, 2)]), 0.5)
+        self.assertEqual(fraction([(1, 2), (2, 4)]), 0.75)
+
+    def test_close(self):
+        """
+        Ensure closing the generator early restores the structure.
+        """
+        for solver_class, factory, args in CASES:
+            with self.subTest(solver=solver_class.__name__):
+                solver = solver_class(factory(*args))
+                expected = solver.count_solutions()
+                solutions = solver.limited_solutions(Limits())
+                next(solutions)
+                solutions.close()
+
+                self.assertEqual(solver.level_stack, [])
+                self.assertEqual(solver.count_solutions(), expected)
@@ -0,0 +1,109 @@
+"""
+Tests for memoized solution counting.
+"""
+
+import unittest
+from ..algorithm_c import AlgorithmC
+from ..algorithm_m import AlgorithmM
+from ..algorithm_x import AlgorithmX
+from ..bucket import BucketAlgorithmX
+from ..builder import Problem
+from ..memo import LRUCache, MemoCounter, count_solutions
+from .problems import (
+    colored_problem,
+    multiplicities_problem,
+    queens_problem,
+    random_problem,
+)
+
+
+def dominoes(rows, columns):
+    options = []
+
+    for row in range(rows):
+        for column in range(columns):
+            if row + 1 < rows:
+                options.append([f"{row},{column}", f"{row + 1},{column}"])
+
+            if column + 1 < columns:
+                options.append([f"{row},{column}", f"{row},{column + 1}"])
+
+    return Problem(options)
+
+
+class TestMemo(unittest.TestCase):
+    """
+    Tests for memoized solution counting.
+    """
+
+    def test_count(self):
+        """
+        Ensure the memoized counts agree with the plain search and that the
+        structure is restored.
+        """
+        cases = [
+            (AlgorithmX, queens_problem(6)),
+            (AlgorithmX, dominoes(4, 5)),
+            (BucketAlgorithmX, dominoes(3, 6)),
+            (AlgorithmC, colored_problem()),
+            (AlgorithmC, dominoes(2, 7)),
+        ]
+        cases += [(AlgorithmC, random_problem(seed)) for seed in range(100)]
+
+        for index, (solver_class, problem) in enumerate(cases):
+            with self.subTest(index=index, solver=solver_class.__name__):
+                solver = solver_class(problem.build(solver_class))
+                expected = solver.count_solutions()
+                self.assertEqual(count_solutions(solver), expected)
+                self.assertEqual(count_solutions(solver, capacity=3), expected)
+                self.assertEqual(solver.count_solutions(), expected)
+
+    def test_assume(self):
+        """
+        Ensure counting under assumed options, including colored ones, agrees
+        with the plain search.
+        """
+        for seed in range(100):
+            with self.subTest(seed=seed):
+                solver = AlgorithmC(random_problem(seed).build(AlgorithmC))
+                row = solver.root.r.d
+
+                if row == solver.root.r:
+                    continue
+
+                with solver.assuming([row]):
+                    self.assertEqual(count_solutions(solver), solver.count_solutions())
+
+    def test_statistics(self):
+        """
+        Ensure repeated residual problems are answered from the cache, and
+        that a bounded cache evicts entries.
+        """
+        solver = AlgorithmX(dominoes(4, 6).build())
+        counter = MemoCounter(solver)
+        self.assertEqual(counter.count(), 281)
+        self.assertGreater(counter.cache.hits, 0)
+        self.assertGreater(counter.cache.hit_rate(), 0.2)
+        self.assertEqual(counter.cache.evictions, 0)
+
+        counter = MemoCounter(solver, capacity=10)
+        self.assertEqual(counter.count(), 281)
+        self.assertEqual(len(counter.cache), 10)
+        self.assertGreater(counter.cache.evictions, 0)
+
+        with self.assertRaises(ValueError):
+            MemoCounter(AlgorithmM(multiplicities_problem().build(AlgorithmM)))
+
+    def test_cache(self):
+        """
+        Ensure the least recently used entry is evicted.
+        """
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual((cache.hits, cache.misses, cache.evictions), (3, 1, 1))
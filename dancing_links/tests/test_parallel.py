@@ -0,0 +1,160 @@
+"""
+Tests for ParallelSearch.
+"""
+
+import unittest
+from functools import partial
+from .. import algorithm_x
+from ..builder import Problem
+from ..parallel import (
+    ParallelSearch,
+    WorkStealingSearch,
+    check_rows,
+    count_prefix,
+    encode,
+    init_worker,
+    search_stolen,
+    split,
+)
+from .problems import CASES, queens
+
+
+def donate(queue, levels):
+    prefix = split(levels)
+
+    if prefix is not None:
+        queue.append(prefix)
+
+
+def rowless(options):
+    root = Problem(options).build()
+    column = root.r
+
+    while column != root:
+        node = column.d
+
+        while node != column:
+            node.row = None
+            node = node.d
+
+        column = column.r
+
+    return root
+
+
+def broken():
+    raise ValueError("no problem")
+
+
+class TestParallelSearch(unittest.TestCase):
+    """
+    Tests for ParallelSearch.
+    """
+
+    def test_replay(self):
+        """
+        Ensure the subtrees below the prefixes at every depth partition the
+        search tree.
+        """
+        for solver_class, factory, args in CASES:
+            expected = solver_class(factory(*args)).count_solutions()
+
+            for depth in range(4):
+                with self.subTest(solver=solver_class.__name__, depth=depth):
+                    solver = solver_class(factory(*args))
+                    prefixes = list(solver.prefixes(depth))
+                    init_worker(solver_class, factory, args)
+                    counts = [count_prefix(prefix) for prefix in prefixes]
+
+                    self.assertEqual(solver.level_stack, [])
+                    self.assertEqual(sum(counts), expected)
+
+    def test_parallel(self):
+        """
+        Ensure the process pool finds the same solutions, in the same order, as
+        the sequential search.
+        """
+        for solver_class, factory, args in CASES:
+            with self.subTest(solver=solver_class.__name__):
+                expected = [
+                    encode(solution)
+                    for solution in solver_class(factory(*args)).solutions()
+                ]
+                search = ParallelSearch(
+                    solver_class, factory, args, depth=2, max_workers=2
+                )
+
+                self.assertEqual(search.count_solutions(), len(expected))
+                self.assertEqual(list(search.solutions()), expected)
+
+    def test_split(self):
+        """
+        Ensure splitting off the remaining branches at every node partitions
+        the search tree, and that the pieces are in search order when sorted
+        by prefix.
+        """
+        for solver_class, factory, args in CASES:
+            with self.subTest(solver=solver_class.__name__):
+                expected = [
+                    encode(solution)
+                    for solution in solver_class(factory(*args)).solutions()
+                ]
+                solver = solver_class(factory(*args))
+                queue = [[]]
+                pieces = []
+
+                while queue:
+                    prefix = queue.pop()
+                    stolen = search_stolen(
+                        solver, prefix, False, partial(donate, queue)
+                    )
+                    pieces.append((prefix, stolen))
+
+                self.assertGreater(len(pieces), 1)
+                self.assertEqual(
+                    [s for _, piece in sorted(pieces) for s in piece], expected
+                )
+
+    def test_work_stealing(self):
+        """
+        Ensure the work stealing pool finds the same solutions, in the same
+        order, as the sequential search.
+        """
+        for solver_class, factory, args in CASES:
+            with self.subTest(solver=solver_class.__name__):
+                expected = [
+                    encode(solution)
+                    for solution in solver_class(factory(*args)).solutions()
+                ]
+                search = WorkStealingSearch(
+                    solver_class, factory, args, max_workers=3, check_interval=1
+                )
+
+                self.assertEqual(search.count_solutions(), len(expected))
+                self.assertEqual(list(search.solutions()), expected)
+
+    def test_missing_rows(self):
+        """
+        Ensure searching for solutions on nodes without rows is refused, since
+        they could not be reported, while counting them still works.
+        """
+        args = (["ab", "c", "bc", "a"],)
+        self.assertIsNone(check_rows(queens(4)))
+
+        for search_class in (ParallelSearch, WorkStealingSearch):
+            with self.subTest(search=search_class.__name__):
+                search = search_class(algorithm_x.AlgorithmX, rowless, args)
+
+                with self.assertRaises(ValueError):
+                    list(search.solutions())
+
+                self.assertEqual(search.count_solutions(), 2)
+
+    def test_worker_error(self):
+        """
+        Ensure a failing worker stops the work stealing pool with an error.
+        """
+        search = WorkStealingSearch(algorithm_x.AlgorithmX, broken, max_workers=3)
+
+        with self.assertRaises(RuntimeError):
+            search.count_solutions()
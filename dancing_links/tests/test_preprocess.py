@@ -0,0 +1,100 @@
+"""
+Tests for preprocessing.
+"""
+
+import unittest
+from ..algorithm_c import AlgorithmC
+from ..algorithm_m import AlgorithmM
+from ..builder import Problem
+from ..parallel import encode
+from ..preprocess import preprocess
+from .problems import random_problem
+
+
+def solve(solver_class, problem):
+    return sorted(
+        sorted(encode(solution))
+        for solution in solver_class(problem.build(solver_class)).solutions()
+    )
+
+
+class TestPreprocess(unittest.TestCase):
+    """
+    Tests for preprocessing.
+    """
+
+    def test_random(self):
+        """
+        Ensure the reduced problems have the same solutions as the original
+        ones, once mapped back, and usually fewer options.
+        """
+        removed = 0
+
+        for solver_class, bounded in ((AlgorithmC, False), (AlgorithmM, True)):
+            for seed in range(150):
+                with self.subTest(solver=solver_class.__name__, seed=seed):
+                    problem = random_problem(seed, bounded)
+                    reduction = preprocess(problem)
+                    expected = solve(solver_class, problem)
+                    solutions = sorted(
+                        reduction.restore(solution)
+                        for solution in solver_class(
+                            reduction.problem.build(solver_class)
+                        ).solutions()
+                    )
+                    self.assertEqual(solutions, expected)
+                    removed += len(problem.options) - len(reduction.options)
+
+        self.assertGreater(removed, 0)
+
+    def test_reductions(self):
+        """
+        Ensure blocking options are removed, forced options applied and
+        duplicate items removed.
+        """
+        problem = Problem(
+            [
+                ("a", "b", "g"),
+                ("c", "d"),
+                ("a", "c", "g"),
+                ("b", "d", ("x", 2)),
+                ("a", "b", "c"),
+                ("e", "f", ("x", 2)),
+                ("b", "c", ("x", 1)),
+            ],
+            secondary=["x"],
+        )
+        reduction = preprocess(problem)
+        self.assertEqual(reduction.forced, [5])
+        self.assertEqual(reduction.options, [0, 1, 2, 3])
+        self.assertEqual(
+            reduction.problem.options, [["a", "b"], ["c", "d"], ["a", "c"], ["b", "d"]]
+        )
+        self.assertEqual(reduction.problem.primary, ["a", "b", "c", "d"])
+        self.assertEqual(reduction.problem.secondary, [])
+        self.assertEqual(
+            [
+                reduction.restore(s)
+                for s in AlgorithmC(reduction.problem.build(AlgorithmC)).solutions()
+            ],
+            solve(AlgorithmC, problem),
+        )
+
+    def test_infeasible(self):
+        """
+        Ensure a problem found to have no solution reduces to an unsatisfiable
+        one, and that an already solved problem gives the forced options.
+        """
+        reduction = preprocess(Problem([("a", "b"), ("b", "c")]))
+        self.assertEqual(reduction.problem.options, [])
+        self.assertEqual(solve(AlgorithmC, reduction.problem), [])
+
+        reduction = preprocess(Problem([("a",), ("b", "c"), ("a", "b")]))
+        self.assertEqual(reduction.problem.primary, [])
+        self.assertEqual(
+            [
+                reduction.restore(s)
+                for s in AlgorithmC(reduction.problem.build(AlgorithmC)).solutions()
+            ],
+            [[0, 1]],
+        )
@@ -0,0 +1,63 @@
+"""
+Tests for randomized search with restarts.
+"""
+
+import unittest
+from itertools import islice
+from ..parallel import encode
+from ..randomized import first_solution, geometric, luby
+from .problems import CASES, queens
+
+
+class TestRandomized(unittest.TestCase):
+    """
+    Tests for randomized search with restarts.
+    """
+
+    def test_policies(self):
+        """
+        Ensure the restart policies generate the expected budgets, and that a
+        geometric factor which would not grow the budgets is rejected.
+        """
+        self.assertEqual(
+            list(islice(luby(), 15)), [1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8]
+        )
+        self.assertEqual(list(islice(geometric(1.5), 5)), [1, 1, 2, 3, 5])
+
+        for factor in (1, 0.5, -2):
+            with self.assertRaises(ValueError):
+                geometric(factor)
+
+    def test_first_solution(self):
+        """
+        Ensure a valid solution is found, that it depends only on the seed, and
+        that the structure and row order are restored afterwards.
+        """
+        for solver_class, factory, args in CASES:
+            with self.subTest(solver=solver_class.__name__):
+                solver = solver_class(factory(*args))
+                expected = [encode(solution) for solution in solver.solutions()]
+                found = {frozenset(solution) for solution in expected}
+
+                for seed in range(10):
+                    for scale in (1, 100):
+                        solution = first_solution(solver, seed=seed, scale=scale)
+                        again = first_solution(solver, seed=seed, scale=scale)
+
+                        self.assertIn(frozenset(encode(solution)), found)
+                        self.assertEqual(encode(again), encode(solution))
+                        self.assertEqual(solver.level_stack, [])
+                        self.assertIsNone(solver.random)
+
+                self.assertEqual(
+                    [encode(solution) for solution in solver.solutions()], expected
+                )
+
+    def test_no_solution(self):
+        """
+        Ensure None is returned once a run completes without a solution.
+        """
+        solver = CASES[0][0](queens(3))
+
+        self.assertIsNone(first_solution(solver, seed=1, scale=1))
+        self.assertEqual(solver.count_solutions(), 0)
@@ -0,0 +1,129 @@
+"""
+Tests for diagrams of solution families.
+"""
+
+import os
+import random
+import tempfile
+import unittest
+from collections import Counter
+from ..algorithm_c import AlgorithmC
+from ..algorithm_x import AlgorithmX
+from ..parallel import encode
+from ..zdd import ZDD, build_zdd
+from .problems import colored_problem, queens_problem, random_problem
+from .test_memo import dominoes
+
+
+def family(solver):
+    return {frozenset(encode(solution)) for solution in solver.solutions()}
+
+
+class TestZDD(unittest.TestCase):
+    """
+    Tests for diagrams of solution families.
+    """
+
+    def test_build(self):
+        """
+        Ensure the diagram holds exactly the solutions, and that restricting
+        it to the solutions containing an option keeps exactly those.
+        """
+        cases = [
+            (AlgorithmX, queens_problem(6)),
+            (AlgorithmX, dominoes(4, 5)),
+            (AlgorithmC, colored_problem()),
+        ]
+        cases += [(AlgorithmC, random_problem(seed)) for seed in range(60)]
+
+        for index, (solver_class, problem) in enumerate(cases):
+            with self.subTest(index=index, solver=solver_class.__name__):
+                solver = solver_class(problem.build(solver_class))
+                expected = family(solver)
+                zdd = build_zdd(solver, capacity=5 if index % 2 else 2**20)
+                self.assertEqual(zdd.count(), len(expected))
+                self.assertEqual({frozenset(s) for s in zdd}, expected)
+                self.assertEqual(solver.count_solutions(), len(expected))
+
+                for option in range(len(problem.options)):
+                    restricted = zdd.containing(option)
+                    self.assertEqual(
+                        {frozenset(s) for s in restricted},
+                        {s for s in expected if option in s},
+                    )
+
+    def test_queries(self):
+        """
+        Ensure membership queries and sampling agree with the family, and that
+        every solution gets sampled about as often.
+        """
+        solver = AlgorithmX(dominoes(3, 4).build())
+        expected = family(solver)
+        zdd = build_zdd(solver)
+        self.assertEqual(len(expected), 11)
+
+        for solution in expected:
+            self.assertIn(solution, zdd)
+            self.assertNotIn(set(solution) - {min(solution)}, zdd)
+
+        self.assertNotIn(set(), zdd)
+        rng = random.Random(0)
+        samples = Counter(frozenset(zdd.sample(rng)) for _ in range(2200))
+        self.assertEqual(set(samples), expected)
+        self.assertGreater(min(samples.values()), 140)
+        self.assertIsNone(ZDD().sample())
+
+    def test_dominoes(self):
+        """
+        Ensure a family too large to enumerate is stored compactly.
+        """
+        zdd = build_zdd(AlgorithmX(dominoes(8, 8).build()))
+        self.assertEqual(zdd.count(), 12988816)
+        self.assertLess(len(zdd), 10000)
+        self.assertEqual(
+            zdd.containing(0).count() + zdd.containing(1).count(), 12988816
+        )
+
+    def test_assume(self):
+        """
+        Ensure a diagram built under assumed options holds the options added
+        to them.
+        """
+        solver = AlgorithmX(queens_problem(6).build())
+        row = solver.root.r.d.d
+
+        with solver.assuming([row]):
+            expected = family(solver)
+            zdd = build_zdd(solver)
+
+        self.assertGreater(len(expected), 0)
+        self.assertTrue(all(row.row in s for s in expected))
+        self.assertEqual(
+            {frozenset(s) | {row.row} for s in zdd},
+            expected,
+        )
+
+    def test_save(self):
+        """
+        Ensure a saved diagram loads back identically, and that other files
+        are rejected.
+        """
+        zdd = build_zdd(AlgorithmX(dominoes(4, 5).build()))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "family.zdd")
+            zdd.save(path)
+            self.assertEqual(os.path.getsize(path), 4 + 4 * (2 + 3 * len(zdd)))
+            loaded = ZDD.load(path)
+
+            with open(path, "wb") as file:
+                file.write(b"not a diagram")
+
+            with self.assertRaises(ValueError):
+                ZDD.load(path)
+
+        self.assertEqual(
+            (loaded.var, loaded.lo, loaded.hi, loaded.root),
+            (zdd.var, zdd.lo, zdd.hi, zdd.root),
+        )
+        self.assertEqual(loaded.count(), 95)
@@ -0,0 +1,292 @@
+"""
+Zero-suppressed decision diagrams of solution families.
+
+build_zdd() runs the memoized search of memo.py, but instead of counting the
+solutions below each residual problem it builds a diagram of them:  a solved
+problem is the terminal 1 (the family holding the empty solution), a dead end
+the terminal 0 (the empty family), and branching on a column with options
+r1, ..., rk gives the chain of nodes
+
+    node(rk, ... node(r2, node(r1, 0, F1), F2) ..., Fk)
+
+where Fi is the diagram of the problem left after choosing ri.  Nodes are
+hash-consed, so identical subfamilies are stored once however they were
+reached, and a node whose hi branch is 0 is never created (zero suppression).
+
+The variables are option numbers (the row of the nodes, the option index for
+structures built by Problem).  The search is free to branch on any column, so
+the variables do not follow a fixed order along every path as in an ordered
+ZDD, but no path mentions an option twice.  That is all counting, sampling,
+membership and restriction need.
+
+A node is an index into the var, lo and hi lists.  Children are always created
+before their parents, so index order is a topological order, which the queries
+use instead of recursion.
+"""
+
+import random
+import struct
+
+from .memo import MemoCounter
+
+MAGIC = b"ZDD1"
+
+
+class ZDD:
+    """
+    A family of sets of options stored as a zero-suppressed decision diagram.
+    Nodes 0 and 1 are the terminals, root is the node of the family.
+    """
+
+    def __init__(self):
+        self.var = [None, None]
+        self.lo = [0, 1]
+        self.hi = [0, 1]
+        self.unique = {}
+        self.root = 0
+        self.cached_counts = None
+
+    def __len__(self):
+        """
+        Return the number of nodes, terminals excluded.
+        """
+        return len(self.var) - 2
+
+    def node(self, var, lo, hi):
+        """
+        Return the node for the family lo union (hi with var added to every
+        set), creating it if it does not exist yet.
+        """
+        if hi == 0:
+            return lo
+
+        key = (var, lo, hi)
+        node = self.unique.get(key)
+
+        if node is None:
+            node = len(self.var)
+            self.var.append(var)
+            self.lo.append(lo)
+            self.hi.append(hi)
+            self.unique[key] = node
+            self.cached_counts = None
+
+        return node
+
+    def counts(self):
+        """
+        Return the number of sets of the family of every node.
+        """
+        if self.cached_counts is None:
+            counts = [0, 1]
+            lo = self.lo
+            hi = self.hi
+
+            for node in range(2, len(self.var)):
+                counts.append(counts[lo[node]] + counts[hi[node]])
+
+            self.cached_counts = counts
+
+        return self.cached_counts
+
+    def count(self):
+        """
+        Return the number of sets of the family.
+        """
+        return self.counts()[self.root]
+
+    def sample(self, rng=None):
+        """
+        Return a set of the family chosen uniformly at random, as a list of
+        options, or None if the family is empty.
+        """
+        rng = rng or random
+        counts = self.counts()
+        node = self.root
+
+        if counts[node] == 0:
+            return None
+
+        chosen = []
+
+        while node > 1:
+            if rng.randrange(counts[node]) < counts[self.hi[node]]:
+                chosen.append(self.var[node])
+                node = self.hi[node]
+
+            else:
+                node = self.lo[node]
+
+        return chosen
+
+    def __contains__(self, options):
+        """
+        Check if the set of options is in the family.
+        """
+        remaining = set(options)
+        node = self.root
+
+        while node > 1:
+            if self.var[node] in remaining:
+                remaining.remove(self.var[node])
+                node = self.hi[node]
+
+            else:
+                node = self.lo[node]
+
+        return node == 1 and not remaining
+
+    def __iter__(self):
+        """
+        Generate the sets of the family as lists of options.
+        """
+        stack = [(self.root, [])]
+
+        while stack:
+            node, chosen = stack.pop()
+
+            if node == 1:
+                yield chosen
+
+            elif node > 1:
+                stack.append((self.lo[node], chosen))
+                stack.append((self.hi[node], chosen + [self.var[node]]))
+
+    def containing(self, option):
+        """
+        Return the diagram of the sets of the family containing option.  Its
+        nodes are restricted copies of the nodes above the nodes of option,
+        which keep only their branches leading to option, and plain copies of
+        the hi branches of the nodes of option.
+        """
+        restricted, copied = self.reached(option)
+        zdd = ZDD()
+        copies = [0, 1]
+        restrictions = [0, 0]
+
+        for node in range(2, len(self.var)):
+            var, lo, hi = self.var[node], self.lo[node], self.hi[node]
+            copies.append(
+                zdd.node(var, copies[lo], copies[hi]) if node in copied else None
+            )
+
+            if node not in restricted:
+                restrictions.append(None)
+
+            elif var == option:
+                restrictions.append(zdd.node(var, restrictions[lo], copies[hi]))
+
+            else:
+                restrictions.append(zdd.node(var, restrictions[lo], restrictions[hi]))
+
+        zdd.root = restrictions[self.root]
+        return zdd
+
+    def reached(self, option):
+        """
+        Return the nodes reached by containing(option) from the root as
+        restricted copies, and those reached as plain copies.
+        """
+        restricted = {self.root}
+        copied = set()
+        stack = [(self.root, restricted)]
+
+        while stack:
+            node, kind = stack.pop()
+
+            if node < 2:
+                continue
+
+            lo, hi = self.lo[node], self.hi[node]
+            children = [(lo, kind)]
+
+            if kind is copied or self.var[node] != option:
+                children.append((hi, kind))
+
+            else:
+                children.append((hi, copied))
+
+            for child, child_kind in children:
+                if child not in child_kind:
+                    child_kind.add(child)
+                    stack.append((child, child_kind))
+
+        return restricted, copied
+
+    def save(self, path):
+        """
+        Write the diagram to a binary file:  the magic bytes, the number of
+        nodes and the root as little-endian 32-bit words, then the var, lo and
+        hi words of every node but the terminals.
+        """
+        words = [len(self), self.root]
+
+        for node in range(2, len(self.var)):
+            words += (self.var[node], self.lo[node], self.hi[node])
+
+        with open(path, "wb") as file:
+            file.write(MAGIC)
+            file.write(struct.pack(f"<{len(words)}I", *words))
+
+    @staticmethod
+    def load(path):
+        """
+        Read a diagram written by save().
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+
+        if data[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a ZDD file")
+
+        size, root = struct.unpack_from("<2I", data, len(MAGIC))
+        words = struct.unpack_from(f"<{3 * size}I", data, len(MAGIC) + 8)
+        zdd = ZDD()
+
+        for index in range(0, len(words), 3):
+            var, lo, hi = words[index : index + 3]
+
+            if not (lo < len(zdd.var) and hi < len(zdd.var)):
+                raise ValueError(f"{path} is corrupted")
+
+            zdd.node(var, lo, hi)
+
+        if root >= len(zdd.var):
+            raise ValueError(f"{path} is corrupted")
+
+        zdd.root = root
+        return zdd
+
+
+class ZDDBuilder(MemoCounter):
+    """
+    Memoized search building the diagram of the solutions of an AlgorithmX or
+    AlgorithmC solver instead of counting them.
+    """
+
+    def __init__(self, solver, capacity=2**20):
+        super().__init__(solver, capacity)
+        self.zdd = ZDD()
+
+    def build(self):
+        """
+        Return the diagram of the solutions below the current state of the
+        solver, each solution as the set of the options added to it.  The
+        structure is restored before returning.
+        """
+        self.zdd.root = self.count()
+        return self.zdd
+
+    def combine(self, total, row, value):
+        """
+        Add the solutions choosing the option of row to the family total.
+        """
+        return self.zdd.node(row.row, total, value)
+
+
+def build_zdd(solver, capacity=2**20):
+    """
+    Return the diagram of the solutions of solver, built with a ZDDBuilder of
+    the given capacity.
+    """
+    return ZDDBuilder(solver, capacity).build()